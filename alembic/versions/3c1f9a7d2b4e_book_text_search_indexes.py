@@ -0,0 +1,53 @@
+"""book text search indexes
+
+Revision ID: 3c1f9a7d2b4e
+Revises: fbf0c0272c9d
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f9a7d2b4e"
+down_revision: Union[str, None] = "fbf0c0272c9d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, column) searched by the PostgreSQL search fallback
+SEARCH_VECTOR_INDEXES = [
+    ("ix_book_data_title_search", "book_data", "title"),
+    ("ix_book_data_summary_search", "book_data", "summary"),
+    ("ix_author_name_search", "author", "name"),
+    ("ix_book_category_title_search", "book_category", "title"),
+]
+TRIGRAM_INDEXES = [
+    ("ix_book_data_title_trgm", "book_data", "title"),
+    ("ix_book_data_summary_trgm", "book_data", "summary"),
+    ("ix_author_name_trgm", "author", "name"),
+    ("ix_book_category_title_trgm", "book_category", "title"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY keeps the tables writable while the indexes build
+    with op.get_context().autocommit_block():
+        for index, table, column in SEARCH_VECTOR_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} ON {table} "
+                f"USING gin (to_tsvector('simple'::regconfig, coalesce({column}, '')))",
+            )
+        for index, table, column in TRIGRAM_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} ON {table} "
+                f"USING gin ({column} gin_trgm_ops)",
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index, _, _ in SEARCH_VECTOR_INDEXES + TRIGRAM_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
@@ -0,0 +1,40 @@
+"""filter trigram indexes
+
+Revision ID: 5b7e1d3f9a2c
+Revises: 8e2d4b6a9c1f
+Create Date: 2026-10-18 14:26:09.481736
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7e1d3f9a2c"
+down_revision: Union[str, None] = "8e2d4b6a9c1f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, column) matched by the author, category and branch filters;
+# author.name and book_category.title are indexed since 3c1f9a7d2b4e
+TRIGRAM_INDEXES = [
+    ("ix_book_category_description_trgm", "book_category", "description"),
+    ("ix_branch_name_trgm", "branch", "name"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for index, table, column in TRIGRAM_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} ON {table} "
+                f"USING gin ({column} gin_trgm_ops)",
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index, _, _ in TRIGRAM_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
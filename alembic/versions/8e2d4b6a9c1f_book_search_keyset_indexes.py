@@ -0,0 +1,54 @@
+"""book search keyset indexes
+
+Revision ID: 8e2d4b6a9c1f
+Revises: 3c1f9a7d2b4e
+Create Date: 2026-10-18 11:02:17.574912
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e2d4b6a9c1f"
+down_revision: Union[str, None] = "3c1f9a7d2b4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_book_created_at_id",
+            "book",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # The primary key leads with id, so EXISTS probes by book need their own index
+        op.create_index(
+            op.f("ix_book_book_category_link_book_id"),
+            "book_book_category_link",
+            ["book_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_book_book_category_link_book_id"),
+            table_name="book_book_category_link",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_book_created_at_id",
+            table_name="book",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
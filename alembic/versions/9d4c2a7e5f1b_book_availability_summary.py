@@ -0,0 +1,46 @@
+"""book availability summary
+
+Revision ID: 9d4c2a7e5f1b
+Revises: 5b7e1d3f9a2c
+Create Date: 2026-10-18 17:02:41.318904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4c2a7e5f1b"
+down_revision: Union[str, None] = "5b7e1d3f9a2c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "book_availability",
+        sa.Column("book_id", sa.Uuid(), nullable=False),
+        sa.Column("branch_id", sa.Uuid(), nullable=False),
+        sa.Column("available_count", sa.Integer(), nullable=False),
+        sa.Column("total_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["book_id"], ["book.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["branch_id"], ["branch.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("book_id", "branch_id"),
+    )
+    # From here on the exemplar upserts keep the counts up to date
+    op.execute(
+        """
+        INSERT INTO book_availability
+            (book_id, branch_id, available_count, total_count)
+        SELECT book_id, branch_id, count(*) FILTER (WHERE available), count(*)
+        FROM physical_exemplar
+        WHERE book_id IS NOT NULL
+        GROUP BY book_id, branch_id
+        """,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("book_availability")
@@ -0,0 +1,35 @@
+"""physical exemplar book branch unique
+
+Revision ID: c7a2e9f4b1d8
+Revises: 9d4c2a7e5f1b
+Create Date: 2026-10-18 21:12:37.604215
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7a2e9f4b1d8"
+down_revision: Union[str, None] = "9d4c2a7e5f1b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Arbiter index of the physical exemplar upsert; on the partitioned table
+    # it is created on every branch partition, and on the ones attached later
+    op.create_index(
+        "ux_physical_exemplar_book_id_branch_id",
+        "physical_exemplar",
+        ["book_id", "branch_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ux_physical_exemplar_book_id_branch_id",
+        table_name="physical_exemplar",
+    )
@@ -4,7 +4,7 @@ from uuid import UUID
 
 from pydantic import Field
 
-from src.application.dto.base import BaseDto, ProcessingResponse
+from src.application.dto.base import BaseDto, KeysetPage, ProcessingResponse
 
 
 class AuthorUpsert(BaseDto):
@@ -12,7 +12,7 @@ class AuthorUpsert(BaseDto):
     user: str = Field(description="Author user")
 
 
-class AuthorFilter(BaseDto):
+class AuthorFilter(KeysetPage):
     name: Optional[str] = Field(description="Author name", default=None)
 
 
@@ -1,6 +1,11 @@
+from typing import Optional
+from uuid import UUID
+
 from pydantic import Field
 from pydantic.main import BaseModel
 
+from src.domain.entities.base import MAX_PAGE_SIZE
+
 
 class BaseDto(BaseModel):
     class Config:
@@ -11,5 +16,13 @@ class BaseDto(BaseModel):
         from_attributes = True
 
 
+class KeysetPage(BaseDto):
+    limit: int = Field(description="Page size", default=50, ge=1, le=MAX_PAGE_SIZE)
+    cursor: Optional[UUID] = Field(
+        description="X-Next-Cursor of the previous page",
+        default=None,
+    )
+
+
 class ProcessingResponse(BaseDto):
     message: str = Field(description="Message", default="Task is processing")
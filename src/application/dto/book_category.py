@@ -3,7 +3,7 @@ from uuid import UUID
 
 from pydantic import Field
 
-from src.application.dto.base import BaseDto, ProcessingResponse
+from src.application.dto.base import BaseDto, KeysetPage, ProcessingResponse
 
 
 class BookCategoryUpsert(BaseDto):
@@ -37,7 +37,7 @@ class ProcessingBookCategory(ProcessingResponse):
     book_category: BookCategoryResponse = Field(description="Book category")
 
 
-class BookCategoryFilter(BaseDto):
+class BookCategoryFilter(KeysetPage):
     title: str | None = Field(description="Book category title", default=None)
     description: str | None = Field(
         description="Book category description",
@@ -21,3 +21,10 @@ class BookDataResponse(BaseDto):
     updated_at: datetime = Field(description="Book data update date")
     created_by: str = Field(description="Book data creator")
     updated_by: str = Field(description="Book data updater")
+
+
+class BookDataProjectionResponse(BaseDto):
+    id: UUID = Field(description="Book data id")
+    summary: str | None = Field(description="Book summary", default=None)
+    title: str | None = Field(description="Book title", default=None)
+    language: str | None = Field(description="Book language", default=None)
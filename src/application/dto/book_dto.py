@@ -1,14 +1,29 @@
 from datetime import date, datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import Annotated, List, Optional, Union
 from uuid import UUID
 
+from pydantic import field_validator, model_validator
 from pydantic.fields import Field
 
 from src.application.dto.author import AuthorResponse
 from src.application.dto.base import BaseDto, ProcessingResponse
 from src.application.dto.book_category import BookCategoryResponse
-from src.application.dto.book_data import BookDataResponse, BookDataUpsert
+from src.application.dto.book_data import (
+    BookDataProjectionResponse,
+    BookDataResponse,
+    BookDataUpsert,
+)
+from src.domain.enums.book_field import BookField
 from src.domain.enums.book_type import BookType
+from src.domain.enums.suggestion_kind import SuggestionKind
+from src.domain.enums.total_relation import TotalRelation
+from src.infrastructure.settings.config import ElasticsearchIndexConfig
+
+
+@lru_cache(maxsize=None)
+def _max_result_window() -> int:
+    return ElasticsearchIndexConfig().max_result_window
 
 
 class Book(BaseDto):
@@ -34,7 +49,28 @@ class Book(BaseDto):
     user: str = Field(description="Book user")
 
 
-class BookFilter(BaseDto):
+class BookProjection(BaseDto):
+    fields: Optional[List[BookField]] = Field(
+        description="Comma separated fields to return, e.g. id,book_data.title,authors",
+        default=None,
+    )
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_fields(cls, value: object) -> object:
+        if isinstance(value, str):
+            value = [value]
+        if isinstance(value, list):
+            return [
+                field.strip()
+                for item in value
+                for field in str(item).split(",")
+                if field.strip()
+            ] or None
+        return value
+
+
+class BookFilter(BookProjection):
     isbn_code: Optional[str] = Field(description="Book ISBN code", default=None)
     editor: Optional[str] = Field(description="Book editor", default=None)
     edition: Optional[int] = Field(description="Book edition", default=None)
@@ -59,6 +95,49 @@ class BookFilter(BaseDto):
         default=None,
     )
 
+    # Pagination
+    page: int = Field(description="Page number", default=1, ge=1)
+    size: int = Field(description="Page size", default=10, ge=1, le=100)
+    cursor: Optional[str] = Field(
+        description="Cursor from X-Next-Cursor; '*' starts a deep pagination walk",
+        default=None,
+    )
+
+    @model_validator(mode="after")
+    def check_result_window(self) -> "BookFilter":
+        """Pages past the index result window can only be reached with a cursor"""
+        window = _max_result_window()
+        if self.cursor is None and self.page * self.size > window:
+            raise ValueError(
+                f"page * size must not exceed {window}, "
+                "use cursor=* to walk past it",
+            )
+        return self
+
+
+class BookSearchQuery(BookFilter):
+    facets: bool = Field(description="Return facet counts", default=False)
+
+
+class BookSuggestFilter(BaseDto):
+    prefix: str = Field(
+        description="Text typed so far",
+        min_length=1,
+        max_length=100,
+    )
+    size: int = Field(
+        description="Suggestions per kind",
+        default=5,
+        ge=1,
+        le=20,
+    )
+
+
+class BookSuggestionResponse(BaseDto):
+    id: UUID = Field(description="Book, author or category ID")
+    text: str = Field(description="Display text")
+    kind: SuggestionKind = Field(description="Suggestion kind")
+
 
 class BookResponse(BaseDto):
     id: UUID = Field(description="Book ID")
@@ -86,5 +165,83 @@ class BookResponse(BaseDto):
     updated_by: str = Field(description="Book updated by")
 
 
+class BookProjectionResponse(BaseDto):
+    """Book holding only the fields selected with fields="""
+
+    id: UUID = Field(description="Book ID")
+    version: Optional[int] = Field(description="Book version", default=None)
+    isbn_code: Optional[str] = Field(description="Book ISBN code", default=None)
+    editor: Optional[str] = Field(description="Book editor", default=None)
+    edition: Optional[int] = Field(description="Book edition", default=None)
+    type: Optional[BookType] = Field(description="Book type", default=None)
+    publish_date: Optional[date] = Field(
+        description="Book publish date",
+        default=None,
+    )
+    authors: List[AuthorResponse] | None = Field(
+        default=None,
+        description="Book authors",
+    )
+    book_categories: List[BookCategoryResponse] | None = Field(
+        default=None,
+        description="Book categories",
+    )
+    book_data: List[BookDataProjectionResponse] | None = Field(
+        default=None,
+        description="Book data",
+    )
+    created_at: Optional[datetime] = Field(
+        description="Book created at",
+        default=None,
+    )
+    updated_at: Optional[datetime] = Field(
+        description="Book updated at",
+        default=None,
+    )
+    created_by: Optional[str] = Field(description="Book created by", default=None)
+    updated_by: Optional[str] = Field(description="Book updated by", default=None)
+
+
+# A full book validates first, so projections never drop fields from it
+AnyBookResponse = Annotated[
+    Union[BookResponse, BookProjectionResponse],
+    Field(union_mode="left_to_right"),
+]
+
+
+class FacetBucketResponse(BaseDto):
+    key: str = Field(description="Facet value")
+    label: Optional[str] = Field(description="Display text", default=None)
+    count: int = Field(description="Number of books")
+
+
+class BookFacetsResponse(BaseDto):
+    type: List[FacetBucketResponse] = Field(description="By type")
+    language: List[FacetBucketResponse] = Field(description="By language")
+    category: List[FacetBucketResponse] = Field(description="By category")
+    author: List[FacetBucketResponse] = Field(description="By author")
+    publish_date: List[FacetBucketResponse] = Field(
+        description="Publish date histogram",
+    )
+
+
+class BookSearchResponse(BaseDto):
+    books: List[AnyBookResponse] = Field(description="Books")
+    next_cursor: Optional[str] = Field(description="Next page cursor", default=None)
+    facets: Optional[BookFacetsResponse] = Field(
+        description="Facet counts",
+        default=None,
+    )
+    total: Optional[int] = Field(description="Matching books", default=None)
+    total_relation: Optional[TotalRelation] = Field(
+        description="eq when total is exact, gte when it is a lower bound",
+        default=None,
+    )
+
+
+class BookCountResponse(BaseDto):
+    count: int = Field(description="Matching books")
+
+
 class ProcessingBook(ProcessingResponse):
     book: BookResponse = Field(description="Book")
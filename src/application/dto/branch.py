@@ -3,7 +3,7 @@ from uuid import UUID
 
 from pydantic import Field
 
-from src.application.dto.base import BaseDto, ProcessingResponse
+from src.application.dto.base import BaseDto, KeysetPage, ProcessingResponse
 
 
 class BranchResponse(BaseDto):
@@ -24,7 +24,7 @@ class ProcessingBranch(ProcessingResponse):
     branch: BranchResponse = Field(description="Branch")
 
 
-class BranchFilter(BaseDto):
+class BranchFilter(KeysetPage):
     name: str | None = Field(description="Branch name", default=None)
 
 
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import Field
@@ -39,5 +40,53 @@ class PhysicalExemplarResponse(BaseDto):
     updated_by: str = Field(description="Physical exemplar updater")
 
 
+class PhysicalExemplarBranchFilter(BaseDto):
+    available: Optional[bool] = Field(description="Availability", default=None)
+    floor: Optional[int] = Field(description="Floor", default=None, ge=1)
+    room: Optional[int] = Field(description="Room", default=None, ge=1)
+    bookshelf: Optional[int] = Field(description="Bookshelf", default=None, ge=1)
+    limit: Optional[int] = Field(
+        description="Page size, the whole branch when missing",
+        default=None,
+        ge=1,
+    )
+    cursor: Optional[UUID] = Field(
+        description="Id of the last exemplar received",
+        default=None,
+    )
+
+
+class PhysicalExemplarLine(BaseDto):
+    """One NDJSON line of a branch listing, without the book and branch"""
+
+    id: UUID = Field(description="Physical exemplar id")
+    version: int = Field(description="Version of the data for optimistic locking")
+    available: bool = Field(description="Physical exemplar availability")
+    room: int = Field(description="Physical exemplar room")
+    floor: int = Field(description="Physical exemplar floor")
+    bookshelf: int = Field(description="Physical exemplar bookshelf")
+    book_id: UUID = Field(description="Book id")
+    branch_id: UUID = Field(description="Branch id")
+    created_at: datetime = Field(description="Physical exemplar creation date")
+    updated_at: datetime = Field(description="Physical exemplar update date")
+    created_by: str = Field(description="Physical exemplar creator")
+    updated_by: str = Field(description="Physical exemplar updater")
+
+
 class ProcessingPhysicalExemplar(ProcessingResponse):
     physical_exemplar: PhysicalExemplarResponse = Field(description="Physical exemplar")
+
+
+class BranchAvailabilityResponse(BaseDto):
+    branch_id: UUID = Field(description="Branch id")
+    available: int = Field(description="Available physical exemplars")
+    total: int = Field(description="Physical exemplars")
+
+
+class BookAvailabilityResponse(BaseDto):
+    book_id: UUID = Field(description="Book id")
+    available: int = Field(description="Available physical exemplars in every branch")
+    total: int = Field(description="Physical exemplars in every branch")
+    branches: List[BranchAvailabilityResponse] = Field(
+        description="Branches holding physical exemplars of the book",
+    )
@@ -14,6 +14,10 @@ class AuthorReadRepositoryPort(ABC):
     def get_author_by_id(self, id: UUID) -> Author:
         pass
 
+    @abstractmethod
+    async def get_author_by_id_async(self, id: UUID) -> Author:
+        pass
+
     @abstractmethod
     def get_author_by_filter(
         self,
@@ -21,6 +25,13 @@ class AuthorReadRepositoryPort(ABC):
     ) -> List[Author]:
         pass
 
+    @abstractmethod
+    async def get_author_by_filter_async(
+        self,
+        filter: Optional[AuthorFilter] = None,
+    ) -> List[Author]:
+        pass
+
     @abstractmethod
     def get_authors_by_ids(self, ids: List[UUID]) -> List[Author]:
         pass
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from src.domain.entities.book import Book, BookSearchFilter
+from src.domain.entities.book import (
+    Book,
+    BookSearchFilter,
+    BookSearchResult,
+    BookSuggestion,
+)
 from src.infrastructure.adapters.database.db.session import DatabaseSettings
 
 
@@ -11,14 +16,30 @@ class BookReadRepositoryPort(ABC):
         self.db = db
 
     @abstractmethod
-    def get_book_by_id(self, id: UUID) -> Book:
+    def get_book_by_id(self, id: UUID, fields: Optional[List[str]] = None) -> Book:
         pass
 
     @abstractmethod
-    def get_book_by_filter(
+    async def get_book_by_id_async(
+        self,
+        id: UUID,
+        fields: Optional[List[str]] = None,
+    ) -> Book:
+        pass
+
+    @abstractmethod
+    async def get_book_by_filter(
         self,
         filter: BookSearchFilter,
-    ) -> List[Book]:
+    ) -> BookSearchResult:
+        pass
+
+    @abstractmethod
+    async def count_books(self, filter: BookSearchFilter) -> int:
+        pass
+
+    @abstractmethod
+    async def suggest_books(self, prefix: str, size: int) -> List[BookSuggestion]:
         pass
 
 
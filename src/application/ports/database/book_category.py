@@ -21,6 +21,13 @@ class BookCategoryReadRepositoryPort(ABC):
     ) -> List[BookCategory]:
         pass
 
+    @abstractmethod
+    async def get_book_category_by_filter_async(
+        self,
+        filter: BookCategoryFilter,
+    ) -> List[BookCategory]:
+        pass
+
     @abstractmethod
     def get_book_categories_by_ids(self, ids: List[UUID]) -> List[BookCategory]:
         pass
@@ -10,6 +10,10 @@ class BranchReadRepositoryPort(ABC):
     def get_branch_by_filter(self, filter: BranchFilter) -> List[Branch]:
         pass
 
+    @abstractmethod
+    async def get_branch_by_filter_async(self, filter: BranchFilter) -> List[Branch]:
+        pass
+
     @abstractmethod
     def get_branch_by_id(self, id: UUID) -> Branch:
         pass
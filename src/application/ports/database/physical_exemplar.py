@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, List
 from uuid import UUID
 
-from src.domain.entities.physical_exemplar import PhysicalExemplar
+from src.domain.entities.book_availability import BookAvailability
+from src.domain.entities.physical_exemplar import (
+    PhysicalExemplar,
+    PhysicalExemplarBranchFilter,
+)
 
 
 class PhysicalExemplarReadRepositoryPort(ABC):
@@ -13,6 +18,28 @@ class PhysicalExemplarReadRepositoryPort(ABC):
     ) -> PhysicalExemplar:
         pass
 
+    @abstractmethod
+    async def get_physical_exemplar_by_book_and_branch_async(
+        self,
+        book_id: UUID,
+        branch_id: UUID,
+    ) -> PhysicalExemplar:
+        pass
+
+    @abstractmethod
+    async def get_books_availability_async(
+        self,
+        book_ids: List[UUID],
+    ) -> List[BookAvailability]:
+        pass
+
+    @abstractmethod
+    def stream_physical_exemplars_by_branch_async(
+        self,
+        filter: PhysicalExemplarBranchFilter,
+    ) -> AsyncIterator[PhysicalExemplar]:
+        pass
+
 
 class PhysicalExemplarWriteRepositoryPort(ABC):
     @abstractmethod
@@ -8,6 +8,6 @@ class FilterAuthor:
     def __init__(self, author_repository: AuthorReadRepositoryPort):
         self.author_repository = author_repository
 
-    def execute(self, filter: Optional[AuthorFilter] = None) -> List[Author]:
-        authors = self.author_repository.get_author_by_filter(filter)
+    async def execute(self, filter: Optional[AuthorFilter] = None) -> List[Author]:
+        authors = await self.author_repository.get_author_by_filter_async(filter)
         return [Author.model_validate(author) for author in authors]
@@ -8,6 +8,6 @@ class GetAuthorById:
     def __init__(self, author_repository: AuthorReadRepositoryPort):
         self.author_repository = author_repository
 
-    def execute(self, id: UUID) -> Author:
-        author = self.author_repository.get_author_by_id(id)
+    async def execute(self, id: UUID) -> Author:
+        author = await self.author_repository.get_author_by_id_async(id)
         return Author.model_validate(author)
@@ -0,0 +1,13 @@
+from src.application.dto.book_dto import BookFilter
+from src.application.ports.database.book import BookReadRepositoryPort
+from src.domain.entities.book import BookSearchFilter
+
+
+class CountBook:
+    def __init__(self, book_repository: BookReadRepositoryPort):
+        self.book_repository = book_repository
+
+    async def execute(self, filter: BookFilter) -> int:
+        return await self.book_repository.count_books(
+            BookSearchFilter.model_validate(filter),
+        )
@@ -1,18 +1,16 @@
-from typing import List
-
 from src.application.dto.book_dto import BookFilter
 from src.application.ports.database.book import BookReadRepositoryPort
-from src.domain.entities.book import Book, BookSearchFilter
+from src.domain.entities.book import BookSearchFilter, BookSearchResult
 
 
 class FilterBook:
     def __init__(self, book_repository: BookReadRepositoryPort):
         self.book_repository = book_repository
 
-    def execute(self, filter: BookFilter | None = None) -> List[Book]:
+    async def execute(self, filter: BookFilter | None = None) -> BookSearchResult:
         # Convert DTO to entity
         search_filter = self._convert_dto_to_entity(filter)
-        return self.book_repository.get_book_by_filter(search_filter)
+        return await self.book_repository.get_book_by_filter(search_filter)
 
     def _convert_dto_to_entity(
         self,
@@ -1,3 +1,4 @@
+from typing import List, Optional
 from uuid import UUID
 
 from src.application.ports.database.book import BookReadRepositoryPort
@@ -8,6 +9,6 @@ class GetBookById:
     def __init__(self, book_repository: BookReadRepositoryPort):
         self.book_repository = book_repository
 
-    def execute(self, id: UUID) -> Book:
-        book = self.book_repository.get_book_by_id(id)
+    async def execute(self, id: UUID, fields: Optional[List[str]] = None) -> Book:
+        book = await self.book_repository.get_book_by_id_async(id, fields)
         return Book.model_validate(book)
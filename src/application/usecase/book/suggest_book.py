@@ -0,0 +1,13 @@
+from typing import List
+
+from src.application.dto.book_dto import BookSuggestFilter
+from src.application.ports.database.book import BookReadRepositoryPort
+from src.domain.entities.book import BookSuggestion
+
+
+class SuggestBook:
+    def __init__(self, book_repository: BookReadRepositoryPort):
+        self.book_repository = book_repository
+
+    async def execute(self, filter: BookSuggestFilter) -> List[BookSuggestion]:
+        return await self.book_repository.suggest_books(filter.prefix, filter.size)
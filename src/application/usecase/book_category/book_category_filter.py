@@ -8,5 +8,5 @@ class FilterBookCategory:
     def __init__(self, repository: BookCategoryReadRepositoryPort):
         self.repository = repository
 
-    def execute(self, filter: BookCategoryFilter) -> List[BookCategory]:
-        return self.repository.get_book_category_by_filter(filter)
+    async def execute(self, filter: BookCategoryFilter) -> List[BookCategory]:
+        return await self.repository.get_book_category_by_filter_async(filter)
@@ -8,5 +8,5 @@ class FilterBranch:
     def __init__(self, repository: BranchReadRepositoryPort):
         self.repository = repository
 
-    def execute(self, filter: BranchFilter) -> List[Branch]:
-        return self.repository.get_branch_by_filter(filter)
+    async def execute(self, filter: BranchFilter) -> List[Branch]:
+        return await self.repository.get_branch_by_filter_async(filter)
@@ -0,0 +1,17 @@
+from uuid import UUID
+
+from src.application.ports.database.physical_exemplar import (
+    PhysicalExemplarReadRepositoryPort,
+)
+from src.domain.entities.book_availability import BookAvailability
+
+
+class GetBookAvailability:
+    def __init__(self, repository: PhysicalExemplarReadRepositoryPort):
+        self.repository = repository
+
+    async def execute(self, book_id: UUID) -> BookAvailability:
+        (availability,) = await self.repository.get_books_availability_async(
+            book_ids=[book_id],
+        )
+        return availability
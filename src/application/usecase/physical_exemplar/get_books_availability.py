@@ -0,0 +1,27 @@
+from typing import List
+from uuid import UUID
+
+from src.application.exceptions import InvalidDataException
+from src.application.ports.database.physical_exemplar import (
+    PhysicalExemplarReadRepositoryPort,
+)
+from src.domain.entities.book_availability import (
+    MAX_AVAILABILITY_BOOKS,
+    BookAvailability,
+)
+
+
+class GetBooksAvailability:
+    def __init__(self, repository: PhysicalExemplarReadRepositoryPort):
+        self.repository = repository
+
+    async def execute(self, book_ids: List[UUID]) -> List[BookAvailability]:
+        # Repeated ids are answered once, in the order they first appear
+        book_ids = list(dict.fromkeys(book_ids))
+        if len(book_ids) > MAX_AVAILABILITY_BOOKS:
+            raise InvalidDataException(
+                f"At most {MAX_AVAILABILITY_BOOKS} books per availability request",
+            )
+        if not book_ids:
+            return []
+        return await self.repository.get_books_availability_async(book_ids=book_ids)
@@ -10,8 +10,8 @@ class GetPhysicalExemplarByBookAndBranch:
     def __init__(self, repository: PhysicalExemplarReadRepositoryPort):
         self.repository = repository
 
-    def execute(self, book_id: UUID, branch_id: UUID) -> PhysicalExemplar:
-        return self.repository.get_physical_exemplar_by_book_and_branch(
+    async def execute(self, book_id: UUID, branch_id: UUID) -> PhysicalExemplar:
+        return await self.repository.get_physical_exemplar_by_book_and_branch_async(
             book_id=book_id,
             branch_id=branch_id,
         )
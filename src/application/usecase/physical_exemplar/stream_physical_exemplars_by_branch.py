@@ -0,0 +1,22 @@
+from typing import AsyncIterator
+
+from src.application.ports.database.physical_exemplar import (
+    PhysicalExemplarReadRepositoryPort,
+)
+from src.domain.entities.physical_exemplar import (
+    PhysicalExemplar,
+    PhysicalExemplarBranchFilter,
+)
+
+
+class StreamPhysicalExemplarsByBranch:
+    def __init__(self, repository: PhysicalExemplarReadRepositoryPort):
+        self.repository = repository
+
+    async def execute(
+        self,
+        filter: PhysicalExemplarBranchFilter,
+    ) -> AsyncIterator[PhysicalExemplar]:
+        return self.repository.stream_physical_exemplars_by_branch_async(
+            filter=filter,
+        )
@@ -1,8 +1,15 @@
 import time
 
-from src.infrastructure.adapters.entrypoints.consumer import Consumer
+from src.infrastructure.adapters.database.elasticsearch.index_manager import (
+    BookIndexManager,
+)
+from src.infrastructure.adapters.entrypoints.consumer import (
+    Consumer,
+    elasticsearch_client,
+)
 from src.infrastructure.logs.logstash import LogStash
 from src.infrastructure.settings.config import (
+    ElasticsearchIndexConfig,
     LogstashConfig,
     ProducerConfig,
     SystemConfig,
@@ -34,4 +41,11 @@ if __name__ == "__main__":
             if cont == 10:
                 raise Exception("Consumer not started")
 
+    # Consumer writes must never create the books index through dynamic mapping
+    for problem in BookIndexManager(
+        elasticsearch_client,
+        ElasticsearchIndexConfig(),
+    ).ensure_index():
+        handler.logger.warning(f"Books index mismatch: {problem}")  # type: ignore
+
     Consumer.start_consuming()
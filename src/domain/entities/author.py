@@ -5,7 +5,7 @@ from uuid import UUID
 from sqlmodel import Field
 from uuid6 import uuid7
 
-from src.domain.entities.base import BaseEntity
+from src.domain.entities.base import BaseEntity, KeysetFilter
 
 
 class Author(BaseEntity):
@@ -26,5 +26,5 @@ class Author(BaseEntity):
     updated_by: str = Field(description="Book updater ID")
 
 
-class AuthorFilter(BaseEntity):
-    name: Optional[str] = Field(description="Author name")
+class AuthorFilter(KeysetFilter):
+    name: Optional[str] = Field(description="Author name", default=None)
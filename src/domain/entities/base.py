@@ -1,6 +1,12 @@
+from typing import Optional
+from uuid import UUID
+
 from pydantic import Field
 from pydantic.main import BaseModel
 
+# Hard cap of a filter page, so no call can load a whole table
+MAX_PAGE_SIZE = 500
+
 
 class BaseEntity(BaseModel):
     class Config:
@@ -13,3 +19,13 @@ class BaseEntity(BaseModel):
 
 class DeletionEntity(BaseEntity):
     id: str = Field(description="Entity id")
+
+
+class KeysetFilter(BaseEntity):
+    """Page of rows ordered by their UUIDv7 id, resumed after the last one seen"""
+
+    limit: int = Field(description="Page size", default=50, ge=1, le=MAX_PAGE_SIZE)
+    cursor: Optional[UUID] = Field(
+        description="Id of the last row of the previous page",
+        default=None,
+    )
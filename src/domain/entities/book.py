@@ -9,7 +9,10 @@ from src.domain.entities.author import Author
 from src.domain.entities.base import BaseEntity
 from src.domain.entities.book_category import BookCategory
 from src.domain.entities.book_data import BookData
+from src.domain.enums.book_field import BookField
 from src.domain.enums.book_type import BookType
+from src.domain.enums.suggestion_kind import SuggestionKind
+from src.domain.enums.total_relation import TotalRelation
 
 
 class Book(BaseEntity):
@@ -80,6 +83,10 @@ class BookSearchFilter(BaseEntity):
     # Pagination
     page: int = Field(description="Page number", default=1)
     size: int = Field(description="Page size", default=10)
+    cursor: Optional[str] = Field(
+        description="Opaque search_after cursor; '*' starts a new point-in-time walk",
+        default=None,
+    )
 
     # Sorting
     sort_by: Optional[str] = Field(description="Sort field", default="created_at")
@@ -90,9 +97,71 @@ class BookSearchFilter(BaseEntity):
 
     # Advanced options
     fuzzy_search: bool = Field(description="Enable fuzzy matching", default=False)
+    facets: bool = Field(
+        description="Return facet counts for the matching books",
+        default=False,
+    )
     highlight_fields: Optional[List[str]] = Field(
         description="Fields to highlight",
         default=None,
     )
+    fields: Optional[List[BookField]] = Field(
+        description="Fields to return, every field when empty",
+        default=None,
+    )
 
     _basic_filters = {"edition", "type"}
+
+
+class FacetBucket(BaseEntity):
+    """Number of matching books sharing a facet value"""
+
+    key: str = Field(description="Facet value")
+    label: Optional[str] = Field(description="Display text of the value", default=None)
+    count: int = Field(description="Number of books")
+
+
+class BookFacets(BaseEntity):
+    """Facet counts computed over the books matching a search"""
+
+    type: List[FacetBucket] = Field(default_factory=list, description="By type")
+    language: List[FacetBucket] = Field(
+        default_factory=list,
+        description="By book data language",
+    )
+    category: List[FacetBucket] = Field(default_factory=list, description="By category")
+    author: List[FacetBucket] = Field(default_factory=list, description="By author")
+    publish_date: List[FacetBucket] = Field(
+        default_factory=list,
+        description="Publish date histogram",
+    )
+
+
+class BookSearchResult(BaseEntity):
+    """Page of books returned by a search"""
+
+    books: List[Book] = Field(default_factory=list, description="Books")
+    next_cursor: Optional[str] = Field(
+        description="Cursor for the next page, None when the walk is exhausted",
+        default=None,
+    )
+    facets: Optional[BookFacets] = Field(
+        description="Facet counts, when requested and supported by the backend",
+        default=None,
+    )
+    total: Optional[int] = Field(
+        description="Number of matching books, None when it was not counted",
+        default=None,
+    )
+    total_relation: Optional[TotalRelation] = Field(
+        description="Whether total is exact (eq) or a lower bound (gte)",
+        default=None,
+    )
+
+
+class BookSuggestion(BaseEntity):
+    """Typeahead entry for a book title, author or category"""
+
+    id: UUID = Field(description="Book, author or category ID")
+    text: str = Field(description="Display text")
+    kind: SuggestionKind = Field(description="What the suggestion refers to")
@@ -0,0 +1,25 @@
+from typing import List
+from uuid import UUID
+
+from pydantic import Field
+
+from src.domain.entities.base import BaseEntity
+
+# Books a single availability call may ask for
+MAX_AVAILABILITY_BOOKS = 100
+
+
+class BranchAvailability(BaseEntity):
+    branch_id: UUID = Field(description="Branch id")
+    available: int = Field(description="Available physical exemplars", ge=0)
+    total: int = Field(description="Physical exemplars", ge=0)
+
+
+class BookAvailability(BaseEntity):
+    book_id: UUID = Field(description="Book id")
+    available: int = Field(description="Available physical exemplars", default=0)
+    total: int = Field(description="Physical exemplars", default=0)
+    branches: List[BranchAvailability] = Field(
+        description="Branches holding physical exemplars of the book",
+        default=[],
+    )
@@ -4,7 +4,7 @@ from uuid import UUID
 from pydantic import Field
 from uuid6 import uuid7
 
-from src.domain.entities.base import BaseEntity
+from src.domain.entities.base import BaseEntity, KeysetFilter
 
 
 class BookCategory(BaseEntity):
@@ -27,7 +27,7 @@ class BookCategory(BaseEntity):
     )
 
 
-class BookCategoryFilter(BaseEntity):
+class BookCategoryFilter(KeysetFilter):
     title: str | None = Field(description="Book category title", default=None)
     description: str | None = Field(
         description="Book category description",
@@ -4,7 +4,7 @@ from uuid import UUID
 from pydantic import Field
 from uuid6 import uuid7
 
-from src.domain.entities.base import BaseEntity
+from src.domain.entities.base import BaseEntity, KeysetFilter
 
 
 class Branch(BaseEntity):
@@ -23,5 +23,5 @@ class Branch(BaseEntity):
     )
 
 
-class BranchFilter(BaseEntity):
+class BranchFilter(KeysetFilter):
     name: str | None = Field(description="Branch name", default=None)
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import Optional
 from uuid import UUID
 
 from pydantic import Field
@@ -30,3 +31,22 @@ class PhysicalExemplar(BaseEntity):
         description="Physical exemplar update date",
         default_factory=lambda: datetime.now(timezone.utc),
     )
+
+
+class PhysicalExemplarBranchFilter(BaseEntity):
+    """Exemplars of one branch ordered by id, resumed after the last one seen.
+
+    Unlike KeysetFilter the listing is streamed, so the page is unbounded
+    unless a limit is given.
+    """
+
+    branch_id: UUID = Field(description="Branch id")
+    available: Optional[bool] = Field(description="Availability", default=None)
+    floor: Optional[int] = Field(description="Floor", default=None, ge=1)
+    room: Optional[int] = Field(description="Room", default=None, ge=1)
+    bookshelf: Optional[int] = Field(description="Bookshelf", default=None, ge=1)
+    limit: Optional[int] = Field(description="Page size", default=None, ge=1)
+    cursor: Optional[UUID] = Field(
+        description="Id of the last exemplar of the previous page",
+        default=None,
+    )
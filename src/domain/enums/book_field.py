@@ -0,0 +1,23 @@
+from enum import StrEnum
+
+
+class BookField(StrEnum):
+    """Book field that can be selected in a projection."""
+
+    ID = "id"
+    VERSION = "version"
+    ISBN_CODE = "isbn_code"
+    EDITOR = "editor"
+    EDITION = "edition"
+    TYPE = "type"
+    PUBLISH_DATE = "publish_date"
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    CREATED_BY = "created_by"
+    UPDATED_BY = "updated_by"
+    AUTHORS = "authors"
+    BOOK_CATEGORIES = "book_categories"
+    BOOK_DATA = "book_data"
+    BOOK_DATA_TITLE = "book_data.title"
+    BOOK_DATA_LANGUAGE = "book_data.language"
+    BOOK_DATA_SUMMARY = "book_data.summary"
@@ -0,0 +1,9 @@
+from enum import StrEnum
+
+
+class SuggestionKind(StrEnum):
+    """Source of a typeahead suggestion."""
+
+    TITLE = "title"
+    AUTHOR = "author"
+    CATEGORY = "category"
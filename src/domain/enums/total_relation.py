@@ -0,0 +1,8 @@
+from enum import StrEnum
+
+
+class TotalRelation(StrEnum):
+    """Total relation enum."""
+
+    EQ = "eq"
+    GTE = "gte"
@@ -0,0 +1,59 @@
+import argparse
+import sys
+
+from src.infrastructure.adapters.database.elasticsearch.client import (
+    ElasticsearchClient,
+)
+from src.infrastructure.adapters.database.elasticsearch.index_manager import (
+    BookIndexManager,
+)
+from src.infrastructure.logs.logstash import LogStash
+from src.infrastructure.settings.config import (
+    ElasticsearchConfig,
+    ElasticsearchIndexConfig,
+    LogstashConfig,
+    SystemConfig,
+)
+
+
+def index() -> None:
+    """Create or validate the books index and its template."""
+    parser = argparse.ArgumentParser(description="Manage the books index")
+    parser.add_argument(
+        "command",
+        choices=["ensure", "validate", "template"],
+        nargs="?",
+        default="ensure",
+        help="ensure: install the template and create the index when missing",
+    )
+    args = parser.parse_args()
+
+    logstash_config = LogstashConfig()
+    config = SystemConfig()
+    handler = LogStash(
+        logstash_config.host,
+        logstash_config.port,
+        logstash_config.loggername,
+        config.environment,
+    )
+    handler.logstash_init()
+
+    manager = BookIndexManager(
+        ElasticsearchClient(ElasticsearchConfig()),
+        ElasticsearchIndexConfig(),
+    )
+    if args.command == "template":
+        manager.put_template()
+        return
+
+    problems = (
+        manager.ensure_index() if args.command == "ensure" else manager.validate()
+    )
+    for problem in problems:
+        handler.logger.error(f"Books index mismatch: {problem}")  # type: ignore
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    index()
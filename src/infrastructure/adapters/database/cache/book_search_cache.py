@@ -0,0 +1,147 @@
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.domain.entities.book import Book, BookSearchFilter, BookSearchResult
+from src.infrastructure.settings.config import BookSearchCacheConfig
+
+
+def book_search_attributes(book: Book) -> Dict[str, Any]:
+    """Exact match fields of a book, enough to tell which searches it can enter"""
+    return {
+        "type": book.type,
+        "edition": book.edition,
+        "publish_date": book.publish_date.isoformat(),
+        "languages": sorted({book_data.language for book_data in book.book_data or []}),
+    }
+
+
+def may_match(values: Dict[str, Any], attributes: Dict[str, Any]) -> bool:
+    """Whether the book may be a result of the cached filter values.
+
+    Only the exact match filters can rule a book out, text and name queries
+    are assumed to match.
+    """
+    for name in ("type", "edition"):
+        # Both backends ignore the falsy ones
+        if values.get(name) and values[name] != attributes[name]:
+            return False
+    # ISO dates compare like the dates themselves
+    if values.get("publish_date_from", "") > attributes["publish_date"]:
+        return False
+    if (
+        values.get("publish_date_to", attributes["publish_date"])
+        < attributes["publish_date"]
+    ):
+        return False
+    if "languages" in values and not set(values["languages"]) & set(
+        attributes["languages"],
+    ):
+        return False
+    return True
+
+
+@dataclass
+class CacheStats:
+    """Counters of the book search cache"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class BookSearchCache:
+    """In process LRU cache of search results with a time to live"""
+
+    def __init__(self, config: BookSearchCacheConfig) -> None:
+        self.config = config
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, Tuple[float, BookSearchResult]] = OrderedDict()
+        self._lock = Lock()
+
+    def key(self, filter: BookSearchFilter) -> Optional[str]:
+        """Canonical key of a filter, None when its result must not be cached"""
+        if filter.cursor:
+            # Cursor pages belong to a point in time that expires on its own
+            return None
+        values: Dict[str, Any] = {}
+        for name, value in filter.model_dump(mode="json", exclude_none=True).items():
+            if isinstance(value, str):
+                value = value.strip()
+            elif isinstance(value, list):
+                value = sorted(set(value))
+            if value in ("", []):
+                continue
+            values[name] = value
+        return json.dumps(values, sort_keys=True, separators=(",", ":"))
+
+    def get(self, key: str) -> Optional[BookSearchResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, key: str, result: BookSearchResult) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.config.ttl_seconds, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, book_id: str) -> None:
+        """Drop every cached result that contains the book"""
+        with self._lock:
+            self._drop(
+                [
+                    key
+                    for key, (_, result) in self._entries.items()
+                    if self._contains(result, book_id)
+                ],
+            )
+
+    def invalidate_upsert(self, book_id: str, attributes: Dict[str, Any]) -> None:
+        """Drop the cached results the upserted book is in or may now enter"""
+        with self._lock:
+            self._drop(
+                [
+                    key
+                    for key, (_, result) in self._entries.items()
+                    if self._contains(result, book_id)
+                    or may_match(json.loads(key), attributes)
+                ],
+            )
+
+    def clear(self) -> None:
+        """Drop every cached result"""
+        with self._lock:
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def _contains(self, result: BookSearchResult, book_id: str) -> bool:
+        return any(str(book.id) == book_id for book in result.books)
+
+    def _drop(self, keys: List[str]) -> None:
+        for key in keys:
+            del self._entries[key]
+        self.stats.invalidations += len(keys)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.stats.hits,
+                "misses": self.stats.misses,
+                "evictions": self.stats.evictions,
+                "invalidations": self.stats.invalidations,
+            }
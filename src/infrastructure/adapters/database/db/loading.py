@@ -0,0 +1,51 @@
+from typing import List
+
+from sqlalchemy.orm import joinedload, noload, raiseload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
+
+from src.infrastructure.adapters.database.models.author import Author as AuthorModel
+from src.infrastructure.adapters.database.models.book import Book as BookModel
+from src.infrastructure.adapters.database.models.physical_exemplar import (
+    PhysicalExemplar as PhysicalExemplarModel,
+)
+
+
+def book_options() -> List[ExecutableOption]:
+    """Relationships read by Book.model_validate.
+
+    Collections are loaded with one SELECT ... IN per relationship for the whole
+    page, a join would repeat every book row once per author, category and data.
+    """
+    return [
+        selectinload(BookModel.authors),  # type: ignore
+        selectinload(BookModel.book_categories),  # type: ignore
+        selectinload(BookModel.book_data),  # type: ignore
+    ]
+
+
+def physical_exemplar_options() -> List[ExecutableOption]:
+    """Relationships read by PhysicalExemplar.model_validate.
+
+    Branch and book are many-to-one and come in the same row through a join,
+    the collections of the book are selected in afterwards.
+    """
+    book = joinedload(PhysicalExemplarModel.book)  # type: ignore
+    return [
+        joinedload(PhysicalExemplarModel.branch),  # type: ignore
+        book.selectinload(BookModel.authors),  # type: ignore
+        book.selectinload(BookModel.book_categories),  # type: ignore
+        book.selectinload(BookModel.book_data),  # type: ignore
+    ]
+
+
+def physical_exemplar_listing_options() -> List[ExecutableOption]:
+    """Listed exemplars carry only the ids of their book and branch"""
+    return [
+        noload(PhysicalExemplarModel.book),  # type: ignore
+        noload(PhysicalExemplarModel.branch),  # type: ignore
+    ]
+
+
+def author_options() -> List[ExecutableOption]:
+    """Author entities do not carry their books, touching them is a bug"""
+    return [raiseload(AuthorModel.books)]  # type: ignore
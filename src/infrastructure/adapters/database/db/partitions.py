@@ -0,0 +1,144 @@
+import re
+from threading import Lock
+from typing import Any, List, Optional, Set
+from uuid import UUID
+
+from sqlmodel import Session, text
+
+from src.infrastructure.adapters.database.models.physical_exemplar import (
+    PhysicalExemplar as PhysicalExemplarModel,
+)
+
+PARENT_TABLE = "physical_exemplar"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+# Serialises partition changes of concurrent consumers
+PARTITION_LOCK_KEY = "physical_exemplar_partitions"
+
+PARTITIONS_QUERY = text(
+    """
+    SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+    FROM pg_inherits
+    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = :parent
+    """,
+).bindparams(parent=PARENT_TABLE)
+_BOUND_BRANCH_ID = re.compile(r"'([0-9a-fA-F-]{36})'")
+
+
+def partition_name(branch_id: UUID) -> str:
+    return f"{PARENT_TABLE}_branch_{branch_id}".replace("-", "_")
+
+
+def for_branch(statement: Any, branch_id: UUID) -> Any:
+    """Scope a physical exemplar statement to the partition of one branch.
+
+    Without the branch_id predicate PostgreSQL cannot prune, and the query
+    scans (and locks) every partition of physical_exemplar.
+    """
+    return statement.where(PhysicalExemplarModel.branch_id == branch_id)
+
+
+class PhysicalExemplarPartitionManager:
+    """Registry of the physical_exemplar branch partitions.
+
+    The registry is loaded from pg_inherits once, so upserting a known branch
+    runs no DDL. New partitions are created detached and attached afterwards,
+    which only takes a SHARE UPDATE EXCLUSIVE lock on the parent table instead
+    of the ACCESS EXCLUSIVE lock of CREATE TABLE ... PARTITION OF.
+    """
+
+    def __init__(self) -> None:
+        self._branch_ids: Set[UUID] = set()
+        # Name of the DEFAULT partition, when there is one
+        self.default_partition: Optional[str] = None
+        self._loaded = False
+        self._lock = Lock()
+
+    def load(self, session: Session) -> None:
+        branch_ids = set()
+        default_partition = None
+        for name, bound in session.exec(PARTITIONS_QUERY).all():  # type: ignore
+            if bound == "DEFAULT":
+                default_partition = name
+            branch_ids.update(UUID(value) for value in _BOUND_BRANCH_ID.findall(bound))
+        with self._lock:
+            self._branch_ids = branch_ids
+            self.default_partition = default_partition
+            self._loaded = True
+
+    def has_partition(self, branch_id: UUID) -> bool:
+        with self._lock:
+            return branch_id in self._branch_ids
+
+    def register(self, branch_id: UUID) -> None:
+        """Record a partition once the transaction that created it committed"""
+        with self._lock:
+            self._branch_ids.add(branch_id)
+
+    def partitions(self) -> List[UUID]:
+        with self._lock:
+            return sorted(self._branch_ids)
+
+    def ensure_partition(self, session: Session, branch_id: UUID) -> bool:
+        """Create the partition of a new branch, returns whether it did"""
+        if not self._loaded:
+            self.load(session)
+        if self.has_partition(branch_id):
+            return False
+
+        session.exec(  # type: ignore
+            text("SELECT pg_advisory_xact_lock(hashtext(:key))").bindparams(
+                key=PARTITION_LOCK_KEY,
+            ),
+        )
+        # Another consumer may have created it since the registry was loaded
+        self.load(session)
+        if self.has_partition(branch_id):
+            return False
+
+        name = partition_name(branch_id)
+        session.exec(  # type: ignore
+            text(
+                f"CREATE TABLE {name} "
+                f"(LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+            ),
+        )
+        if self.default_partition is not None:
+            # Rows of the branch that landed in the default partition move
+            # over, otherwise attaching would fail on them
+            session.exec(  # type: ignore
+                text(
+                    f"""
+                    WITH moved AS (
+                        DELETE FROM {self.default_partition}
+                        WHERE branch_id = :branch_id
+                        RETURNING *
+                    )
+                    INSERT INTO {name} SELECT * FROM moved
+                    """,
+                ).bindparams(branch_id=str(branch_id)),
+            )
+        session.exec(  # type: ignore
+            text(
+                f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+                f"FOR VALUES IN ('{branch_id}')",
+            ),
+        )
+        return True
+
+    def ensure_default_partition(self, session: Session) -> bool:
+        """Create the partition of rows whose branch has none yet"""
+        if not self._loaded:
+            self.load(session)
+        if self.default_partition is not None:
+            return False
+        session.exec(  # type: ignore
+            text(
+                f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} "
+                f"PARTITION OF {PARENT_TABLE} DEFAULT",
+            ),
+        )
+        with self._lock:
+            self.default_partition = DEFAULT_PARTITION
+        return True
@@ -0,0 +1,85 @@
+import time
+from threading import Lock
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolMetrics:
+    """Checkout counters of one connection pool"""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._lock = Lock()
+
+    def observe(self, wait: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += wait
+            self.wait_seconds_max = max(self.wait_seconds_max, wait)
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            counters = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_avg": (
+                    self.wait_seconds_total / attempts if attempts else 0.0
+                ),
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+        # Gauges are read from the pool itself, so they are never out of date
+        return {
+            **counters,
+            "size": pool.size(),  # type: ignore
+            "checked_out": pool.checkedout(),  # type: ignore
+            "checked_in": pool.checkedin(),  # type: ignore
+            # overflow() goes negative while the pool has not filled up yet
+            "overflow": max(pool.overflow(), 0),  # type: ignore
+        }
+
+
+_pool_metrics: Dict[str, PoolMetrics] = {}
+_pool_metrics_lock = Lock()
+
+
+def get_pool_metrics(name: str) -> PoolMetrics:
+    with _pool_metrics_lock:
+        if name not in _pool_metrics:
+            _pool_metrics[name] = PoolMetrics()
+        return _pool_metrics[name]
+
+
+class _TimedCheckout:
+    """Time every checkout of the pool, keyed by its logging name.
+
+    The name is the only setting a pool keeps when it is recreated after
+    dispose() or a disconnect, so the counters survive the new pool.
+    """
+
+    def connect(self):  # type: ignore
+        metrics = get_pool_metrics(self._orig_logging_name)  # type: ignore
+        started = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore
+        except PoolTimeoutError:
+            metrics.observe(time.perf_counter() - started, timed_out=True)
+            raise
+        metrics.observe(time.perf_counter() - started, timed_out=False)
+        return connection
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
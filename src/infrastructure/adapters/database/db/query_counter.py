@@ -0,0 +1,41 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generator, Optional
+
+from sqlalchemy import Engine, event
+
+
+class QueryCounter:
+    """Number of statements sent to the database while it is active"""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+
+# The counter is shared by reference, so statements run in worker threads
+# (asyncio.to_thread copies the context) still add to the request's count
+_current_counter: ContextVar[Optional[QueryCounter]] = ContextVar(
+    "query_counter",
+    default=None,
+)
+
+
+@contextmanager
+def count_queries() -> Generator[QueryCounter, None, None]:
+    counter = QueryCounter()
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+# pylint: disable=unused-argument
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.count += 1
+
+
+# pylint: enable=unused-argument
@@ -0,0 +1,185 @@
+from threading import Event, Lock, Thread
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.adapters.database.db.replication import (
+    REPLICA_STATUS_QUERY,
+    ReplicaStatus,
+    fetch_row,
+    fetch_row_async,
+)
+from src.infrastructure.settings.config import ReplicaRoutingConfig
+
+
+def parse_replica_addresses(
+    replicas: List[str],
+    host: str,
+    port: int,
+) -> List[Tuple[str, int, int]]:
+    """Read host:port[:weight] entries, falling back to the single host and port"""
+    if not replicas:
+        return [(host, port, 1)]
+    addresses = []
+    for replica in replicas:
+        replica_host, replica_port, *weight = replica.split(":")
+        replica_weight = int(weight[0]) if weight else 1
+        if replica_weight < 1:
+            raise ValueError(f"Replica {replica} must have a weight of at least 1")
+        addresses.append((replica_host, int(replica_port), replica_weight))
+    return addresses
+
+
+class Replica:
+    """A read replica, its engines and the reads it is serving"""
+
+    def __init__(
+        self,
+        name: str,
+        host: str,
+        port: int,
+        weight: int,
+        status: ReplicaStatus,
+        probe_timeout_seconds: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self.host = host
+        self.port = port
+        self.weight = weight
+        self.status = status
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self.engine: Optional[Engine] = None
+        self.async_engine: Optional[AsyncEngine] = None
+        self.outstanding = 0
+        self.reads = 0
+        # Smooth weighted round-robin credit
+        self.current_weight = 0
+
+    def probe(self) -> None:
+        try:
+            replay_lsn, lag_seconds = fetch_row(
+                self.engine,  # type: ignore
+                REPLICA_STATUS_QUERY,
+                self.probe_timeout_seconds,
+            )
+        except Exception:  # pylint: disable=broad-except
+            self.status.observe_failure()
+            return
+        self.status.observe(replay_lsn, lag_seconds)
+
+    async def probe_async(self) -> None:
+        try:
+            replay_lsn, lag_seconds = await fetch_row_async(
+                self.async_engine,  # type: ignore
+                REPLICA_STATUS_QUERY,
+                self.probe_timeout_seconds,
+            )
+        except Exception:  # pylint: disable=broad-except
+            self.status.observe_failure()
+            return
+        self.status.observe(replay_lsn, lag_seconds)
+
+
+class ReplicaSet:
+    """Spreads reads over the replicas that can serve them.
+
+    Replicas that are unreachable, lagging or behind the caller's token are
+    skipped; when none is left the read goes to the master.
+    """
+
+    def __init__(self, replicas: List[Replica], routing: ReplicaRoutingConfig) -> None:
+        self.replicas = replicas
+        self.routing = routing
+        self.master_fallbacks = 0
+        self._next = 0
+        self._lock = Lock()
+        self._stopping = Event()
+        self._thread: Optional[Thread] = None
+
+    def stale(self) -> List[Replica]:
+        """Replicas whose position must be probed before routing a read"""
+        if not self.routing.enabled:
+            return []
+        return [replica for replica in self.replicas if replica.status.needs_probe()]
+
+    def acquire(self, token: Optional[str]) -> Optional[Replica]:
+        candidates = [
+            replica
+            for replica in self.replicas
+            if not self.routing.enabled or replica.status.can_serve(token)
+        ]
+        with self._lock:
+            if not candidates:
+                self.master_fallbacks += 1
+                return None
+            if self.routing.balancing == "weighted_round_robin":
+                replica = self._weighted_round_robin(candidates)
+            else:
+                replica = self._least_outstanding(candidates)
+            replica.outstanding += 1
+            replica.reads += 1
+            return replica
+
+    def release(self, replica: Replica) -> None:
+        with self._lock:
+            replica.outstanding -= 1
+
+    def _least_outstanding(self, candidates: List[Replica]) -> Replica:
+        # Ties rotate, so an idle set does not send every read to the first one
+        self._next = (self._next + 1) % len(candidates)
+        rotated = candidates[self._next :] + candidates[: self._next]
+        return min(rotated, key=lambda replica: replica.outstanding / replica.weight)
+
+    def _weighted_round_robin(self, candidates: List[Replica]) -> Replica:
+        total = 0
+        for replica in candidates:
+            replica.current_weight += replica.weight
+            total += replica.weight
+        chosen = max(candidates, key=lambda replica: replica.current_weight)
+        chosen.current_weight -= total
+        return chosen
+
+    def start(self) -> None:
+        """Probe every replica in the background, so reads never wait on one"""
+        if not self.routing.enabled:
+            return
+        self._stopping.clear()
+        self._thread = Thread(
+            target=self._run,
+            name="database-replica-probes",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.routing.probe_interval_seconds * 2)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            for replica in self.replicas:
+                replica.probe()
+            self._stopping.wait(self.routing.probe_interval_seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            replicas = {
+                replica.name: {
+                    "host": replica.host,
+                    "port": replica.port,
+                    "weight": replica.weight,
+                    "outstanding": replica.outstanding,
+                    "reads": replica.reads,
+                }
+                for replica in self.replicas
+            }
+            master_fallbacks = self.master_fallbacks
+        for replica in self.replicas:
+            replicas[replica.name].update(replica.status.snapshot())
+        return {
+            "balancing": self.routing.balancing,
+            "master_fallbacks": master_fallbacks,
+            "replicas": replicas,
+        }
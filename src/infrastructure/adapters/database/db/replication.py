@@ -0,0 +1,203 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Dict, Generator, Optional, Tuple
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import Session
+
+# Replay position and lag of a replica, NULL positions when it is a primary
+REPLICA_STATUS_QUERY = """
+    SELECT
+        pg_last_wal_replay_lsn()::text,
+        CASE
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE COALESCE(
+                EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()),
+                0
+            )
+        END
+"""
+CURRENT_LSN_QUERY = "SELECT pg_current_wal_lsn()::text"
+
+# Set on a session that inserted, updated or deleted rows
+WROTE_KEY = "wrote"
+
+
+def lsn_to_int(lsn: str) -> int:
+    """Turn a pg_lsn such as 16/B374D848 into a comparable integer"""
+    high, low = lsn.split("/")
+    return (int(high, 16) << 32) | int(low, 16)
+
+
+def fetch_row(
+    engine: Engine,
+    query: str,
+    timeout_seconds: Optional[float] = None,
+) -> Tuple[Any, ...]:
+    # Routing bookkeeping runs on the DBAPI connection, so it is neither
+    # routed itself nor counted as a statement of the request
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        if timeout_seconds is not None:
+            # Local to the transaction the pool rolls back on return
+            cursor.execute(
+                "SET LOCAL statement_timeout = %s",
+                (int(timeout_seconds * 1000),),
+            )
+        cursor.execute(query)
+        row = cursor.fetchone()
+        cursor.close()
+        return tuple(row)  # type: ignore
+    finally:
+        connection.close()
+
+
+async def fetch_row_async(
+    engine: AsyncEngine,
+    query: str,
+    timeout_seconds: Optional[float] = None,
+) -> Tuple[Any, ...]:
+    async with engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        row = await raw_connection.driver_connection.fetchrow(  # type: ignore
+            query,
+            timeout=timeout_seconds,
+        )
+        return tuple(row)
+
+
+# Lowest WAL position a read must observe, the latest commit the caller saw
+_read_your_writes_lsn: ContextVar[Optional[str]] = ContextVar(
+    "read_your_writes_lsn",
+    default=None,
+)
+# Set by read_your_writes, a caller outside it, such as the consumer, never
+# reads its own writes back, so committing does not fetch the WAL position
+_read_your_writes_active: ContextVar[bool] = ContextVar(
+    "read_your_writes_active",
+    default=False,
+)
+
+
+def consistency_token() -> Optional[str]:
+    return _read_your_writes_lsn.get()
+
+
+def tracks_consistency_token() -> bool:
+    return _read_your_writes_active.get()
+
+
+def advance_consistency_token(lsn: Optional[str]) -> None:
+    """Raise the caller's token to lsn, it never moves backwards"""
+    current = _read_your_writes_lsn.get()
+    if lsn and (current is None or lsn_to_int(lsn) > lsn_to_int(current)):
+        _read_your_writes_lsn.set(lsn)
+
+
+@contextmanager
+def read_your_writes(lsn: Optional[str]) -> Generator[None, None, None]:
+    """Reads in the block observe every commit up to lsn"""
+    token = _read_your_writes_lsn.set(_read_your_writes_lsn.get())
+    active = _read_your_writes_active.set(True)
+    try:
+        advance_consistency_token(lsn)
+        yield
+    finally:
+        _read_your_writes_active.reset(active)
+        _read_your_writes_lsn.reset(token)
+
+
+class ReplicaStatus:
+    """Last probed replay position and lag of a replica"""
+
+    def __init__(self, max_lag_seconds: float, status_ttl_seconds: float) -> None:
+        self.max_lag_seconds = max_lag_seconds
+        self.status_ttl_seconds = status_ttl_seconds
+        self.replay_lsn: Optional[str] = None
+        self.lag_seconds = 0.0
+        self.is_primary = False
+        self.reachable = True
+        self.probed_at: Optional[float] = None
+        self.probes = 0
+        self.failures = 0
+        self.lagging_fallbacks = 0
+        self.token_fallbacks = 0
+        self._lock = Lock()
+
+    def needs_probe(self) -> bool:
+        """Whether the cached position is too old to route a read.
+
+        Until then a replica behind the caller's token is not asked again,
+        the read simply goes to the master, so lag does not double the reads.
+        """
+        with self._lock:
+            return (
+                self.probed_at is None
+                or time.monotonic() - self.probed_at > self.status_ttl_seconds
+            )
+
+    def observe(self, replay_lsn: Optional[str], lag_seconds: float) -> None:
+        with self._lock:
+            self.probes += 1
+            self.probed_at = time.monotonic()
+            self.reachable = True
+            self.is_primary = replay_lsn is None
+            self.replay_lsn = replay_lsn
+            self.lag_seconds = float(lag_seconds or 0)
+
+    def observe_failure(self) -> None:
+        """An unreachable replica is ejected until a probe reaches it again"""
+        with self._lock:
+            self.probes += 1
+            self.failures += 1
+            self.probed_at = time.monotonic()
+            self.reachable = False
+
+    def can_serve(self, token: Optional[str]) -> bool:
+        """Whether the replica may serve the read, counting why it may not"""
+        with self._lock:
+            if not self.reachable or self.lag_seconds > self.max_lag_seconds:
+                self.lagging_fallbacks += 1
+                return False
+            # A primary behind the slave address has every commit already
+            if (
+                not self.is_primary
+                and token is not None
+                and lsn_to_int(self.replay_lsn) < lsn_to_int(token)  # type: ignore
+            ):
+                self.token_fallbacks += 1
+                return False
+            return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "replay_lsn": self.replay_lsn,
+                "lag_seconds": self.lag_seconds,
+                "is_primary": self.is_primary,
+                "reachable": self.reachable,
+                "probes": self.probes,
+                "failures": self.failures,
+                "lagging_fallbacks": self.lagging_fallbacks,
+                "token_fallbacks": self.token_fallbacks,
+            }
+
+
+# pylint: disable=unused-argument
+@event.listens_for(Session, "after_flush")
+def _flush_wrote(session, flush_context) -> None:  # type: ignore
+    session.info[WROTE_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _statement_wrote(orm_execute_state) -> None:  # type: ignore
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[WROTE_KEY] = True
@@ -1,10 +1,39 @@
-from contextlib import contextmanager
-from typing import Generator
+import math
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Dict, Generator, List, Optional
 
 from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, create_engine, text
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.infrastructure.adapters.database.db.pool_metrics import (
+    TimedAsyncAdaptedQueuePool,
+    TimedQueuePool,
+    get_pool_metrics,
+)
+from src.infrastructure.adapters.database.db.replicas import (
+    Replica,
+    ReplicaSet,
+    parse_replica_addresses,
+)
+from src.infrastructure.adapters.database.db.replication import (
+    CURRENT_LSN_QUERY,
+    WROTE_KEY,
+    ReplicaStatus,
+    advance_consistency_token,
+    consistency_token,
+    fetch_row,
+    fetch_row_async,
+    tracks_consistency_token,
+)
 from src.infrastructure.adapters.database.models.base_model import Base
+from src.infrastructure.settings.config import (
+    DatabaseConfig,
+    DatabasePoolConfig,
+    ReplicaRoutingConfig,
+    SlaveDatabaseConfig,
+)
 
 
 class DatabaseSettings:
@@ -18,11 +47,28 @@ class DatabaseSettings:
     database: str = ""
     slave_host: str = ""
     slave_port: int = 0
+    pool: DatabasePoolConfig | None = None
+    slave_pool: DatabasePoolConfig | None = None
+    routing: ReplicaRoutingConfig | None = None
+    replicas: List[Replica] = []
+    replica_set: ReplicaSet | None = None
 
     engine: Engine | None = None
-    engine_slave: Engine | None = None
+    async_engine: AsyncEngine | None = None
 
-    def __new__(cls, host: str, password: str, port: int, user: str, slave_host: str, slave_port: int):  # type: ignore
+    def __new__(  # type: ignore
+        cls,
+        host: str,
+        password: str,
+        port: int,
+        user: str,
+        slave_host: str,
+        slave_port: int,
+        pool: Optional[DatabasePoolConfig] = None,
+        slave_pool: Optional[DatabasePoolConfig] = None,
+        routing: Optional[ReplicaRoutingConfig] = None,
+        replicas: Optional[List[str]] = None,
+    ):
         if cls._instance is None:
             cls.host = host
             cls.password = password
@@ -30,6 +76,27 @@ class DatabaseSettings:
             cls.user = user
             cls.slave_host = slave_host
             cls.slave_port = slave_port
+            cls.pool = pool or DatabaseConfig()
+            cls.slave_pool = slave_pool or SlaveDatabaseConfig()
+            cls.routing = routing or ReplicaRoutingConfig()
+            # The first replica keeps the name of the former single slave
+            cls.replicas = [
+                Replica(
+                    name=f"slave_{index}" if index else "slave",
+                    host=replica_host,
+                    port=replica_port,
+                    weight=weight,
+                    status=ReplicaStatus(
+                        max_lag_seconds=cls.routing.max_lag_seconds,
+                        status_ttl_seconds=cls.routing.status_ttl_seconds,
+                    ),
+                    probe_timeout_seconds=cls.routing.probe_timeout_seconds,
+                )
+                for index, (replica_host, replica_port, weight) in enumerate(
+                    parse_replica_addresses(replicas or [], slave_host, slave_port),
+                )
+            ]
+            cls.replica_set = ReplicaSet(cls.replicas, cls.routing)
             cls._create_engine()
             cls._pg_trgm_install()
             cls._instance = cls
@@ -40,16 +107,112 @@ class DatabaseSettings:
         return f"postgresql+psycopg2://{cls.user}:{cls.password}@{cls.host}:{cls.port}"
 
     @classmethod
-    def get_db_url_slave(cls) -> str:
-        return f"postgresql+psycopg2://{cls.user}:{cls.password}@{cls.slave_host}:{cls.slave_port}"
+    def get_db_url_slave(cls, replica: Replica) -> str:
+        return f"postgresql+psycopg2://{cls.user}:{cls.password}@{replica.host}:{replica.port}"
+
+    @classmethod
+    def get_async_db_url(cls) -> str:
+        return f"postgresql+asyncpg://{cls.user}:{cls.password}@{cls.host}:{cls.port}"
+
+    @classmethod
+    def get_async_db_url_slave(cls, replica: Replica) -> str:
+        return f"postgresql+asyncpg://{cls.user}:{cls.password}@{replica.host}:{replica.port}"
+
+    @classmethod
+    def _engine_options(
+        cls,
+        pool: DatabasePoolConfig,
+        name: str,
+        is_async: bool = False,
+        connect_timeout_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        connect_args: Dict[str, Any] = {}
+        options: Dict[str, Any] = {
+            "poolclass": TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+            # Checkout metrics are keyed by the logging name of the pool
+            "pool_logging_name": name,
+            "pool_size": pool.pool_size,
+            "max_overflow": pool.max_overflow,
+            "pool_timeout": pool.pool_timeout,
+            "pool_recycle": pool.pool_recycle,
+            "pool_pre_ping": pool.pool_pre_ping,
+        }
+        if pool.statement_timeout_ms:
+            timeout = str(pool.statement_timeout_ms)
+            if is_async:
+                connect_args["server_settings"] = {"statement_timeout": timeout}
+            else:
+                connect_args["options"] = f"-c statement_timeout={timeout}"
+        if connect_timeout_seconds is not None:
+            if is_async:
+                connect_args["timeout"] = connect_timeout_seconds
+            else:
+                # libpq only takes whole seconds
+                connect_args["connect_timeout"] = max(
+                    1,
+                    math.ceil(connect_timeout_seconds),
+                )
+        if connect_args:
+            options["connect_args"] = connect_args
+        return options
 
     @classmethod
     def _create_engine(cls) -> Engine:
         if cls.engine is None:
-            cls.engine = create_engine(cls.get_db_url(), echo=False)
-            cls.engine_slave = create_engine(cls.get_db_url_slave(), echo=False)
+            cls.engine = create_engine(
+                cls.get_db_url(),
+                echo=False,
+                **cls._engine_options(cls.pool or DatabaseConfig(), "master"),
+            )
+            # A hung replica fails its probe instead of stalling the probe thread
+            probe_timeout_seconds = (
+                cls.routing or ReplicaRoutingConfig()
+            ).probe_timeout_seconds
+            for replica in cls.replicas:
+                replica.engine = create_engine(
+                    cls.get_db_url_slave(replica),
+                    echo=False,
+                    **cls._engine_options(
+                        cls.slave_pool or SlaveDatabaseConfig(),
+                        replica.name,
+                        connect_timeout_seconds=probe_timeout_seconds,
+                    ),
+                )
         return cls.engine
 
+    @classmethod
+    def init_async_engine(cls) -> AsyncEngine:
+        """Create the asyncpg engines, once per application lifespan.
+
+        Pooled connections belong to the event loop that opened them, so the
+        engines are created and disposed by the loop serving the requests.
+        """
+        if cls.async_engine is None:
+            cls.async_engine = create_async_engine(
+                cls.get_async_db_url(),
+                echo=False,
+                **cls._engine_options(
+                    cls.pool or DatabaseConfig(),
+                    "master_async",
+                    is_async=True,
+                ),
+            )
+            probe_timeout_seconds = (
+                cls.routing or ReplicaRoutingConfig()
+            ).probe_timeout_seconds
+            for replica in cls.replicas:
+                replica.async_engine = create_async_engine(
+                    cls.get_async_db_url_slave(replica),
+                    echo=False,
+                    **cls._engine_options(
+                        cls.slave_pool or SlaveDatabaseConfig(),
+                        f"{replica.name}_async",
+                        is_async=True,
+                        connect_timeout_seconds=probe_timeout_seconds,
+                    ),
+                )
+        return cls.async_engine
+
     @classmethod
     def init_db(cls) -> None:
         if cls.engine is None:
@@ -86,20 +249,121 @@ class DatabaseSettings:
         session.commit()
         session.close()
 
+    @classmethod
+    def current_lsn(cls) -> str:
+        """WAL position of the master, covering every commit made so far"""
+        if cls.engine is None:
+            raise ValueError("Engine is not initialized")
+        return fetch_row(cls.engine, CURRENT_LSN_QUERY)[0]
+
+    @classmethod
+    async def current_lsn_async(cls) -> str:
+        if cls.async_engine is None:
+            raise ValueError("Async engine is not initialized")
+        return (await fetch_row_async(cls.async_engine, CURRENT_LSN_QUERY))[0]
+
+    @classmethod
+    def _acquire_replica(cls) -> Optional[Replica]:
+        """A replica that can serve the read without going back in time"""
+        for replica in cls.replica_set.stale():  # type: ignore
+            replica.probe()
+        return cls.replica_set.acquire(consistency_token())  # type: ignore
+
+    @classmethod
+    async def _acquire_replica_async(cls) -> Optional[Replica]:
+        for replica in cls.replica_set.stale():  # type: ignore
+            await replica.probe_async()
+        return cls.replica_set.acquire(consistency_token())  # type: ignore
+
     @classmethod
     @contextmanager
     def get_session(cls, slave: bool = False) -> Generator[Session, None, None]:
         if cls.engine is None:
             raise ValueError("Engine is not initialized")
-        if cls.engine_slave is None:
-            raise ValueError("Engine slave is not initialized")
-        engine = cls.engine_slave if slave else cls.engine
-        with Session(engine, autoflush=True) as session:
-            try:
-                yield session
-                session.commit()
-            except Exception as e:
-                session.rollback()
-                raise e
-            finally:
-                session.close()
+        replica = cls._acquire_replica() if slave else None
+        engine = replica.engine if replica is not None else cls.engine
+        try:
+            with Session(engine, autoflush=True) as session:
+                try:
+                    yield session
+                    session.commit()
+                    # Later reads of the caller must not miss what was written
+                    if (
+                        engine is cls.engine
+                        and session.info.get(WROTE_KEY)
+                        and tracks_consistency_token()
+                    ):
+                        advance_consistency_token(cls.current_lsn())
+                except Exception as e:
+                    session.rollback()
+                    raise e
+                finally:
+                    session.close()
+        finally:
+            if replica is not None:
+                cls.replica_set.release(replica)  # type: ignore
+
+    @classmethod
+    @asynccontextmanager
+    async def get_async_session(
+        cls,
+        slave: bool = False,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        if cls.async_engine is None:
+            raise ValueError("Async engine is not initialized")
+        engine = cls.async_engine
+        replica = await cls._acquire_replica_async() if slave else None
+        if replica is not None:
+            engine = replica.async_engine  # type: ignore
+        try:
+            # Rows are validated into entities after commit, so they must not
+            # expire
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                try:
+                    yield session
+                    await session.commit()
+                except Exception as e:
+                    await session.rollback()
+                    raise e
+        finally:
+            if replica is not None:
+                cls.replica_set.release(replica)  # type: ignore
+
+    @classmethod
+    async def dispose_async_engine(cls) -> None:
+        if cls.async_engine is not None:
+            await cls.async_engine.dispose()
+            cls.async_engine = None
+            for replica in cls.replicas:
+                await replica.async_engine.dispose()  # type: ignore
+                replica.async_engine = None
+
+    @classmethod
+    def pool_snapshot(cls) -> Dict[str, Any]:
+        """Checkout counters and current usage of every engine's pool"""
+        engines = {"master": cls.engine, "master_async": cls.async_engine}
+        for replica in cls.replicas:
+            engines[replica.name] = replica.engine
+            engines[f"{replica.name}_async"] = replica.async_engine
+        return {
+            name: get_pool_metrics(name).snapshot(engine.pool)
+            for name, engine in engines.items()
+            if engine is not None
+        }
+
+    @classmethod
+    def replica_snapshot(cls) -> Dict[str, Any]:
+        """Position, health and load of every replica and the master fallbacks"""
+        if cls.replica_set is None:
+            return {}
+        return cls.replica_set.snapshot()
+
+    @classmethod
+    def start_replica_probes(cls) -> None:
+        if cls.replica_set is not None:
+            cls.replica_set.start()
+
+    @classmethod
+    def stop_replica_probes(cls) -> None:
+        if cls.replica_set is not None:
+            cls.replica_set.stop()
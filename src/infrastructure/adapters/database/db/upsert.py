@@ -0,0 +1,37 @@
+from typing import Any, Sequence, Type
+
+from pydantic import BaseModel
+from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert
+
+# Columns an update never rewrites
+IMMUTABLE_COLUMNS = ("id", "created_at", "created_by")
+
+
+def versioned_upsert(
+    model: Type[Any],
+    entity: BaseModel,
+    conflict_columns: Sequence[str] = ("id",),
+) -> Any:
+    """INSERT ... ON CONFLICT DO UPDATE ... RETURNING in a single round trip.
+
+    The conflicting row is only overwritten when it is the same entity and holds
+    the previous version, otherwise nothing is returned and the caller raises
+    OptimisticLockException.
+    Like the UPDATE it replaces, fields left unset or None keep their value.
+    """
+    columns = set(model.__table__.columns.keys())
+    statement = insert(model).values(**entity.model_dump(include=columns))
+    changes = entity.model_dump(include=columns, exclude_none=True, exclude_unset=True)
+    return statement.on_conflict_do_update(
+        index_elements=list(conflict_columns),
+        set_={
+            name: statement.excluded[name]
+            for name in changes
+            if name not in conflict_columns and name not in IMMUTABLE_COLUMNS
+        },
+        where=and_(
+            model.id == statement.excluded.id,
+            model.version == statement.excluded.version - 1,
+        ),
+    ).returning(model)
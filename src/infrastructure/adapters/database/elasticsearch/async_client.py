@@ -0,0 +1,65 @@
+from typing import Optional
+
+from elasticsearch import AsyncElasticsearch
+from elasticsearch.exceptions import ConnectionError
+
+from src.infrastructure.adapters.database.elasticsearch.client import (
+    connection_params,
+)
+from src.infrastructure.settings.config import ElasticsearchConfig
+
+
+class AsyncElasticsearchClient:
+    """AsyncElasticsearch client wrapper for connection management"""
+
+    _instance = None
+    _client: Optional[AsyncElasticsearch] = None
+    _config: Optional[ElasticsearchConfig] = None
+
+    def __new__(cls, config: ElasticsearchConfig):  # type: ignore
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._config = config
+        return cls._instance
+
+    @property
+    def client(self) -> AsyncElasticsearch:
+        """Get the AsyncElasticsearch client opened by connect"""
+        if self._client is None:
+            raise ValueError("AsyncElasticsearchClient is not connected")
+        return self._client
+
+    def connect(self) -> None:
+        """Create the client when the application starts, close() ends it"""
+        if self._client is None:
+            self._client = self._create_client()
+
+    @property
+    def config(self) -> ElasticsearchConfig:
+        """Get the Elasticsearch configuration"""
+        if self._config is None:
+            raise ValueError("AsyncElasticsearchClient not properly initialized")
+        return self._config
+
+    def _create_client(self) -> AsyncElasticsearch:
+        """Create AsyncElasticsearch client with configuration"""
+        if self._config is None:
+            raise ValueError("AsyncElasticsearchClient not properly initialized")
+        return AsyncElasticsearch(
+            **connection_params(self._config),
+            # httpx is already a dependency, aiohttp is not
+            node_class="httpxasync",
+        )
+
+    async def ping(self) -> bool:
+        """Test connection to Elasticsearch"""
+        try:
+            return await self.client.ping()
+        except ConnectionError:
+            return False
+
+    async def close(self) -> None:
+        """Close the Elasticsearch connection"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
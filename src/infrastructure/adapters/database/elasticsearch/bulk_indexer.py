@@ -0,0 +1,144 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Set
+
+from src.infrastructure.adapters.database.elasticsearch.client import (
+    ElasticsearchClient,
+)
+from src.infrastructure.adapters.database.elasticsearch.documents import (
+    EXTERNAL_VERSION_TYPE,
+)
+from src.infrastructure.settings.config import ElasticsearchBulkConfig
+
+# Rejections Elasticsearch expects to be retried, besides the 5xx ones
+RETRYABLE_STATUSES = {429}
+
+
+@dataclass
+class PendingAcknowledgement:
+    """Message waiting for the bulk response of its document"""
+
+    document_id: str
+    ack: Callable[[], None]
+    nack: Callable[[], None]
+
+
+class BulkIndexer:
+    """Buffers index and delete actions and sends them through the _bulk API.
+
+    Actions rejected with 429 or 5xx, or lost with the whole request, are sent
+    again with an exponential backoff before their messages are requeued: the
+    rows are already committed, so a redelivered message finds nothing to
+    write and only the retry here brings the document up to date.
+    """
+
+    def __init__(
+        self,
+        elasticsearch_client: ElasticsearchClient,
+        config: ElasticsearchBulkConfig,
+    ) -> None:
+        self.es_client = elasticsearch_client
+        self.config = config
+        # One entry per action, its metadata line followed by its source
+        self._actions: List[List[Dict[str, Any]]] = []
+        self._pending: List[PendingAcknowledgement] = []
+
+    def index(
+        self,
+        index: str,
+        id: str,
+        document: Dict[str, Any],
+        version: int,
+    ) -> None:
+        """Queue a document to be indexed on the next flush"""
+        self._actions.append(
+            [
+                {
+                    "index": {
+                        "_index": index,
+                        "_id": id,
+                        "version": version,
+                        "version_type": EXTERNAL_VERSION_TYPE,
+                    },
+                },
+                document,
+            ],
+        )
+
+    def delete(self, index: str, id: str) -> None:
+        """Queue a document deletion for the next flush"""
+        self._actions.append([{"delete": {"_index": index, "_id": id}}])
+
+    def defer(
+        self,
+        document_id: str,
+        ack: Callable[[], None],
+        nack: Callable[[], None],
+    ) -> None:
+        """Hold a message acknowledgement until its document is confirmed"""
+        self._pending.append(PendingAcknowledgement(document_id, ack, nack))
+
+    def is_full(self) -> bool:
+        return len(self._actions) >= self.config.max_actions
+
+    def flush(self) -> None:
+        """Send the buffered actions and settle the deferred acknowledgements"""
+        actions, pending = self._actions, self._pending
+        self._actions, self._pending = [], []
+
+        try:
+            failed_ids = self._send(actions)
+        except Exception:
+            for acknowledgement in pending:
+                acknowledgement.nack()
+            raise
+
+        for acknowledgement in pending:
+            if acknowledgement.document_id in failed_ids:
+                acknowledgement.nack()
+            else:
+                acknowledgement.ack()
+
+    def _send(self, actions: List[List[Dict[str, Any]]]) -> Set[str]:
+        """Send the actions, retrying transient failures, and return failed ids"""
+        failed_ids: Set[str] = set()
+        attempt = 0
+        while actions:
+            try:
+                response = self.es_client.client.bulk(
+                    operations=[line for action in actions for line in action],
+                    refresh=self.config.refresh,
+                )
+            except Exception:
+                if attempt >= self.config.max_retries:
+                    raise
+                retry = actions
+            else:
+                retry = []
+                for action, item in zip(actions, response["items"]):
+                    status = self._status(item)
+                    if status in RETRYABLE_STATUSES or status >= 500:
+                        retry.append(action)
+                    elif status >= 300:
+                        failed_ids.add(self._document_id(action))
+                if retry and attempt >= self.config.max_retries:
+                    failed_ids.update(self._document_id(action) for action in retry)
+                    return failed_ids
+            actions = retry
+            if actions:
+                time.sleep(self.config.retry_backoff_seconds * 2**attempt)
+                attempt += 1
+        return failed_ids
+
+    def _status(self, item: Dict[str, Any]) -> int:
+        action, result = next(iter(item.items()))
+        # Deleting a document that was never indexed is not a failure, nor is
+        # indexing one the index already holds a newer version of
+        if action == "delete" and result["status"] == 404:
+            return 200
+        if action == "index" and result["status"] == 409:
+            return 200
+        return result["status"]
+
+    def _document_id(self, action: List[Dict[str, Any]]) -> str:
+        return next(iter(action[0].values()))["_id"]
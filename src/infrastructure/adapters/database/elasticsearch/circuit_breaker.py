@@ -0,0 +1,105 @@
+import time
+from collections import deque
+from enum import StrEnum
+from threading import Lock
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from src.infrastructure.settings.config import ElasticsearchCircuitBreakerConfig
+
+
+class CircuitState(StrEnum):
+    """Circuit state enum."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops calling Elasticsearch while it fails or answers too slowly"""
+
+    def __init__(self, config: ElasticsearchCircuitBreakerConfig) -> None:
+        self.config = config
+        self.state = CircuitState.CLOSED
+        # (finished at, failed, slow) of the calls inside the rolling window
+        self._calls: Deque[Tuple[float, bool, bool]] = deque()
+        self._opened_at: Optional[float] = None
+        self._probes = 0
+        self._probe_successes = 0
+        self._lock = Lock()
+
+    def allow_request(self) -> bool:
+        """Whether the next call may go to Elasticsearch"""
+        with self._lock:
+            if self.state == CircuitState.OPEN:
+                if time.monotonic() - self._opened_at < self.config.open_seconds:  # type: ignore
+                    return False
+                self.state = CircuitState.HALF_OPEN
+                self._probes = 0
+                self._probe_successes = 0
+            if self.state == CircuitState.HALF_OPEN:
+                if self._probes >= self.config.half_open_max_calls:
+                    return False
+                self._probes += 1
+            return True
+
+    def record(self, elapsed: float, failed: bool) -> None:
+        """Account for a finished call and move the circuit if a threshold is crossed"""
+        slow = elapsed >= self.config.slow_call_seconds
+        now = time.monotonic()
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN:
+                if failed or slow:
+                    self._open(now)
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.config.half_open_max_calls:
+                    self.state = CircuitState.CLOSED
+                    self._calls.clear()
+                return
+            if self.state == CircuitState.OPEN:
+                return
+
+            self._calls.append((now, failed, slow))
+            self._expire(now)
+            if len(self._calls) < self.config.minimum_calls:
+                return
+            error_rate, slow_call_rate = self._rates()
+            if (
+                error_rate >= self.config.error_rate_threshold
+                or slow_call_rate >= self.config.slow_call_rate_threshold
+            ):
+                self._open(now)
+
+    def release(self) -> None:
+        """Give back the probe slot of a call that ended without an outcome"""
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._expire(time.monotonic())
+            error_rate, slow_call_rate = self._rates()
+            return {
+                "state": self.state.value,
+                "calls": len(self._calls),
+                "error_rate": error_rate,
+                "slow_call_rate": slow_call_rate,
+            }
+
+    def _open(self, now: float) -> None:
+        self.state = CircuitState.OPEN
+        self._opened_at = now
+        self._calls.clear()
+
+    def _expire(self, now: float) -> None:
+        while self._calls and now - self._calls[0][0] > self.config.window_seconds:
+            self._calls.popleft()
+
+    def _rates(self) -> Tuple[float, float]:
+        if not self._calls:
+            return 0.0, 0.0
+        failures = sum(1 for _, failed, _ in self._calls if failed)
+        slow_calls = sum(1 for _, _, slow in self._calls if slow)
+        return failures / len(self._calls), slow_calls / len(self._calls)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from elasticsearch import Elasticsearch
 from elasticsearch.exceptions import ConnectionError
@@ -6,6 +6,41 @@ from elasticsearch.exceptions import ConnectionError
 from src.infrastructure.settings.config import ElasticsearchConfig
 
 
+def connection_params(config: ElasticsearchConfig) -> Dict[str, Any]:
+    """Connection settings shared by the sync and async clients"""
+    scheme = "https" if config.use_ssl else "http"
+    params = {
+        "hosts": [
+            {
+                "host": config.host,
+                "port": config.port,
+                "scheme": scheme,
+            },
+        ],
+        "request_timeout": config.timeout,
+        "max_retries": config.max_retries,
+        "retry_on_timeout": config.retry_on_timeout,
+        # Force compatibility with Elasticsearch 8.x
+        "headers": {
+            "Accept": "application/vnd.elasticsearch+json; compatible-with=8",
+        },
+    }
+
+    # Add authentication if provided
+    if config.username and config.password:
+        params["http_auth"] = (
+            config.username,
+            config.password,
+        )
+
+    # Add SSL configuration
+    if config.use_ssl:
+        params["use_ssl"] = True
+        params["verify_certs"] = config.verify_certs
+
+    return params
+
+
 class ElasticsearchClient:
     """Elasticsearch client wrapper for connection management"""
 
@@ -38,38 +73,7 @@ class ElasticsearchClient:
         """Create Elasticsearch client with configuration"""
         if self._config is None:
             raise ValueError("ElasticsearchClient not properly initialized")
-
-        scheme = "https" if self._config.use_ssl else "http"
-        connection_params = {
-            "hosts": [
-                {
-                    "host": self._config.host,
-                    "port": self._config.port,
-                    "scheme": scheme,
-                },
-            ],
-            "request_timeout": self._config.timeout,
-            "max_retries": self._config.max_retries,
-            "retry_on_timeout": self._config.retry_on_timeout,
-            # Force compatibility with Elasticsearch 8.x
-            "headers": {
-                "Accept": "application/vnd.elasticsearch+json; compatible-with=8",
-            },
-        }
-
-        # Add authentication if provided
-        if self._config.username and self._config.password:
-            connection_params["http_auth"] = (
-                self._config.username,
-                self._config.password,
-            )
-
-        # Add SSL configuration
-        if self._config.use_ssl:
-            connection_params["use_ssl"] = True
-            connection_params["verify_certs"] = self._config.verify_certs
-
-        return Elasticsearch(**connection_params)  # type: ignore
+        return Elasticsearch(**connection_params(self._config))  # type: ignore
 
     def ping(self) -> bool:
         """Test connection to Elasticsearch"""
@@ -0,0 +1,104 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
+from src.domain.entities.book import Book
+from src.domain.enums.suggestion_kind import SuggestionKind
+
+# Documents are versioned with the book, so a stale write never replaces a
+# newer one; an equal version is accepted so a committed book can be reindexed
+EXTERNAL_VERSION_TYPE = "external_gte"
+
+
+def book_to_elasticsearch_document(book: Book) -> Dict[str, Any]:
+    """Convert Book entity to Elasticsearch document"""
+    authors = book.authors or []
+    book_categories = book.book_categories or []
+    doc = {
+        "id": str(book.id),
+        "version": book.version,
+        "isbn_code": book.isbn_code,
+        "editor": book.editor,
+        "edition": book.edition,
+        "type": book.type,
+        "publish_date": (book.publish_date.isoformat() if book.publish_date else None),
+        **_audit_fields(book),
+        "author_ids": [
+            str(author_id)
+            for author_id in book.author_ids or [author.id for author in authors]
+        ],
+        "category_ids": [
+            str(cat_id)
+            for cat_id in book.category_ids
+            or [category.id for category in book_categories]
+        ],
+    }
+
+    # Nested objects carry every field the entities need to be rebuilt from a hit
+    if authors:
+        doc["authors"] = [
+            {
+                "id": str(author.id),
+                "version": author.version,
+                "name": author.name,
+                **_audit_fields(author),
+            }
+            for author in authors
+        ]
+
+    if book_categories:
+        doc["book_categories"] = [
+            {
+                "id": str(category.id),
+                "version": category.version,
+                "title": category.title,
+                "description": category.description,
+                **_audit_fields(category),
+            }
+            for category in book_categories
+        ]
+
+    if book.book_data:
+        doc["book_data"] = [
+            {
+                "id": str(data.id),
+                "title": data.title,
+                "summary": data.summary,
+                "language": data.language,
+                **_audit_fields(data),
+            }
+            for data in book.book_data
+        ]
+
+    doc["suggest"] = _suggest_entries(book)
+
+    return doc
+
+
+def _format_date(value: datetime) -> str:
+    """Format a datetime as strict_date_time with millisecond precision"""
+    return value.strftime("%Y-%m-%dT%H:%M:%S") + f".{value.microsecond // 1000:03d}Z"
+
+
+def _audit_fields(entity: Any) -> Dict[str, Any]:
+    return {
+        "created_at": _format_date(entity.created_at),
+        "updated_at": _format_date(entity.updated_at),
+        "created_by": entity.created_by,
+        "updated_by": entity.updated_by,
+    }
+
+
+def _suggest_entries(book: Book) -> List[Dict[str, Any]]:
+    """Completion inputs for typeahead, tagged with the kind of each input"""
+    inputs = {
+        SuggestionKind.TITLE: [data.title for data in book.book_data or []],
+        SuggestionKind.AUTHOR: [author.name for author in book.authors or []],
+        SuggestionKind.CATEGORY: [
+            category.title for category in book.book_categories or []
+        ],
+    }
+    return [
+        {"input": values, "contexts": {"kind": [kind]}}
+        for kind, values in inputs.items()
+        if values
+    ]
@@ -0,0 +1,132 @@
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from src.infrastructure.adapters.database.elasticsearch.client import (
+    ElasticsearchClient,
+)
+from src.infrastructure.settings.config import ElasticsearchIndexConfig
+
+
+class BookIndexManager:
+    """Creates and validates the books index from ElasticsearchIndexConfig"""
+
+    def __init__(
+        self,
+        elasticsearch_client: ElasticsearchClient,
+        index_config: ElasticsearchIndexConfig,
+    ):
+        self.es_client = elasticsearch_client
+        self.index_config = index_config
+
+    def index_definition(self, bulk_load: bool = False) -> Dict[str, Any]:
+        """Settings and mappings for the books index"""
+        with open(self.index_config.mappings_file_path) as f:
+            books_config = json.load(f).get("books", {})
+
+        settings = {
+            **books_config.get("settings", {}),
+            "number_of_shards": self.index_config.number_of_shards,
+            "number_of_replicas": self.index_config.number_of_replicas,
+            "refresh_interval": self.index_config.refresh_interval,
+            "max_result_window": self.index_config.max_result_window,
+        }
+        if bulk_load:
+            settings["number_of_replicas"] = 0
+            settings["refresh_interval"] = "-1"
+        return {"settings": settings, "mappings": books_config.get("mappings", {})}
+
+    def versioned_index_name(self) -> str:
+        return f"{self.index_config.books_index}-{datetime.now(timezone.utc):%Y%m%d%H%M%S%f}"
+
+    def put_template(self) -> None:
+        """Install an index template so any books index gets explicit mappings"""
+        alias = self.index_config.books_index
+        self.es_client.client.indices.put_index_template(
+            name=alias,
+            index_patterns=[alias, f"{alias}-*"],
+            template=self.index_definition(),
+            priority=100,
+        )
+
+    def create_index(
+        self,
+        index: str,
+        alias: Optional[str] = None,
+        bulk_load: bool = False,
+    ) -> None:
+        """Create an index, optionally tuned for bulk loading"""
+        definition = self.index_definition(bulk_load=bulk_load)
+        self.es_client.client.indices.create(
+            index=index,
+            settings=definition["settings"],
+            mappings=definition["mappings"],
+            aliases={alias: {}} if alias else None,
+        )
+
+    def ensure_index(self) -> List[str]:
+        """Create the books index behind its alias when missing, otherwise validate it"""
+        self.put_template()
+        alias = self.index_config.books_index
+        if self.es_client.client.indices.exists(index=alias):
+            return self.validate()
+        self.create_index(self.versioned_index_name(), alias=alias)
+        return []
+
+    def validate(self) -> List[str]:
+        """List the differences between the live index and the expected definition"""
+        alias = self.index_config.books_index
+        expected = self.index_definition()
+        problems: List[str] = []
+
+        settings = self.es_client.client.indices.get_settings(index=alias)
+        for index, index_settings in settings.items():
+            shards = int(index_settings["settings"]["index"]["number_of_shards"])
+            if shards != self.index_config.number_of_shards:
+                problems.append(
+                    f"{index}: number_of_shards is {shards}, expected {self.index_config.number_of_shards}",
+                )
+
+        mappings = self.es_client.client.indices.get_mapping(index=alias)
+        for index, index_mapping in mappings.items():
+            actual = index_mapping["mappings"]
+            if (
+                str(actual.get("dynamic", True)).lower()
+                != str(expected["mappings"].get("dynamic", True)).lower()
+            ):
+                problems.append(f"{index}: dynamic is {actual.get('dynamic', True)}")
+            problems += self._compare_properties(
+                index,
+                expected["mappings"].get("properties", {}),
+                actual.get("properties", {}),
+            )
+        return problems
+
+    def _compare_properties(
+        self,
+        path: str,
+        expected: Dict[str, Any],
+        actual: Dict[str, Any],
+    ) -> List[str]:
+        problems = []
+        for name, field in expected.items():
+            field_path = f"{path}.{name}"
+            if name not in actual:
+                problems.append(f"{field_path}: missing")
+                continue
+            expected_type = field.get("type", "object")
+            actual_type = actual[name].get("type", "object")
+            if expected_type != actual_type:
+                problems.append(
+                    f"{field_path}: type is {actual_type}, expected {expected_type}"
+                )
+                continue
+            problems += self._compare_properties(
+                field_path,
+                {**field.get("properties", {}), **field.get("fields", {})},
+                {
+                    **actual[name].get("properties", {}),
+                    **actual[name].get("fields", {}),
+                },
+            )
+        return problems
@@ -0,0 +1,238 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Generator, Iterable, List, Optional
+from uuid import UUID
+
+from elasticsearch import helpers
+from sqlalchemy.orm import selectinload
+from sqlmodel import select, text
+
+from src.domain.entities.book import Book
+from src.infrastructure.adapters.database.db.session import DatabaseSettings
+from src.infrastructure.adapters.database.elasticsearch.client import (
+    ElasticsearchClient,
+)
+from src.infrastructure.adapters.database.elasticsearch.documents import (
+    EXTERNAL_VERSION_TYPE,
+    book_to_elasticsearch_document,
+)
+from src.infrastructure.adapters.database.elasticsearch.index_manager import (
+    BookIndexManager,
+)
+from src.infrastructure.adapters.database.models.book import Book as BookModel
+from src.infrastructure.settings.config import (
+    ElasticsearchIndexConfig,
+    ElasticsearchReindexConfig,
+)
+
+
+def _convert_chunk(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build Elasticsearch documents from raw book rows inside a worker process"""
+    return [book_to_elasticsearch_document(Book.model_validate(row)) for row in rows]
+
+
+class BookReindexer:
+    """Rebuilds the books index from PostgreSQL and swaps it in behind an alias"""
+
+    def __init__(
+        self,
+        db: DatabaseSettings,
+        elasticsearch_client: ElasticsearchClient,
+        index_config: ElasticsearchIndexConfig,
+        reindex_config: ElasticsearchReindexConfig,
+    ):
+        self.db = db
+        self.es_client = elasticsearch_client
+        self.index_config = index_config
+        self.reindex_config = reindex_config
+        self.index_manager = BookIndexManager(elasticsearch_client, index_config)
+
+    def reindex(self, delete_previous: bool = False) -> str:
+        """Load every book into a new versioned index and point the alias at it"""
+        started_xid = self._oldest_running_xid()
+        alias = self.index_config.books_index
+        index = self.index_manager.versioned_index_name()
+
+        self.index_manager.put_template()
+        self.index_manager.create_index(index, bulk_load=True)
+        self._load(index, self._stream_rows())
+        # Books deleted during the bulk load were deleted from the previous index
+        self._remove_deleted(index)
+        self.es_client.client.indices.put_settings(
+            index=index,
+            settings={
+                "number_of_replicas": self.index_config.number_of_replicas,
+                "refresh_interval": self.index_config.refresh_interval,
+            },
+        )
+        self.es_client.client.indices.refresh(index=index)
+        previous_indices = self._swap_alias(alias, index)
+
+        # Books written during the bulk load went to the previous index, and so
+        # did the deletes made before the alias moved
+        self._load(index, self._stream_rows(written_since=started_xid))
+        self._remove_deleted(index)
+
+        if delete_previous:
+            for previous_index in previous_indices:
+                self.es_client.client.indices.delete(index=previous_index)
+        return index
+
+    def _oldest_running_xid(self) -> str:
+        """Oldest transaction still running, every later commit has a newer xid"""
+        with self.db.get_session() as session:
+            return session.exec(  # type: ignore
+                # xmin is a 32 bit xid, the epoch of the snapshot's is dropped
+                text(
+                    "SELECT (pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+                    " % 4294967296)::text",
+                ),
+            ).scalar_one()
+
+    def _swap_alias(self, alias: str, index: str) -> List[str]:
+        """Atomically move the alias to the new index, returning the indices it left"""
+        indices = self.es_client.client.indices
+        actions: List[Dict[str, Any]] = [{"add": {"index": index, "alias": alias}}]
+        previous_indices: List[str] = []
+        if indices.exists_alias(name=alias):
+            previous_indices = list(indices.get_alias(name=alias).keys())
+            actions += [
+                {"remove": {"index": name, "alias": alias}} for name in previous_indices
+            ]
+        elif indices.exists(index=alias):
+            # A concrete index still holds the alias name, replace it in the same call
+            actions.append({"remove_index": {"index": alias}})
+        indices.update_aliases(actions=actions)
+        return previous_indices
+
+    def _stream_rows(
+        self,
+        written_since: Optional[str] = None,
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """Read books with their relations in keyset ordered chunks"""
+        last_id: Optional[UUID] = None
+        while True:
+            with self.db.get_session() as session:
+                statement = (
+                    select(BookModel)
+                    .options(
+                        selectinload(BookModel.authors),  # type: ignore
+                        selectinload(BookModel.book_categories),  # type: ignore
+                        selectinload(BookModel.book_data),  # type: ignore
+                    )
+                    .order_by(BookModel.id)  # type: ignore
+                    .limit(self.reindex_config.chunk_size)
+                )
+                if last_id is not None:
+                    statement = statement.where(BookModel.id > last_id)
+                if written_since is not None:
+                    # xmin is set by the commit that wrote the row, unlike the
+                    # updated_at of the message, and age() survives wraparound
+                    statement = statement.where(
+                        text(
+                            f"age({BookModel.__tablename__}.xmin) "
+                            "<= age(CAST(:written_since AS xid))",
+                        ).bindparams(written_since=written_since),
+                    )
+                rows = [self._book_row(book) for book in session.exec(statement).all()]
+
+            if not rows:
+                return
+            yield rows
+            if len(rows) < self.reindex_config.chunk_size:
+                return
+            last_id = rows[-1]["id"]
+
+    def _deleted_ids(self, index: str) -> Generator[str, None, None]:
+        """Ids of the index whose book is no longer in PostgreSQL"""
+        # Bulk loaded documents are only visible to the scan once refreshed
+        self.es_client.client.indices.refresh(index=index)
+        hits = helpers.scan(
+            self.es_client.client,
+            index=index,
+            query={"query": {"match_all": {}}},
+            _source=False,
+            size=self.reindex_config.chunk_size,
+        )
+        while ids := [
+            hit["_id"] for hit in islice(hits, self.reindex_config.chunk_size)
+        ]:
+            # Read from the master, a lagging replica would miss new books
+            with self.db.get_session() as session:
+                statement = select(BookModel.id).where(
+                    BookModel.id.in_(ids),  # type: ignore
+                )
+                existing = {str(id) for id in session.exec(statement).all()}
+            yield from (id for id in ids if id not in existing)
+
+    def _remove_deleted(self, index: str) -> int:
+        """Delete the documents of books that were deleted from PostgreSQL"""
+        actions = (
+            {"_op_type": "delete", "_index": index, "_id": id}
+            for id in self._deleted_ids(index)
+        )
+        removed = 0
+        for ok, item in helpers.streaming_bulk(
+            self.es_client.client,
+            actions,
+            chunk_size=self.reindex_config.bulk_chunk_size,
+            raise_on_error=False,
+        ):
+            # Not found means a concurrent delete got there first
+            if not ok and item["delete"]["status"] != 404:
+                raise helpers.BulkIndexError("Failed to remove deleted books", [item])
+            removed += ok
+        return removed
+
+    def _book_row(self, book: BookModel) -> Dict[str, Any]:
+        return {
+            **book.model_dump(),
+            "authors": [author.model_dump() for author in book.authors],
+            "book_categories": [
+                category.model_dump() for category in book.book_categories
+            ],
+            "book_data": [data.model_dump() for data in book.book_data],
+        }
+
+    def _convert(
+        self,
+        chunks: Iterable[List[Dict[str, Any]]],
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Convert chunks in a process pool while keeping a bounded number in flight"""
+        workers = self.reindex_config.workers
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: Deque[Future[List[Dict[str, Any]]]] = deque()
+            for rows in chunks:
+                pending.append(executor.submit(_convert_chunk, rows))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def _load(self, index: str, chunks: Iterable[List[Dict[str, Any]]]) -> int:
+        """Bulk load converted documents into the index"""
+        # A document read before a newer consumer write must not overwrite it
+        actions = (
+            {
+                "_index": index,
+                "_id": document["id"],
+                "_source": document,
+                "_version": document["version"],
+                "_version_type": EXTERNAL_VERSION_TYPE,
+            }
+            for document in self._convert(chunks)
+        )
+        indexed = 0
+        for ok, item in helpers.parallel_bulk(
+            self.es_client.client,
+            actions,
+            thread_count=self.reindex_config.bulk_threads,
+            chunk_size=self.reindex_config.bulk_chunk_size,
+            raise_on_error=False,
+        ):
+            # A conflict means the index already holds a newer version
+            if not ok and item["index"]["status"] != 409:
+                raise helpers.BulkIndexError("Failed to load books", [item])
+            indexed += ok
+        return indexed
@@ -3,6 +3,7 @@ from .author import Author
 from .author_book_link import AuthorBookLink
 from .base_model import Base
 from .book import Book
+from .book_availability import BookAvailability
 from .book_book_category_link import BookBookCategoryLink
 from .book_category import BookCategory
 from .book_data import BookData
@@ -17,6 +18,7 @@ __all__ = [
     "BookCategory",
     "BookData",
     "Book",
+    "BookAvailability",
     "Branch",
     "PhysicalExemplar",
 ]
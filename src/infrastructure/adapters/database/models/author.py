@@ -5,11 +5,18 @@ from sqlmodel import Field, Relationship
 from src.infrastructure.adapters.database.models.author_book_link import AuthorBookLink
 
 from .base_model import Base
+from .text_search import search_vector_index, trigram_index
 
 
 class Author(Base, table=True):
     """Author entity model."""
 
+    # Full-text and fuzzy search of the PostgreSQL search fallback
+    __table_args__ = (
+        search_vector_index("ix_author_name_search", "name"),
+        trigram_index("ix_author_name_trgm", "name"),
+    )
+
     version: int = Field(nullable=False, ge=1)
     name: str = Field(nullable=False, index=True)
     books: List["Book"] = Relationship(  # type: ignore
@@ -1,6 +1,7 @@
 from datetime import date
 from typing import List
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from src.domain.enums.book_type import BookType
@@ -17,6 +18,9 @@ from .physical_exemplar import PhysicalExemplar
 class Book(Base, table=True):
     """Book entity model."""
 
+    # Keyset pages of the PostgreSQL search fallback in its default order
+    __table_args__ = (Index("ix_book_created_at_id", "created_at", "id"),)
+
     isbn_code: str = Field(nullable=False)
     version: int = Field(nullable=False, ge=1)
     editor: str = Field(nullable=False)
@@ -0,0 +1,22 @@
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+
+class BookAvailability(SQLModel, table=True):
+    """Available and total physical exemplars of a book in a branch.
+
+    Derived from physical_exemplar and kept up to date in the transaction of
+    every exemplar upsert, so the availability of a book is one index lookup.
+    """
+
+    __tablename__ = "book_availability"  # type: ignore
+
+    book_id: UUID = Field(foreign_key="book.id", primary_key=True, ondelete="CASCADE")
+    branch_id: UUID = Field(
+        foreign_key="branch.id",
+        primary_key=True,
+        ondelete="CASCADE",
+    )
+    available_count: int = Field(default=0, nullable=False)
+    total_count: int = Field(default=0, nullable=False)
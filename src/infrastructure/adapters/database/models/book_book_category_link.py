@@ -10,7 +10,12 @@ class BookBookCategoryLink(Base, table=True):
 
     __tablename__ = "book_book_category_link"  # type: ignore
 
-    book_id: UUID | None = Field(default=None, foreign_key="book.id", primary_key=True)
+    book_id: UUID | None = Field(
+        default=None,
+        foreign_key="book.id",
+        primary_key=True,
+        index=True,
+    )
     book_category_id: UUID | None = Field(
         default=None,
         foreign_key="book_category.id",
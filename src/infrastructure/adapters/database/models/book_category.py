@@ -4,12 +4,19 @@ from sqlmodel import Field, Relationship
 
 from .base_model import Base
 from .book_book_category_link import BookBookCategoryLink
+from .text_search import search_vector_index, trigram_index
 
 
 class BookCategory(Base, table=True):
     """Book category model."""
 
     __tablename__ = "book_category"  # type: ignore
+    # Full-text and fuzzy search of the PostgreSQL search fallback
+    __table_args__ = (
+        search_vector_index("ix_book_category_title_search", "title"),
+        trigram_index("ix_book_category_title_trgm", "title"),
+        trigram_index("ix_book_category_description_trgm", "description"),
+    )
 
     version: int = Field(nullable=False, ge=1)
     title: str = Field(
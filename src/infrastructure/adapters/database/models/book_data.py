@@ -3,12 +3,20 @@ from uuid import UUID
 from sqlmodel import Field, Relationship
 
 from .base_model import Base
+from .text_search import search_vector_index, trigram_index
 
 
 class BookData(Base, table=True):
     """Book translation and additional data model."""
 
     __tablename__ = "book_data"  # type: ignore
+    # Full-text and fuzzy search of the PostgreSQL search fallback
+    __table_args__ = (
+        search_vector_index("ix_book_data_title_search", "title"),
+        search_vector_index("ix_book_data_summary_search", "summary"),
+        trigram_index("ix_book_data_title_trgm", "title"),
+        trigram_index("ix_book_data_summary_trgm", "summary"),
+    )
 
     language: str = Field(nullable=False)
     summary: str | None = Field(nullable=True)
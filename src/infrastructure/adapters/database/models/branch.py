@@ -4,11 +4,14 @@ from sqlmodel import Field, Relationship
 
 from .base_model import Base
 from .physical_exemplar import PhysicalExemplar
+from .text_search import trigram_index
 
 
 class Branch(Base, table=True):
     """Library branch entity model."""
 
+    __table_args__ = (trigram_index("ix_branch_name_trgm", "name"),)
+
     name: str = Field(nullable=False)
     version: int = Field(nullable=False, ge=1)
     physical_exemplars: List[PhysicalExemplar] = Relationship(
@@ -1,5 +1,6 @@
 from uuid import UUID
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from .base_model import Base
@@ -9,6 +10,15 @@ class PhysicalExemplar(Base, table=True):
     """Physical book exemplar model."""
 
     __tablename__ = "physical_exemplar"  # type: ignore
+    # Arbiter of the upsert, a branch holds one exemplar of a book
+    __table_args__ = (
+        Index(
+            "ux_physical_exemplar_book_id_branch_id",
+            "book_id",
+            "branch_id",
+            unique=True,
+        ),
+    )
     version: int = Field(nullable=False, ge=1)
     available: bool = Field(nullable=False)
     room: int = Field(nullable=False)
@@ -0,0 +1,92 @@
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Index,
+    TextClause,
+    and_,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.orm import aliased
+
+# No stemming, like the standard analyzer of the Elasticsearch mappings
+TEXT_SEARCH_CONFIG = "'simple'::regconfig"
+
+# Lowest similarity() the filters accept, the cutoff they used before the % operator
+SIMILARITY_THRESHOLD = 0.2
+
+
+def search_vector(column: Any) -> ColumnElement:
+    """tsvector of a text column, the expression its search index is built on"""
+    return func.to_tsvector(
+        literal_column(TEXT_SEARCH_CONFIG),
+        func.coalesce(column, literal_column("''")),
+    )
+
+
+def matches_text(column: Any, query: str) -> ColumnElement[bool]:
+    """Every term of the query appears in the column"""
+    return search_vector(column).op("@@")(
+        func.plainto_tsquery(literal_column(TEXT_SEARCH_CONFIG), query),
+    )
+
+
+def matches_fuzzy(column: Any, query: str) -> ColumnElement[bool]:
+    """The query is similar to a part of the column (pg_trgm word similarity)"""
+    return literal(query).op("<%")(column)
+
+
+def similarity_threshold(threshold: float = SIMILARITY_THRESHOLD) -> TextClause:
+    """SET LOCAL read by the % operator, which takes no threshold argument"""
+    return text(f"SET LOCAL pg_trgm.similarity_threshold = {float(threshold)}")
+
+
+def is_similar(column: Any, query: str) -> ColumnElement[bool]:
+    """similarity(column, query) reaches the threshold, answered by the trigram index"""
+    return column.op("%")(query)
+
+
+def rank_by_similarity(
+    statement: Any,
+    model: Any,
+    column: str,
+    query: str,
+    cursor: Optional[UUID] = None,
+) -> Any:
+    """Most similar rows first with id breaking ties, resumed after the cursor row"""
+    similarity = func.similarity(getattr(model, column), query)
+    if cursor is not None:
+        # The cursor stays an id, its rank is computed again from its row
+        cursor_row = aliased(model)
+        after = (
+            select(func.similarity(getattr(cursor_row, column), query))
+            .where(cursor_row.id == cursor)
+            .scalar_subquery()
+        )
+        statement = statement.where(
+            or_(similarity < after, and_(similarity == after, model.id > cursor)),
+        )
+    return statement.order_by(similarity.desc(), model.id)
+
+
+def search_vector_index(name: str, column: str) -> Index:
+    return Index(
+        name,
+        text(f"to_tsvector({TEXT_SEARCH_CONFIG}, coalesce({column}, ''))"),
+        postgresql_using="gin",
+    )
+
+
+def trigram_index(name: str, column: str) -> Index:
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
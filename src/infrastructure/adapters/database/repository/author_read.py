@@ -1,26 +1,67 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import func
 from sqlalchemy.exc import NoResultFound
 from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
 
 from src.application.exceptions import NotFoundException
 from src.application.ports.database.author import AuthorReadRepositoryPort
 from src.domain.entities.author import Author, AuthorFilter
+from src.infrastructure.adapters.database.db.loading import author_options
 from src.infrastructure.adapters.database.db.session import DatabaseSettings
 from src.infrastructure.adapters.database.models.author import Author as AuthorModel
+from src.infrastructure.adapters.database.models.text_search import (
+    is_similar,
+    rank_by_similarity,
+    similarity_threshold,
+)
 
 
 class AuthorReadRepository(AuthorReadRepositoryPort):
     def __init__(self, db: DatabaseSettings):
         super().__init__(db=db)
 
+    def _author_by_id_statement(self, id: UUID) -> SelectOfScalar[AuthorModel]:
+        return (
+            select(AuthorModel).where(AuthorModel.id == id).options(*author_options())
+        )
+
+    def _author_by_filter_statement(
+        self,
+        filter: Optional[AuthorFilter] = None,
+    ) -> SelectOfScalar[AuthorModel]:
+        if filter is None:
+            filter = AuthorFilter()
+        statement = select(AuthorModel).options(*author_options())
+        if filter.name:
+            statement = rank_by_similarity(
+                statement.where(is_similar(AuthorModel.name, filter.name)),
+                AuthorModel,
+                "name",
+                filter.name,
+                filter.cursor,
+            )
+        else:
+            # UUIDv7 ids grow with creation time, so the primary key is the keyset
+            if filter.cursor:
+                statement = statement.where(AuthorModel.id > filter.cursor)
+            statement = statement.order_by(AuthorModel.id)
+        return statement.limit(filter.limit)
+
     def get_author_by_id(self, id: UUID) -> Author:
         with self.db.get_session(slave=True) as session:
             try:
-                author_model = session.exec(
-                    select(AuthorModel).where(AuthorModel.id == id),
+                author_model = session.exec(self._author_by_id_statement(id)).one()
+            except NoResultFound:
+                raise NotFoundException("Author not found")
+            return Author.model_validate(author_model)
+
+    async def get_author_by_id_async(self, id: UUID) -> Author:
+        async with self.db.get_async_session(slave=True) as session:
+            try:
+                author_model = (
+                    await session.exec(self._author_by_id_statement(id))
                 ).one()
             except NoResultFound:
                 raise NotFoundException("Author not found")
@@ -31,17 +72,29 @@ class AuthorReadRepository(AuthorReadRepositoryPort):
         filter: Optional[AuthorFilter] = None,
     ) -> List[Author]:
         with self.db.get_session(slave=True) as session:
-            statement = select(AuthorModel)
-            if filter is not None:
-                if filter.name:
-                    statement = statement.where(
-                        func.similarity(AuthorModel.name, filter.name) > 0.2,
-                    )
-            authors = session.exec(statement).all()
+            if filter is not None and filter.name:
+                session.exec(similarity_threshold())  # type: ignore
+            authors = session.exec(self._author_by_filter_statement(filter)).all()
+            return [Author.model_validate(author) for author in authors]
+
+    async def get_author_by_filter_async(
+        self,
+        filter: Optional[AuthorFilter] = None,
+    ) -> List[Author]:
+        async with self.db.get_async_session(slave=True) as session:
+            if filter is not None and filter.name:
+                await session.exec(similarity_threshold())  # type: ignore
+            authors = (
+                await session.exec(self._author_by_filter_statement(filter))
+            ).all()
             return [Author.model_validate(author) for author in authors]
 
     def get_authors_by_ids(self, ids: List[UUID]) -> List[Author]:
         with self.db.get_session(slave=True) as session:
-            statement = select(AuthorModel).where(AuthorModel.id.in_(ids))  # type: ignore
+            statement = (
+                select(AuthorModel)
+                .where(AuthorModel.id.in_(ids))  # type: ignore
+                .options(*author_options())
+            )
             authors = session.exec(statement).all()
             return [Author.model_validate(author) for author in authors]
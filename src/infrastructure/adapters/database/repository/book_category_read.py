@@ -1,9 +1,9 @@
 from typing import List
 from uuid import UUID
 
-from sqlalchemy import func
 from sqlalchemy.exc import NoResultFound
 from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
 
 from src.application.exceptions import NotFoundException
 from src.application.ports.database.book_category import BookCategoryReadRepositoryPort
@@ -12,6 +12,11 @@ from src.infrastructure.adapters.database.db.session import DatabaseSettings
 from src.infrastructure.adapters.database.models.book_category import (
     BookCategory as BookCategoryModel,
 )
+from src.infrastructure.adapters.database.models.text_search import (
+    is_similar,
+    rank_by_similarity,
+    similarity_threshold,
+)
 
 
 class BookCategoryReadRepository(BookCategoryReadRepositoryPort):
@@ -38,27 +43,63 @@ class BookCategoryReadRepository(BookCategoryReadRepositoryPort):
                 raise NotFoundException("Book category not found")
             return BookCategory.model_validate(book_category_model)
 
+    def _book_category_by_filter_statement(
+        self,
+        filter: BookCategoryFilter,
+    ) -> SelectOfScalar[BookCategoryModel]:
+        statement = select(BookCategoryModel)
+        if filter.title:
+            statement = statement.where(
+                is_similar(BookCategoryModel.title, filter.title.lower()),
+            )
+        if filter.description:
+            # ILIKE with inner wildcards is answered by the trigram index too
+            string_statement = (
+                "%" + "%".join(filter.description.lower().strip().split(" ")) + "%"
+            )
+            statement = statement.where(
+                BookCategoryModel.description.ilike(string_statement),  # type: ignore
+            )
+        if filter.title:
+            statement = rank_by_similarity(
+                statement,
+                BookCategoryModel,
+                "title",
+                filter.title.lower(),
+                filter.cursor,
+            )
+        else:
+            if filter.cursor:
+                statement = statement.where(BookCategoryModel.id > filter.cursor)
+            statement = statement.order_by(BookCategoryModel.id)  # type: ignore
+        return statement.limit(filter.limit)
+
     def get_book_category_by_filter(
         self,
         filter: BookCategoryFilter,
     ) -> List[BookCategory]:
         with self.db.get_session(slave=True) as session:
-            statement = select(BookCategoryModel)
             if filter.title:
-                statement = statement.where(
-                    func.similarity(BookCategoryModel.title, filter.title.lower())
-                    > 0.2,
-                )
-            if filter.description:
-                string_statement = (
-                    "%" + "%".join(filter.description.lower().strip().split(" ")) + "%"
-                )
-                statement = statement.where(
-                    BookCategoryModel.description.ilike(string_statement),  # type: ignore
-                )
+                session.exec(similarity_threshold())  # type: ignore
             return [
                 BookCategory.model_validate(book_category_model)
-                for book_category_model in session.exec(statement).all()
+                for book_category_model in session.exec(
+                    self._book_category_by_filter_statement(filter),
+                ).all()
+            ]
+
+    async def get_book_category_by_filter_async(
+        self,
+        filter: BookCategoryFilter,
+    ) -> List[BookCategory]:
+        async with self.db.get_async_session(slave=True) as session:
+            if filter.title:
+                await session.exec(similarity_threshold())  # type: ignore
+            return [
+                BookCategory.model_validate(book_category_model)
+                for book_category_model in (
+                    await session.exec(self._book_category_by_filter_statement(filter))
+                ).all()
             ]
 
     def get_book_categories_by_ids(self, ids: List[UUID]) -> List[BookCategory]:
@@ -1,31 +1,106 @@
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import base64
+import binascii
+import json
+import time
+from datetime import date, datetime
+from functools import lru_cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from uuid import UUID
 
+from elasticsearch import ApiError, AsyncElasticsearch
 from elasticsearch.exceptions import ConnectionError as ESConnectionError
+from pydantic import TypeAdapter
 from sqlalchemy.exc import NoResultFound
-from sqlmodel import and_, func, select
+from sqlalchemy.orm import load_only, selectinload
+from sqlmodel import func, or_, select, tuple_
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
 
-from src.application.exceptions import NotFoundException
+from src.application.exceptions import InvalidDataException, NotFoundException
 from src.application.ports.database.book import BookReadRepositoryPort
-from src.domain.entities.book import Book, BookSearchFilter
+from src.domain.entities.base import BaseEntity
+from src.domain.entities.book import (
+    Book,
+    BookFacets,
+    BookSearchFilter,
+    BookSearchResult,
+    BookSuggestion,
+    FacetBucket,
+)
+from src.domain.entities.book_data import BookData
 from src.domain.enums.book_type import BookType
+from src.domain.enums.suggestion_kind import SuggestionKind
+from src.domain.enums.total_relation import TotalRelation
+from src.infrastructure.adapters.database.cache.book_search_cache import (
+    BookSearchCache,
+)
+from src.infrastructure.adapters.database.db.loading import book_options
 from src.infrastructure.adapters.database.db.session import DatabaseSettings
-from src.infrastructure.adapters.database.elasticsearch.client import (
-    ElasticsearchClient,
+from src.infrastructure.adapters.database.elasticsearch.async_client import (
+    AsyncElasticsearchClient,
+)
+from src.infrastructure.adapters.database.elasticsearch.circuit_breaker import (
+    CircuitBreaker,
 )
 from src.infrastructure.adapters.database.models.author import Author as AuthorModel
 from src.infrastructure.adapters.database.models.book import Book as BookModel
 from src.infrastructure.adapters.database.models.book_category import (
     BookCategory as BookCategoryModel,
 )
+from src.infrastructure.adapters.database.models.book_data import (
+    BookData as BookDataModel,
+)
+from src.infrastructure.adapters.database.models.text_search import (
+    is_similar,
+    matches_fuzzy,
+    matches_text,
+    similarity_threshold,
+)
 from src.infrastructure.settings.config import ElasticsearchIndexConfig
 
+T = TypeVar("T")
+E = TypeVar("E", bound=BaseEntity)
+
+# Projected fields that are loaded through a relationship rather than a column
+RELATION_FIELDS = ("authors", "book_categories", "book_data")
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(entity: Type[BaseEntity], name: str) -> TypeAdapter:
+    return TypeAdapter(entity.model_fields[name].annotation)
+
+
+def _partial_entity(entity: Type[E], values: Dict[str, Any]) -> E:
+    """Build an entity holding only the given fields, each validated on its own"""
+    validated = {
+        name: _field_adapter(entity, name).validate_python(value)
+        for name, value in values.items()
+    }
+    return entity.model_construct(_fields_set=set(validated), **validated)
+
 
 class BookReadRepository(BookReadRepositoryPort):
-    def __init__(self, db: DatabaseSettings, elasticsearch_client: ElasticsearchClient):
+    def __init__(
+        self,
+        db: DatabaseSettings,
+        elasticsearch_client: AsyncElasticsearchClient,
+        search_cache: Optional[BookSearchCache] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
         super().__init__(db=db)
         self.es_client = elasticsearch_client
+        self.search_cache = search_cache
+        self.circuit_breaker = circuit_breaker
         self.es_config = ElasticsearchIndexConfig()
         self.es_index = self.es_config.books_index
 
@@ -156,6 +231,80 @@ class BookReadRepository(BookReadRepositoryPort):
 
         return Book.model_validate(book_data)
 
+    def _project_book(self, source: Dict[str, Any], fields: List[str]) -> Book:
+        """Build a Book holding only the projected fields of a document or row"""
+        values: Dict[str, Any] = {"id": source["id"]}
+        for field in fields:
+            if field in Book.model_fields:
+                values[field] = source.get(field)
+
+        data_fields = self._book_data_fields(fields)
+        if data_fields and "book_data" not in values:
+            values["book_data"] = [
+                _partial_entity(
+                    BookData,
+                    {name: data.get(name) for name in ["id", *data_fields]},
+                )
+                for data in source.get("book_data") or []
+            ]
+        return _partial_entity(Book, values)
+
+    def _book_data_fields(self, fields: List[str]) -> List[str]:
+        """Book data sub-fields selected as book_data.<name>"""
+        return [
+            field.split(".", 1)[1] for field in fields if field.startswith("book_data.")
+        ]
+
+    def _source_includes(self, fields: List[str]) -> List[str]:
+        """Document paths Elasticsearch has to return for a projection"""
+        includes = {"id", *fields}
+        if self._book_data_fields(fields):
+            includes.add("book_data.id")
+        return sorted(includes)
+
+    def _projection_options(self, fields: List[str], *columns: Any) -> List[Any]:
+        """Load only the columns and relationships a projection selects"""
+        columns += tuple(
+            getattr(BookModel, field)
+            for field in fields
+            if field in Book.model_fields and field not in RELATION_FIELDS
+        )
+        options: List[Any] = [load_only(BookModel.id, *columns)]
+        for relation in RELATION_FIELDS:
+            if relation in fields:
+                options.append(selectinload(getattr(BookModel, relation)))
+
+        data_fields = self._book_data_fields(fields)
+        if data_fields and "book_data" not in fields:
+            options.append(
+                selectinload(BookModel.book_data).load_only(  # type: ignore
+                    BookDataModel.id,
+                    *[getattr(BookDataModel, field) for field in data_fields],
+                ),
+            )
+        return options
+
+    def _book_model_to_source(
+        self,
+        book_model: BookModel,
+        fields: List[str],
+    ) -> Dict[str, Any]:
+        """Read the projected attributes of a row loaded with projection options"""
+        source = {
+            field: getattr(book_model, field)
+            for field in fields
+            if field in Book.model_fields
+        }
+        source["id"] = book_model.id
+
+        data_fields = self._book_data_fields(fields)
+        if data_fields and "book_data" not in fields:
+            source["book_data"] = [
+                {"id": data.id, **{name: getattr(data, name) for name in data_fields}}
+                for data in book_model.book_data
+            ]
+        return source
+
     def _build_elasticsearch_query(self, filter: BookSearchFilter) -> Dict[str, Any]:
         """Build Elasticsearch query from BookSearchFilter"""
         query: Dict[str, Any] = {"bool": {"must": []}}
@@ -194,18 +343,35 @@ class BookReadRepository(BookReadRepositoryPort):
                 },
             )
         if filter.text_query:
+            # Nested fields are only reachable through a nested query per path
+            text_fields = {
+                "book_data": ["book_data.title^2", "book_data.summary"],
+                "authors": ["authors.name"],
+                "book_categories": ["book_categories.title"],
+            }
             query["bool"]["must"].append(
                 {
-                    "multi_match": {
-                        "query": filter.text_query,
-                        "fields": [
-                            "book_data.title^2",
-                            "book_data.summary",
-                            "authors.name",
-                            "book_categories.title",
+                    "bool": {
+                        "should": [
+                            {
+                                "nested": {
+                                    "path": path,
+                                    "query": {
+                                        "multi_match": {
+                                            "query": filter.text_query,
+                                            "fields": fields,
+                                            "type": "best_fields",
+                                            "fuzziness": (
+                                                "AUTO" if filter.fuzzy_search else "0"
+                                            ),
+                                        },
+                                    },
+                                    "score_mode": "max",
+                                },
+                            }
+                            for path, fields in text_fields.items()
                         ],
-                        "type": "best_fields",
-                        "fuzziness": "AUTO" if filter.fuzzy_search else "0",
+                        "minimum_should_match": 1,
                     },
                 },
             )
@@ -299,27 +465,166 @@ class BookReadRepository(BookReadRepositoryPort):
 
         return query
 
-    def get_book_by_id(self, id: UUID) -> Book:
+    def _book_statement(
+        self,
+        statement: SelectOfScalar[BookModel],
+        fields: Optional[List[str]],
+        *columns: Any,
+    ) -> SelectOfScalar[BookModel]:
+        """Load the whole book, or only what a projection selects"""
+        if fields:
+            return statement.options(*self._projection_options(fields, *columns))
+        return statement.options(*book_options())
+
+    def _book_model_to_book(
+        self,
+        book_model: BookModel,
+        fields: Optional[List[str]],
+    ) -> Book:
+        if fields:
+            return self._project_book(
+                self._book_model_to_source(book_model, fields),
+                fields,
+            )
+        return Book.model_validate(book_model)
+
+    def get_book_by_id(self, id: UUID, fields: Optional[List[str]] = None) -> Book:
+        statement = self._book_statement(
+            select(BookModel).where(BookModel.id == id),
+            fields,
+        )
         with self.db.get_session(slave=True) as session:
             try:
-                book_model = session.exec(
-                    select(BookModel).where(BookModel.id == id),
-                ).one()
+                book_model = session.exec(statement).one()
+            except NoResultFound:
+                raise NotFoundException("Book not found")
+            return self._book_model_to_book(book_model, fields)
+
+    async def get_book_by_id_async(
+        self,
+        id: UUID,
+        fields: Optional[List[str]] = None,
+    ) -> Book:
+        statement = self._book_statement(
+            select(BookModel).where(BookModel.id == id),
+            fields,
+        )
+        async with self.db.get_async_session(slave=True) as session:
+            try:
+                book_model = (await session.exec(statement)).one()
             except NoResultFound:
                 raise NotFoundException("Book not found")
-            return Book.model_validate(book_model)
+            return self._book_model_to_book(book_model, fields)
 
-    def get_book_by_filter(
+    async def get_book_by_filter(
         self,
         filter: BookSearchFilter,
-    ) -> List[Book]:
+    ) -> BookSearchResult:
+        if self.search_cache is None:
+            return await self._search_books(filter)
+        key = self.search_cache.key(filter)
+        if key is None:
+            return await self._search_books(filter)
+        result = self.search_cache.get(key)
+        if result is None:
+            result = await self._search_books(filter)
+            self.search_cache.set(key, result)
+        return result
+
+    async def _search_books(self, filter: BookSearchFilter) -> BookSearchResult:
+        if self._is_keyset_cursor(filter.cursor):
+            return await self._search_books_postgresql(filter)
         try:
-            return self._search_books_elasticsearch(filter)
+            return await self._guarded_elasticsearch(
+                lambda: self._search_books_elasticsearch(filter),
+            )
+        except InvalidDataException:
+            raise
         except (ESConnectionError, Exception):
+            # A point in time only exists in Elasticsearch, so its walk cannot
+            # be resumed from PostgreSQL; a new walk starts a keyset one instead
+            if filter.cursor and filter.cursor != "*":
+                raise
             # Fallback to PostgreSQL if Elasticsearch is not available or fails
-            return self._search_books_postgresql(filter)
+            return await self._search_books_postgresql(filter)
+
+    async def _guarded_elasticsearch(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Await an Elasticsearch call unless the circuit breaker is open"""
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return await call()
+        if not breaker.allow_request():
+            raise ESConnectionError("Elasticsearch circuit is open")
+
+        started_at = time.monotonic()
+        # Stays None when the call is cancelled, e.g. by a client disconnect
+        failed: Optional[bool] = None
+        try:
+            result = await call()
+            failed = False
+            return result
+        except InvalidDataException:
+            failed = False
+            raise
+        except ApiError as e:
+            # A request Elasticsearch rejects, such as a page past the result
+            # window, says nothing about its health
+            failed = e.status_code == 429 or e.status_code >= 500
+            raise
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if failed is None:
+                # A cancelled HALF_OPEN probe must not hold its slot forever
+                breaker.release()
+            else:
+                breaker.record(time.monotonic() - started_at, failed=failed)
+
+    def _search_client(self) -> AsyncElasticsearch:
+        """Client used for searches, failing fast when a circuit breaker guards them"""
+        if self.circuit_breaker is None:
+            return self.es_client.client
+        return self.es_client.client.options(
+            request_timeout=self.circuit_breaker.config.request_timeout,
+            max_retries=0,
+            retry_on_timeout=False,
+        )
+
+    def _encode_cursor(self, pit_id: str, search_after: List[Any]) -> str:
+        """Serialize point in time and sort values into an opaque cursor"""
+        payload = json.dumps({"pit": pit_id, "search_after": search_after})
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def _decode_cursor(self, cursor: str) -> Tuple[Optional[str], List[Any]]:
+        """Read point in time and sort values back from a cursor"""
+        if cursor == "*":
+            return None, []
+        payload = self._cursor_payload(cursor)
+        try:
+            return payload["pit"], payload["search_after"]
+        except KeyError:
+            raise InvalidDataException("Invalid cursor")
 
-    def _search_books_elasticsearch(self, filter: BookSearchFilter) -> List[Book]:
+    def _cursor_payload(self, cursor: str) -> Dict[str, Any]:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValueError, TypeError):
+            raise InvalidDataException("Invalid cursor")
+        if not isinstance(payload, dict):
+            raise InvalidDataException("Invalid cursor")
+        return payload
+
+    def _is_keyset_cursor(self, cursor: Optional[str]) -> bool:
+        """Whether the cursor continues a walk started by the PostgreSQL fallback"""
+        if not cursor or cursor == "*":
+            return False
+        return "keyset" in self._cursor_payload(cursor)
+
+    async def _search_books_elasticsearch(
+        self,
+        filter: BookSearchFilter,
+    ) -> BookSearchResult:
         """Search books using Elasticsearch"""
         if not self.es_client:
             raise ESConnectionError("Elasticsearch client not available")
@@ -327,9 +632,6 @@ class BookReadRepository(BookReadRepositoryPort):
         # Build query from filter
         query = self._build_elasticsearch_query(filter)
 
-        # Add pagination
-        from_offset = (filter.page - 1) * filter.size
-
         # Add sorting
         sort = []
         if filter.sort_by:
@@ -340,12 +642,24 @@ class BookReadRepository(BookReadRepositoryPort):
         else:
             sort.append({"created_at": {"order": "desc"}})
 
-        body = {
+        body: Dict[str, Any] = {
             "query": query,
-            "from": from_offset,
             "size": filter.size,
             "sort": sort,
         }
+        if filter.fields:
+            body["_source"] = self._source_includes(filter.fields)
+        # Counting is exact up to the threshold and a lower bound beyond it
+        body["track_total_hits"] = self.es_config.track_total_hits
+        if filter.facets:
+            # Aggregations share the query, so the counts respect every active filter
+            body["aggs"] = self._build_facet_aggregations()
+
+        if filter.cursor:
+            return await self._search_books_elasticsearch_after(filter, body)
+
+        # Add pagination
+        body["from"] = (filter.page - 1) * filter.size
 
         # Add highlighting if requested
         if filter.highlight_fields:
@@ -354,64 +668,500 @@ class BookReadRepository(BookReadRepositoryPort):
             }
 
         # Execute search
-        response = self.es_client.client.search(
+        response = await self._search_client().search(
             index=self.es_index,
             body=body,
         )
 
         # Convert results to Book entities
-        books = []
-        for hit in response["hits"]["hits"]:
-            book = self._elasticsearch_document_to_book(hit["_source"])
-            books.append(book)
+        books = [self._hit_to_book(hit, filter) for hit in response["hits"]["hits"]]
+
+        total, total_relation = self._parse_total(response)
+        return BookSearchResult(
+            books=books,
+            facets=self._parse_facets(response),
+            total=total,
+            total_relation=total_relation,
+        )
+
+    async def _search_books_elasticsearch_after(
+        self,
+        filter: BookSearchFilter,
+        body: Dict[str, Any],
+    ) -> BookSearchResult:
+        """Walk the index with a point in time and search_after"""
+        keep_alive = self.es_config.point_in_time_keep_alive
+        pit_id, search_after = self._decode_cursor(filter.cursor)  # type: ignore
+        if pit_id is None:
+            response = await self._search_client().open_point_in_time(
+                index=self.es_index,
+                keep_alive=keep_alive,
+            )
+            pit_id = response["id"]
+
+        # id is unique, so pages never overlap or skip documents on ties
+        body["sort"].append({"id": {"order": "asc"}})
+        body["pit"] = {"id": pit_id, "keep_alive": keep_alive}
+        if search_after:
+            body["search_after"] = search_after
+            # Facets describe the whole walk and are only computed on its first page
+            body.pop("aggs", None)
+
+        response = await self._search_client().search(body=body)
+        pit_id = response.get("pit_id", pit_id)
+        hits = response["hits"]["hits"]
+        books = [self._hit_to_book(hit, filter) for hit in hits]
+        facets = self._parse_facets(response)
+        total, total_relation = self._parse_total(response)
+
+        if len(hits) < filter.size:
+            await self._search_client().close_point_in_time(id=pit_id)
+            return BookSearchResult(
+                books=books,
+                facets=facets,
+                total=total,
+                total_relation=total_relation,
+            )
+
+        return BookSearchResult(
+            books=books,
+            next_cursor=self._encode_cursor(pit_id, hits[-1]["sort"]),
+            facets=facets,
+            total=total,
+            total_relation=total_relation,
+        )
+
+    def _hit_to_book(self, hit: Dict[str, Any], filter: BookSearchFilter) -> Book:
+        if filter.fields:
+            return self._project_book(hit["_source"], filter.fields)
+        return self._elasticsearch_document_to_book(hit["_source"])
+
+    def _build_facet_aggregations(self) -> Dict[str, Any]:
+        """Aggregations behind the type, language, category, author and date facets"""
+        size = self.es_config.facet_size
+        return {
+            "type": {"terms": {"field": "type", "size": size}},
+            "language": self._nested_facet("book_data", "book_data.language", size),
+            "category": self._nested_facet(
+                "book_categories",
+                "book_categories.id",
+                size,
+                label_field="book_categories.title.keyword",
+            ),
+            "author": self._nested_facet(
+                "authors",
+                "authors.id",
+                size,
+                label_field="authors.name.keyword",
+            ),
+            "publish_date": {
+                "date_histogram": {
+                    "field": "publish_date",
+                    "calendar_interval": self.es_config.facet_publish_date_interval,
+                    "format": "yyyy-MM-dd",
+                    "min_doc_count": 1,
+                },
+            },
+        }
+
+    def _nested_facet(
+        self,
+        path: str,
+        field: str,
+        size: int,
+        label_field: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Terms over a nested field, counted in books rather than nested objects"""
+        aggs: Dict[str, Any] = {"books": {"reverse_nested": {}}}
+        if label_field:
+            aggs["label"] = {"terms": {"field": label_field, "size": 1}}
+        return {
+            "nested": {"path": path},
+            "aggs": {
+                "values": {
+                    "terms": {"field": field, "size": size, "order": {"books": "desc"}},
+                    "aggs": aggs,
+                },
+            },
+        }
 
-        return books
+    def _parse_total(
+        self,
+        response: Dict[str, Any],
+    ) -> Tuple[Optional[int], Optional[TotalRelation]]:
+        total = response["hits"].get("total")
+        if total is None:
+            return None, None
+        return total["value"], TotalRelation(total["relation"])
+
+    def _parse_facets(self, response: Dict[str, Any]) -> Optional[BookFacets]:
+        if "aggregations" not in response:
+            return None
+        aggregations = response["aggregations"]
+        return BookFacets(
+            type=[
+                FacetBucket(key=bucket["key"], count=bucket["doc_count"])
+                for bucket in aggregations["type"]["buckets"]
+            ],
+            language=self._parse_nested_facet(aggregations["language"]),
+            category=self._parse_nested_facet(aggregations["category"]),
+            author=self._parse_nested_facet(aggregations["author"]),
+            publish_date=[
+                FacetBucket(key=bucket["key_as_string"], count=bucket["doc_count"])
+                for bucket in aggregations["publish_date"]["buckets"]
+            ],
+        )
 
-    def _search_books_postgresql(
+    def _parse_nested_facet(self, aggregation: Dict[str, Any]) -> List[FacetBucket]:
+        buckets = []
+        for bucket in aggregation["values"]["buckets"]:
+            labels = bucket.get("label", {}).get("buckets", [])
+            buckets.append(
+                FacetBucket(
+                    key=bucket["key"],
+                    label=labels[0]["key"] if labels else None,
+                    count=bucket["books"]["doc_count"],
+                ),
+            )
+        return buckets
+
+    async def _search_books_postgresql(
         self,
-        filter: Optional[BookSearchFilter] = None,
-    ) -> List[Book]:
+        filter: BookSearchFilter,
+    ) -> BookSearchResult:
         """Search books using PostgreSQL (fallback method)"""
-        with self.db.get_session(slave=True) as session:
-            statement = select(BookModel)
-            if filter:
-                if filter.isbn_code:
-                    statement = statement.where(BookModel.isbn_code == filter.isbn_code)
-                if filter.editor:
-                    statement = statement.where(BookModel.editor == filter.editor)
-                if filter.edition:
-                    statement = statement.where(BookModel.edition == filter.edition)
-                if filter.type:
-                    statement = statement.where(BookModel.type == filter.type)
-                if filter.publish_date_from or filter.publish_date_to:
-                    if filter.publish_date_from:
-                        statement = statement.where(
-                            BookModel.publish_date >= filter.publish_date_from,
-                        )
-                    if filter.publish_date_to:
-                        statement = statement.where(
-                            BookModel.publish_date <= filter.publish_date_to,
-                        )
-                if filter.author_name:
+        sort_column, descending = self._postgresql_sort(filter)
+        statement = self._filter_books_postgresql(select(BookModel), filter)
+        async with self.db.get_async_session(slave=True) as session:
+            if filter.category_title:
+                await session.exec(similarity_threshold())  # type: ignore
+            total, total_relation = None, None
+            if not self._is_keyset_cursor(filter.cursor):
+                # Only the first page is counted, keyset pages must not scan
+                # the whole filtered set again
+                total, total_relation = await self._count_books_capped(
+                    session,
+                    statement,
+                )
+
+            # The sort key is read back for the next cursor, even when projected out
+            statement = self._book_statement(
+                statement,
+                filter.fields,
+                getattr(BookModel, sort_column.key),
+            )
+            # id breaks ties, so rows keep their order between pages
+            statement = statement.order_by(
+                sort_column.desc() if descending else sort_column.asc(),
+                BookModel.id.desc() if descending else BookModel.id.asc(),  # type: ignore
+            )
+            if filter.cursor:
+                after = self._decode_keyset_cursor(filter.cursor, sort_column)
+                if after is not None:
+                    key = tuple_(sort_column, BookModel.id)
                     statement = statement.where(
-                        and_(
-                            BookModel.authors.any(  # type: ignore
-                                AuthorModel.name.ilike(f"%{filter.author_name}%"),  # type: ignore
+                        key < tuple_(*after) if descending else key > tuple_(*after),
+                    )
+            else:
+                statement = statement.offset((filter.page - 1) * filter.size)
+            book_models = (await session.exec(statement.limit(filter.size))).all()
+            books = [
+                self._book_model_to_book(book_model, filter.fields)
+                for book_model in book_models
+            ]
+
+            next_cursor = None
+            if filter.cursor and len(book_models) == filter.size:
+                last = book_models[-1]
+                next_cursor = self._encode_keyset_cursor(
+                    getattr(last, sort_column.key),
+                    last.id,
+                )
+            return BookSearchResult(
+                books=books,
+                next_cursor=next_cursor,
+                total=total,
+                total_relation=total_relation,
+            )
+
+    async def _count_books_capped(
+        self,
+        session: AsyncSession,
+        statement: Any,
+    ) -> Tuple[int, TotalRelation]:
+        """Count like track_total_hits: exact up to the threshold, a lower bound beyond"""
+        cap = self.es_config.track_total_hits
+        total = (
+            await session.exec(
+                select(func.count()).select_from(statement.limit(cap + 1).subquery()),
+            )
+        ).one()
+        if total > cap:
+            return cap, TotalRelation.GTE
+        return total, TotalRelation.EQ
+
+    def _postgresql_sort(self, filter: BookSearchFilter) -> Tuple[Any, bool]:
+        """Sort column and direction, falling back to newest first like Elasticsearch"""
+        column = BookModel.__table__.c.get(filter.sort_by or "")  # type: ignore
+        if column is None:
+            column = BookModel.__table__.c.created_at  # type: ignore
+        return column, filter.sort_order != "asc"
+
+    def _encode_keyset_cursor(self, value: Any, id: UUID) -> str:
+        """Serialize the sort key of the last row into an opaque cursor"""
+        if isinstance(value, (date, datetime)):
+            value = value.isoformat()
+        payload = json.dumps({"keyset": [value, str(id)]})
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def _decode_keyset_cursor(
+        self,
+        cursor: str,
+        sort_column: Any,
+    ) -> Optional[Tuple[Any, UUID]]:
+        """Sort key to resume after, None when the walk starts"""
+        if cursor == "*":
+            return None
+        value, id = self._cursor_payload(cursor).get("keyset") or (None, None)
+        if id is None:
+            raise InvalidDataException("Invalid cursor")
+        try:
+            python_type = sort_column.type.python_type
+            if python_type in (date, datetime) and value is not None:
+                value = python_type.fromisoformat(value)
+            return value, UUID(id)
+        except (ValueError, TypeError, NotImplementedError):
+            raise InvalidDataException("Invalid cursor")
+
+    def _filter_books_postgresql(
+        self,
+        statement: SelectOfScalar[BookModel],
+        filter: BookSearchFilter,
+    ) -> SelectOfScalar[BookModel]:
+        """Apply the search filter to a PostgreSQL statement"""
+        if filter.isbn_code:
+            statement = statement.where(BookModel.isbn_code == filter.isbn_code)
+        if filter.editor:
+            statement = statement.where(BookModel.editor == filter.editor)
+        if filter.edition:
+            statement = statement.where(BookModel.edition == filter.edition)
+        if filter.type:
+            statement = statement.where(BookModel.type == filter.type)
+        if filter.publish_date_from or filter.publish_date_to:
+            if filter.publish_date_from:
+                statement = statement.where(
+                    BookModel.publish_date >= filter.publish_date_from,
+                )
+            if filter.publish_date_to:
+                statement = statement.where(
+                    BookModel.publish_date <= filter.publish_date_to,
+                )
+        if filter.text_query:
+            # Same fields as the nested queries of the Elasticsearch text query
+            statement = statement.where(
+                or_(
+                    BookModel.book_data.any(  # type: ignore
+                        or_(
+                            self._text_predicate(
+                                BookDataModel.title,
+                                filter.text_query,
+                                filter.fuzzy_search,
+                            ),
+                            self._text_predicate(
+                                BookDataModel.summary,
+                                filter.text_query,
+                                filter.fuzzy_search,
                             ),
                         ),
-                    )
-                if filter.category_title:
-                    statement = statement.where(
-                        func.similarity(
+                    ),
+                    BookModel.authors.any(  # type: ignore
+                        self._text_predicate(
+                            AuthorModel.name,
+                            filter.text_query,
+                            filter.fuzzy_search,
+                        ),
+                    ),
+                    BookModel.book_categories.any(  # type: ignore
+                        self._text_predicate(
                             BookCategoryModel.title,
-                            filter.category_title,
-                        )
-                        > 0.2,
-                    )
+                            filter.text_query,
+                            filter.fuzzy_search,
+                        ),
+                    ),
+                ),
+            )
+        if filter.title_query:
+            statement = statement.where(
+                BookModel.book_data.any(  # type: ignore
+                    self._text_predicate(
+                        BookDataModel.title,
+                        filter.title_query,
+                        filter.fuzzy_search,
+                    ),
+                ),
+            )
+        if filter.summary_query:
+            statement = statement.where(
+                BookModel.book_data.any(  # type: ignore
+                    self._text_predicate(
+                        BookDataModel.summary,
+                        filter.summary_query,
+                        filter.fuzzy_search,
+                    ),
+                ),
+            )
+        if filter.languages:
+            statement = statement.where(
+                BookModel.book_data.any(  # type: ignore
+                    BookDataModel.language.in_(filter.languages),  # type: ignore
+                ),
+            )
+        if filter.author_name:
+            statement = statement.where(
+                BookModel.authors.any(  # type: ignore
+                    self._text_predicate(
+                        AuthorModel.name,
+                        filter.author_name,
+                        filter.fuzzy_search,
+                    ),
+                ),
+            )
+        if filter.category_title:
+            statement = statement.where(
+                BookModel.book_categories.any(  # type: ignore
+                    is_similar(BookCategoryModel.title, filter.category_title),
+                ),
+            )
+        return statement
+
+    def _text_predicate(self, column: Any, query: str, fuzzy: bool) -> Any:
+        """Full-text match of a column, widened to trigram similarity when fuzzy"""
+        if fuzzy:
+            return or_(matches_text(column, query), matches_fuzzy(column, query))
+        return matches_text(column, query)
+
+    async def count_books(self, filter: BookSearchFilter) -> int:
+        try:
+            return await self._guarded_elasticsearch(
+                lambda: self._count_books_elasticsearch(filter),
+            )
+        except (ESConnectionError, Exception):
+            # Fallback to PostgreSQL if Elasticsearch is not available or fails
+            return await self._count_books_postgresql(filter)
+
+    async def _count_books_elasticsearch(self, filter: BookSearchFilter) -> int:
+        """Count matching books with _count, without fetching or scoring hits"""
+        response = await self._search_client().count(
+            index=self.es_index,
+            body={"query": self._build_elasticsearch_query(filter)},
+        )
+        return response["count"]
+
+    async def _count_books_postgresql(self, filter: BookSearchFilter) -> int:
+        """Count matching books using PostgreSQL (fallback method)"""
+        statement = self._filter_books_postgresql(select(BookModel), filter)
+        async with self.db.get_async_session(slave=True) as session:
+            if filter.category_title:
+                await session.exec(similarity_threshold())  # type: ignore
+            return (
+                await session.exec(
+                    select(func.count()).select_from(statement.subquery()),
+                )
+            ).one()
 
-                # Add pagination
-                offset = (filter.page - 1) * filter.size
-                statement = statement.offset(offset).limit(filter.size)
+    async def suggest_books(self, prefix: str, size: int) -> List[BookSuggestion]:
+        try:
+            return await self._guarded_elasticsearch(
+                lambda: self._suggest_books_elasticsearch(prefix, size),
+            )
+        except (ESConnectionError, Exception):
+            # Fallback to PostgreSQL if Elasticsearch is not available or fails
+            return await self._suggest_books_postgresql(prefix, size)
+
+    async def _suggest_books_elasticsearch(
+        self,
+        prefix: str,
+        size: int,
+    ) -> List[BookSuggestion]:
+        """Suggest titles, authors and categories from the completion field"""
+        body = {
+            "_source": [
+                "authors.id",
+                "authors.name",
+                "book_categories.id",
+                "book_categories.title",
+            ],
+            "suggest": {
+                kind: {
+                    "prefix": prefix,
+                    "completion": {
+                        "field": "suggest",
+                        "size": size,
+                        "skip_duplicates": True,
+                        "contexts": {"kind": [kind]},
+                    },
+                }
+                for kind in SuggestionKind
+            },
+        }
+        response = await self._search_client().search(
+            index=self.es_index,
+            body=body,
+            filter_path=["suggest"],
+        )
+
+        suggestions = []
+        for kind in SuggestionKind:
+            for option in response["suggest"][kind][0]["options"]:
+                suggestions.append(
+                    BookSuggestion(
+                        id=self._suggestion_id(kind, option),
+                        text=option["text"],
+                        kind=kind,
+                    ),
+                )
+        return suggestions
+
+    def _suggestion_id(self, kind: SuggestionKind, option: Dict[str, Any]) -> str:
+        """Resolve the id of the entity whose text matched the prefix"""
+        if kind == SuggestionKind.AUTHOR:
+            entities, text_field = option["_source"].get("authors", []), "name"
+        elif kind == SuggestionKind.CATEGORY:
+            entities, text_field = option["_source"].get("book_categories", []), "title"
+        else:
+            return option["_id"]
+        return next(
+            (
+                entity["id"]
+                for entity in entities
+                if entity[text_field] == option["text"]
+            ),
+            option["_id"],
+        )
 
-            books = session.exec(statement).all()
-            return [Book.model_validate(book) for book in books]
+    async def _suggest_books_postgresql(
+        self,
+        prefix: str,
+        size: int,
+    ) -> List[BookSuggestion]:
+        """Suggest titles, authors and categories by prefix (fallback method)"""
+        sources = [
+            (SuggestionKind.TITLE, BookDataModel.book_id, BookDataModel.title),
+            (SuggestionKind.AUTHOR, AuthorModel.id, AuthorModel.name),
+            (SuggestionKind.CATEGORY, BookCategoryModel.id, BookCategoryModel.title),
+        ]
+        suggestions = []
+        async with self.db.get_async_session(slave=True) as session:
+            for kind, id_column, text_column in sources:
+                rows = (
+                    await session.exec(
+                        select(id_column, text_column)  # type: ignore
+                        .where(text_column.istartswith(prefix, autoescape=True))  # type: ignore
+                        .order_by(text_column)
+                        .limit(size),
+                    )
+                ).all()
+                suggestions += [
+                    BookSuggestion(id=id, text=text, kind=kind) for id, text in rows
+                ]
+        return suggestions
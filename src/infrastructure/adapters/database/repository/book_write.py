@@ -1,15 +1,26 @@
-from typing import Any, Dict
+from collections import defaultdict
+from typing import Dict, List, Optional
 
+from elasticsearch import ConflictError
 from sqlalchemy.exc import NoResultFound
-from sqlmodel import and_, delete, select, update
+from sqlmodel import Session, delete, select
 
 from src.application.exceptions import OptimisticLockException
 from src.application.ports.database.book import BookWriteRepositoryPort
 from src.domain.entities.book import Book
+from src.infrastructure.adapters.database.db.loading import book_options
 from src.infrastructure.adapters.database.db.session import DatabaseSettings
+from src.infrastructure.adapters.database.db.upsert import versioned_upsert
+from src.infrastructure.adapters.database.elasticsearch.bulk_indexer import (
+    BulkIndexer,
+)
 from src.infrastructure.adapters.database.elasticsearch.client import (
     ElasticsearchClient,
 )
+from src.infrastructure.adapters.database.elasticsearch.documents import (
+    EXTERNAL_VERSION_TYPE,
+    book_to_elasticsearch_document,
+)
 from src.infrastructure.adapters.database.models.author_book_link import (
     AuthorBookLink as AuthorBookLinkModel,
 )
@@ -24,78 +35,28 @@ from src.infrastructure.settings.config import ElasticsearchIndexConfig
 
 
 class BookWriteRepository(BookWriteRepositoryPort):
-    def __init__(self, db: DatabaseSettings, elasticsearch_client: ElasticsearchClient):
+    def __init__(
+        self,
+        db: DatabaseSettings,
+        elasticsearch_client: ElasticsearchClient,
+        bulk_indexer: Optional[BulkIndexer] = None,
+    ):
         super().__init__(db=db)
         self.es_client = elasticsearch_client
+        self.bulk_indexer = bulk_indexer
         self.es_config = ElasticsearchIndexConfig()
         self.es_index = self.es_config.books_index
 
-    def _book_to_elasticsearch_document(self, book: Book) -> Dict[str, Any]:
-        """Convert Book entity to Elasticsearch document"""
-        doc = {
-            "id": str(book.id),
-            "version": book.version,
-            "isbn_code": book.isbn_code,
-            "editor": book.editor,
-            "edition": book.edition,
-            "type": book.type,
-            "publish_date": (
-                book.publish_date.isoformat() if book.publish_date else None
-            ),
-            "created_at": book.created_at.strftime("%Y-%m-%dT%H:%M:%S")
-            + f".{book.created_at.microsecond // 1000:03d}Z",
-            "updated_at": book.updated_at.strftime("%Y-%m-%dT%H:%M:%S")
-            + f".{book.updated_at.microsecond // 1000:03d}Z",
-            "created_by": book.created_by,
-            "updated_by": book.updated_by,
-            "author_ids": (
-                [str(author_id) for author_id in book.author_ids]
-                if book.author_ids
-                else []
-            ),
-            "category_ids": (
-                [str(cat_id) for cat_id in book.category_ids]
-                if book.category_ids
-                else []
-            ),
-        }
-
-        # Add nested objects for search
-        if book.authors:
-            doc["authors"] = [
-                {
-                    "id": str(author.id),
-                    "name": author.name,
-                }
-                for author in book.authors
-            ]
-
-        if book.book_categories:
-            doc["book_categories"] = [
-                {
-                    "id": str(category.id),
-                    "title": category.title,
-                    "description": category.description,
-                }
-                for category in book.book_categories
-            ]
-
-        if book.book_data:
-            doc["book_data"] = [
-                {
-                    "id": str(data.id),
-                    "title": data.title,
-                    "summary": data.summary,
-                    "language": data.language,
-                }
-                for data in book.book_data
-            ]
-
-        return doc
-
     def upsert_book(self, book: Book) -> Book:
         # Save to PostgreSQL first (source of truth)
-        book_entity = self._upsert_book_postgresql(book)
+        try:
+            book_entity = self._upsert_book_postgresql(book)
+        except OptimisticLockException:
+            # A redelivered message was committed before its document failed
+            # to index, so the stored row is indexed again instead
+            book_entity = self._committed_book(book)
+            if book_entity is None:
+                raise
 
         # Index in Elasticsearch
         self._upsert_book_elasticsearch(book_entity)
@@ -104,117 +65,183 @@ class BookWriteRepository(BookWriteRepositoryPort):
 
     def _upsert_book_postgresql(self, book: Book) -> Book:
         """Upsert book in PostgreSQL database"""
-        author_link_models = [
+        with self.db.get_session() as session:
+            book_model = session.exec(
+                versioned_upsert(BookModel, book),  # type: ignore
+            ).scalar_one_or_none()
+            if book_model is None:
+                raise OptimisticLockException(
+                    f"""Optimistic lock failed for book {book.id}.
+                    Expected version {book.version - 1},
+                    but data may have been modified by another transaction.""",
+                )
+
+            self._sync_author_links(session, book)
+            self._sync_book_category_links(session, book)
+            self._sync_book_data(session, book)
+            session.commit()
+            book_model = session.exec(
+                select(BookModel)
+                .where(BookModel.id == book.id)
+                .options(*book_options())
+                .execution_options(populate_existing=True),
+            ).one()
+
+            return Book.model_validate(book_model)
+
+    def _committed_book(self, book: Book) -> Optional[Book]:
+        """The stored book when it already holds the version of book"""
+        with self.db.get_session() as session:
+            book_model = session.exec(
+                select(BookModel)
+                .where(BookModel.id == book.id, BookModel.version == book.version)
+                .options(*book_options()),
+            ).one_or_none()
+            if book_model is None:
+                return None
+            return Book.model_validate(book_model)
+
+    def _sync_author_links(self, session: Session, book: Book) -> None:
+        """Insert and delete only the author links that changed"""
+        existing_ids = set(
+            session.exec(
+                select(AuthorBookLinkModel.author_id).where(
+                    AuthorBookLinkModel.book_id == book.id,
+                ),
+            ).all(),
+        )
+        wanted_ids = {author.id for author in book.authors or []}
+
+        removed_ids = existing_ids - wanted_ids
+        if removed_ids:
+            session.exec(
+                delete(AuthorBookLinkModel).where(  # type: ignore
+                    AuthorBookLinkModel.book_id == book.id,
+                    AuthorBookLinkModel.author_id.in_(removed_ids),  # type: ignore
+                ),
+            )
+        session.add_all(
             AuthorBookLinkModel(
-                author_id=author.id,
+                author_id=author_id,
                 book_id=book.id,
                 created_by=book.created_by,
                 created_at=book.created_at,
                 updated_by=book.updated_by,
                 updated_at=book.updated_at,
             )
-            for author in book.authors  # type: ignore
-        ]
-        book_category_link_models = [
-            BookCategoryBookLinkModel(
-                book_category_id=book_category.id,
-                book_id=book.id,
-                created_by=book.created_by,
-                created_at=book.created_at,
-                updated_by=book.updated_by,
-                updated_at=book.updated_at,
+            for author_id in wanted_ids - existing_ids
+        )
+
+    def _sync_book_category_links(self, session: Session, book: Book) -> None:
+        """Insert and delete only the book category links that changed"""
+        existing_ids = set(
+            session.exec(
+                select(BookCategoryBookLinkModel.book_category_id).where(
+                    BookCategoryBookLinkModel.book_id == book.id,
+                ),
+            ).all(),
+        )
+        wanted_ids = {book_category.id for book_category in book.book_categories or []}
+
+        removed_ids = existing_ids - wanted_ids
+        if removed_ids:
+            session.exec(
+                delete(BookCategoryBookLinkModel).where(  # type: ignore
+                    BookCategoryBookLinkModel.book_id == book.id,
+                    BookCategoryBookLinkModel.book_category_id.in_(removed_ids),  # type: ignore
+                ),
             )
-            for book_category in book.book_categories  # type: ignore
-        ]
-        book_data_models = [
-            BookDataModel(
-                id=book_data.id,
-                summary=book_data.summary,
-                title=book_data.title,
-                language=book_data.language,
+        session.add_all(
+            BookCategoryBookLinkModel(
+                book_category_id=book_category_id,
                 book_id=book.id,
                 created_by=book.created_by,
                 created_at=book.created_at,
                 updated_by=book.updated_by,
                 updated_at=book.updated_at,
             )
-            for book_data in book.book_data  # type: ignore
-        ]
+            for book_category_id in wanted_ids - existing_ids
+        )
 
-        with self.db.get_session() as session:
-            existing_book = session.get(BookModel, book.id)
-            if existing_book:
-                # Update fields
-                statement = (
-                    update(BookModel)
-                    .where(
-                        and_(
-                            BookModel.id == book.id,
-                            BookModel.version == book.version - 1,
-                        ),
-                    )
-                    .values(
-                        **book.model_dump(
-                            exclude={
-                                "category_ids",
-                                "author_ids",
-                                "book_data",
-                                "book_categories",
-                                "authors",
-                            },
-                            exclude_none=True,
-                            exclude_unset=True,
-                            mode="json",
-                        )
-                    )
-                )
-                result = session.exec(statement)  # type: ignore
-                if result.rowcount == 0:
-                    raise OptimisticLockException(
-                        f"""Optimistic lock failed for book {book.id}.
-                        Expected version {book.version - 1},
-                        but data may have been modified by another transaction.""",
-                    )
-            else:
-                existing_book = BookModel(
-                    id=book.id,
-                    isbn_code=book.isbn_code,
-                    editor=book.editor,
-                    edition=book.edition,
-                    type=book.type,
-                    version=book.version,
-                    publish_date=book.publish_date,
-                    created_by=book.created_by,
-                    created_at=book.created_at,
-                    updated_by=book.updated_by,
-                    updated_at=book.updated_at,
-                )
-                session.add(existing_book)
+    def _sync_book_data(self, session: Session, book: Book) -> None:
+        """Insert, update and delete only the book data rows that changed.
 
-            session.flush()
+        Rows are matched on their language, the upsert payloads carry no book
+        data ids. Unchanged rows are left alone; the changed ones are flushed
+        by the unit of work, which batches the statements of each kind.
+        """
+        existing: Dict[str, List[BookDataModel]] = defaultdict(list)
+        for book_data_model in session.exec(
+            select(BookDataModel)
+            .where(BookDataModel.book_id == book.id)
+            .order_by(BookDataModel.id),  # type: ignore
+        ).all():
+            existing[book_data_model.language].append(book_data_model)
 
-            session.exec(delete(AuthorBookLinkModel).where(AuthorBookLinkModel.book_id == book.id))  # type: ignore
-            session.exec(delete(BookDataModel).where(BookDataModel.book_id == book.id))  # type: ignore
-            session.exec(delete(BookCategoryBookLinkModel).where(BookCategoryBookLinkModel.book_id == book.id))  # type: ignore
-            session.flush()
-            session.add_all(author_link_models)
-            session.add_all(book_category_link_models)
-            session.add_all(book_data_models)
-            session.commit()
-            session.refresh(existing_book)
+        for book_data in book.book_data or []:
+            same_language = existing.get(book_data.language)
+            if not same_language:
+                session.add(
+                    BookDataModel(
+                        id=book_data.id,
+                        summary=book_data.summary,
+                        title=book_data.title,
+                        language=book_data.language,
+                        book_id=book.id,
+                        created_by=book.created_by,
+                        created_at=book.created_at,
+                        updated_by=book.updated_by,
+                        updated_at=book.updated_at,
+                    ),
+                )
+                continue
+            book_data_model = same_language.pop(0)
+            if (book_data_model.summary, book_data_model.title) != (
+                book_data.summary,
+                book_data.title,
+            ):
+                book_data_model.summary = book_data.summary
+                book_data_model.title = book_data.title
+                book_data_model.updated_by = book.updated_by
+                book_data_model.updated_at = book.updated_at
 
-            return Book.model_validate(existing_book)
+        removed_ids = [
+            book_data_model.id
+            for same_language in existing.values()
+            for book_data_model in same_language
+        ]
+        if removed_ids:
+            session.exec(
+                delete(BookDataModel).where(  # type: ignore
+                    BookDataModel.id.in_(removed_ids),  # type: ignore
+                ),
+            )
 
     def _upsert_book_elasticsearch(self, book: Book) -> None:
         """Index book in Elasticsearch"""
-        es_document = self._book_to_elasticsearch_document(book)
+        es_document = book_to_elasticsearch_document(book)
 
-        self.es_client.client.index(  # type: ignore
-            index=self.es_index,
-            id=str(book.id),
-            body=es_document,
-            refresh="wait_for",
-        )
+        if self.bulk_indexer is not None:
+            self.bulk_indexer.index(
+                self.es_index,
+                str(book.id),
+                es_document,
+                book.version,
+            )
+            return
+
+        try:
+            self.es_client.client.index(  # type: ignore
+                index=self.es_index,
+                id=str(book.id),
+                body=es_document,
+                version=book.version,
+                version_type=EXTERNAL_VERSION_TYPE,
+                refresh="wait_for",
+            )
+        except ConflictError:
+            # The index already holds a newer version of the book
+            pass
 
     def delete_book(self, id: str) -> None:
         # Delete from PostgreSQL first (source of truth)
@@ -236,7 +263,12 @@ class BookWriteRepository(BookWriteRepositoryPort):
 
     def _delete_book_elasticsearch(self, id: str) -> None:
         """Delete book from Elasticsearch"""
+        if self.bulk_indexer is not None:
+            self.bulk_indexer.delete(self.es_index, id)
+            return
+
         self.es_client.client.delete(  # type: ignore
             index=self.es_index,
             id=id,
+            refresh="wait_for",
         )
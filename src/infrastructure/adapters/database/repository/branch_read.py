@@ -3,28 +3,58 @@ from uuid import UUID
 
 from sqlalchemy.exc import NoResultFound
 from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
 
 from src.application.exceptions import NotFoundException
 from src.application.ports.database.branch import BranchReadRepositoryPort
 from src.domain.entities.branch import Branch, BranchFilter
 from src.infrastructure.adapters.database.db.session import DatabaseSettings
 from src.infrastructure.adapters.database.models.branch import Branch as BranchModel
+from src.infrastructure.adapters.database.models.text_search import rank_by_similarity
 
 
 class BranchReadRepository(BranchReadRepositoryPort):
     def __init__(self, db: DatabaseSettings) -> None:
         self.db = db
 
+    def _branch_by_filter_statement(
+        self,
+        filter: BranchFilter,
+    ) -> SelectOfScalar[BranchModel]:
+        statement = select(BranchModel)
+        if filter.name:
+            # Substring matches are kept, the trigram index answers the ILIKE
+            statement = rank_by_similarity(
+                statement.where(
+                    BranchModel.name.ilike(f"%{filter.name}%"),  # type: ignore
+                ),
+                BranchModel,
+                "name",
+                filter.name,
+                filter.cursor,
+            )
+        else:
+            if filter.cursor:
+                statement = statement.where(BranchModel.id > filter.cursor)
+            statement = statement.order_by(BranchModel.id)  # type: ignore
+        return statement.limit(filter.limit)
+
     def get_branch_by_filter(self, filter: BranchFilter) -> List[Branch]:
         with self.db.get_session(slave=True) as session:
-            statement = select(BranchModel)
-            if filter.name:
-                statement = statement.where(
-                    BranchModel.name.ilike(f"%{filter.name}%"),  # type: ignore
-                )
             return [
                 Branch.model_validate(branch_model)
-                for branch_model in session.exec(statement).all()
+                for branch_model in session.exec(
+                    self._branch_by_filter_statement(filter),
+                ).all()
+            ]
+
+    async def get_branch_by_filter_async(self, filter: BranchFilter) -> List[Branch]:
+        async with self.db.get_async_session(slave=True) as session:
+            return [
+                Branch.model_validate(branch_model)
+                for branch_model in (
+                    await session.exec(self._branch_by_filter_statement(filter))
+                ).all()
             ]
 
     def get_branch_by_id(self, id: UUID) -> Branch:
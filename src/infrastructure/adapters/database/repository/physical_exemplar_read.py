@@ -1,23 +1,55 @@
+from typing import AsyncIterator, Dict, List
 from uuid import UUID
 
 from sqlalchemy.exc import NoResultFound
 from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
 
 from src.application.exceptions import NotFoundException
 from src.application.ports.database.physical_exemplar import (
     PhysicalExemplarReadRepositoryPort,
 )
-from src.domain.entities.physical_exemplar import PhysicalExemplar
+from src.domain.entities.book_availability import (
+    BookAvailability,
+    BranchAvailability,
+)
+from src.domain.entities.physical_exemplar import (
+    PhysicalExemplar,
+    PhysicalExemplarBranchFilter,
+)
+from src.infrastructure.adapters.database.db.loading import (
+    physical_exemplar_listing_options,
+    physical_exemplar_options,
+)
+from src.infrastructure.adapters.database.db.partitions import for_branch
 from src.infrastructure.adapters.database.db.session import DatabaseSettings
+from src.infrastructure.adapters.database.models.book_availability import (
+    BookAvailability as BookAvailabilityModel,
+)
 from src.infrastructure.adapters.database.models.physical_exemplar import (
     PhysicalExemplar as PhysicalExemplarModel,
 )
 
+# Rows fetched from the server-side cursor at a time
+STREAM_BATCH_SIZE = 1000
+
 
 class PhysicalExemplarReadRepository(PhysicalExemplarReadRepositoryPort):
     def __init__(self, db: DatabaseSettings) -> None:
         self.db = db
 
+    def _physical_exemplar_by_book_and_branch_statement(
+        self,
+        book_id: UUID,
+        branch_id: UUID,
+    ) -> SelectOfScalar[PhysicalExemplarModel]:
+        return for_branch(
+            select(PhysicalExemplarModel)
+            .where(PhysicalExemplarModel.book_id == book_id)
+            .options(*physical_exemplar_options()),
+            branch_id,
+        )
+
     def get_physical_exemplar_by_book_and_branch(
         self,
         book_id: UUID,
@@ -26,11 +58,110 @@ class PhysicalExemplarReadRepository(PhysicalExemplarReadRepositoryPort):
         with self.db.get_session(slave=True) as session:
             try:
                 physical_exemplar_model = session.exec(
-                    select(PhysicalExemplarModel).where(
-                        PhysicalExemplarModel.book_id == book_id,
-                        PhysicalExemplarModel.branch_id == branch_id,
+                    self._physical_exemplar_by_book_and_branch_statement(
+                        book_id,
+                        branch_id,
                     ),
                 ).one()
             except NoResultFound:
                 raise NotFoundException("Physical exemplar not found")
             return PhysicalExemplar.model_validate(physical_exemplar_model)
+
+    async def get_physical_exemplar_by_book_and_branch_async(
+        self,
+        book_id: UUID,
+        branch_id: UUID,
+    ) -> PhysicalExemplar:
+        async with self.db.get_async_session(slave=True) as session:
+            try:
+                physical_exemplar_model = (
+                    await session.exec(
+                        self._physical_exemplar_by_book_and_branch_statement(
+                            book_id,
+                            branch_id,
+                        ),
+                    )
+                ).one()
+            except NoResultFound:
+                raise NotFoundException("Physical exemplar not found")
+            return PhysicalExemplar.model_validate(physical_exemplar_model)
+
+    async def get_books_availability_async(
+        self,
+        book_ids: List[UUID],
+    ) -> List[BookAvailability]:
+        """Availability of every book, in the order of book_ids.
+
+        Reads the book_availability summary, one primary key range per book,
+        instead of counting the exemplars of every branch partition.
+        """
+        availability: Dict[UUID, BookAvailability] = {
+            book_id: BookAvailability(book_id=book_id) for book_id in book_ids
+        }
+        async with self.db.get_async_session(slave=True) as session:
+            rows = (
+                await session.exec(
+                    select(BookAvailabilityModel)
+                    .where(
+                        BookAvailabilityModel.book_id.in_(availability),  # type: ignore
+                        BookAvailabilityModel.total_count > 0,
+                    )
+                    .order_by(
+                        BookAvailabilityModel.book_id,  # type: ignore
+                        BookAvailabilityModel.branch_id,  # type: ignore
+                    ),
+                )
+            ).all()
+        for row in rows:
+            book = availability[row.book_id]
+            book.available += row.available_count
+            book.total += row.total_count
+            book.branches.append(
+                BranchAvailability(
+                    branch_id=row.branch_id,
+                    available=row.available_count,
+                    total=row.total_count,
+                ),
+            )
+        return list(availability.values())
+
+    def _physical_exemplars_by_branch_statement(
+        self,
+        filter: PhysicalExemplarBranchFilter,
+    ) -> SelectOfScalar[PhysicalExemplarModel]:
+        statement = for_branch(
+            select(PhysicalExemplarModel).options(
+                *physical_exemplar_listing_options(),
+            ),
+            filter.branch_id,
+        )
+        for field in ("available", "floor", "room", "bookshelf"):
+            value = getattr(filter, field)
+            if value is not None:
+                statement = statement.where(
+                    getattr(PhysicalExemplarModel, field) == value,
+                )
+        if filter.cursor:
+            statement = statement.where(PhysicalExemplarModel.id > filter.cursor)
+        statement = statement.order_by(PhysicalExemplarModel.id)  # type: ignore
+        if filter.limit:
+            statement = statement.limit(filter.limit)
+        return statement
+
+    async def stream_physical_exemplars_by_branch_async(
+        self,
+        filter: PhysicalExemplarBranchFilter,
+    ) -> AsyncIterator[PhysicalExemplar]:
+        """Exemplars of the branch partition, read through a server-side cursor.
+
+        Only STREAM_BATCH_SIZE rows are held at a time, the replica session
+        stays open until the caller is done iterating.
+        """
+        async with self.db.get_async_session(slave=True) as session:
+            physical_exemplar_models = await session.stream_scalars(
+                self._physical_exemplars_by_branch_statement(filter).execution_options(
+                    yield_per=STREAM_BATCH_SIZE,
+                ),
+            )
+            async for physical_exemplar_model in physical_exemplar_models:
+                yield PhysicalExemplar.model_validate(physical_exemplar_model)
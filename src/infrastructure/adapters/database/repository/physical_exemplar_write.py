@@ -1,11 +1,21 @@
-from sqlmodel import and_, select, update
+from typing import Dict, Tuple
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, select
 
 from src.application.exceptions import OptimisticLockException
 from src.application.ports.database.physical_exemplar import (
     PhysicalExemplarWriteRepositoryPort,
 )
 from src.domain.entities.physical_exemplar import PhysicalExemplar
+from src.infrastructure.adapters.database.db.loading import physical_exemplar_options
+from src.infrastructure.adapters.database.db.partitions import for_branch
 from src.infrastructure.adapters.database.db.session import DatabaseSettings
+from src.infrastructure.adapters.database.db.upsert import versioned_upsert
+from src.infrastructure.adapters.database.models.book_availability import (
+    BookAvailability as BookAvailabilityModel,
+)
 from src.infrastructure.adapters.database.models.physical_exemplar import (
     PhysicalExemplar as PhysicalExemplarModel,
 )
@@ -20,60 +30,73 @@ class PhysicalExemplarWriteRepository(PhysicalExemplarWriteRepositoryPort):
         physical_exemplar: PhysicalExemplar,
     ) -> PhysicalExemplar:
         with self.db.get_session() as session:
-            # First try to find by book_id and branch_id for idempotency
+            # Locks the current row, so its counts are taken back exactly once
+            previous = session.exec(
+                for_branch(
+                    select(
+                        PhysicalExemplarModel.book_id,
+                        PhysicalExemplarModel.available,
+                    ).where(PhysicalExemplarModel.id == physical_exemplar.id),
+                    physical_exemplar.branch_id,
+                ).with_for_update(),
+            ).one_or_none()
             physical_exemplar_model = session.exec(
-                select(PhysicalExemplarModel).where(
-                    PhysicalExemplarModel.book_id == physical_exemplar.book_id,
-                    PhysicalExemplarModel.branch_id == physical_exemplar.branch_id,
-                ),
-            ).first()
-
-            if physical_exemplar_model:
-                statement = (
-                    update(PhysicalExemplarModel)
-                    .where(
-                        and_(
-                            PhysicalExemplarModel.id == physical_exemplar.id,
-                            PhysicalExemplarModel.version
-                            == physical_exemplar.version - 1,
-                        ),
-                    )
-                    .values(
-                        **physical_exemplar.model_dump(
-                            exclude={"book", "branch"},
-                            exclude_none=True,
-                            exclude_unset=True,
-                            mode="json",
-                        )
-                    )
-                )
-                result = session.exec(statement)  # type: ignore
-                if result.rowcount == 0:  # type: ignore
-                    raise OptimisticLockException(
-                        f"""Optimistic lock failed for physical exemplar {physical_exemplar.id}.
-                        Expected version {physical_exemplar.version - 1},
-                        but data may have been modified by another transaction.""",
-                    )
-            else:
-                # Create new record
-                physical_exemplar_model = PhysicalExemplarModel(
-                    id=physical_exemplar.id,
-                    available=physical_exemplar.available,
-                    room=physical_exemplar.room,
-                    floor=physical_exemplar.floor,
-                    bookshelf=physical_exemplar.bookshelf,
-                    book_id=physical_exemplar.book_id,
-                    version=physical_exemplar.version,
-                    branch_id=physical_exemplar.branch_id,
-                    created_at=physical_exemplar.created_at,
-                    created_by=physical_exemplar.created_by,
-                    updated_at=physical_exemplar.updated_at,
-                    updated_by=physical_exemplar.updated_by,
+                versioned_upsert(  # type: ignore
+                    PhysicalExemplarModel,
+                    physical_exemplar,
+                    # A branch holds one exemplar of a book, a second id for
+                    # the same book and branch is an optimistic lock failure
+                    conflict_columns=("book_id", "branch_id"),
+                ).options(*physical_exemplar_options()),
+            ).scalar_one_or_none()
+            if physical_exemplar_model is None:
+                raise OptimisticLockException(
+                    f"""Optimistic lock failed for physical exemplar {physical_exemplar.id}.
+                    Expected version {physical_exemplar.version - 1},
+                    but data may have been modified by another transaction.""",
                 )
 
-                session.add(physical_exemplar_model)
-
-            session.flush()
-            session.commit()
-            session.refresh(physical_exemplar_model)
+            # (book_id, branch_id) -> (available, total) change
+            changes: Dict[Tuple[UUID, UUID], Tuple[int, int]] = {}
+            branch_id = physical_exemplar_model.branch_id
+            if previous is not None and previous.book_id is not None:
+                changes[(previous.book_id, branch_id)] = (-int(previous.available), -1)
+            key = (physical_exemplar_model.book_id, branch_id)
+            available, total = changes.get(key, (0, 0))
+            changes[key] = (
+                available + int(physical_exemplar_model.available),
+                total + 1,
+            )
+            self._update_availability(session, changes)
             return PhysicalExemplar.model_validate(physical_exemplar_model)
+
+    def _update_availability(
+        self,
+        session: Session,
+        changes: Dict[Tuple[UUID, UUID], Tuple[int, int]],
+    ) -> None:
+        """Apply the count changes to book_availability in this transaction"""
+        rows = [
+            {
+                "book_id": book_id,
+                "branch_id": branch_id,
+                "available_count": available,
+                "total_count": total,
+            }
+            for (book_id, branch_id), (available, total) in changes.items()
+            if available or total
+        ]
+        if not rows:
+            return
+        statement = insert(BookAvailabilityModel).values(rows)
+        session.exec(  # type: ignore
+            statement.on_conflict_do_update(
+                index_elements=["book_id", "branch_id"],
+                set_={
+                    "available_count": BookAvailabilityModel.available_count
+                    + statement.excluded.available_count,
+                    "total_count": BookAvailabilityModel.total_count
+                    + statement.excluded.total_count,
+                },
+            ),
+        )
@@ -1,13 +1,56 @@
-from fastapi import APIRouter
+from typing import Any, Dict
+
+from fastapi import APIRouter, Request
 from fastapi import status as http_status
 
 router = APIRouter()
 
 
 @router.get("/health", status_code=http_status.HTTP_200_OK)
-def health_check() -> None:
+def health_check(request: Request) -> Dict[str, Any]:
     """
     Checks the health of a project.
 
-    It returns 200 if the project is healthy.
+    It returns 200 if the project is healthy. Searches keep being served from
+    PostgreSQL while the Elasticsearch circuit is open.
+    """
+    breaker = getattr(request.app.state, "elasticsearch_circuit_breaker", None)
+    return {
+        "status": "ok",
+        "elasticsearch_circuit": breaker.snapshot() if breaker else None,
+    }
+
+
+@router.get("/metrics/search-cache", status_code=http_status.HTTP_200_OK)
+def search_cache_metrics(request: Request) -> Dict[str, Any]:
+    """
+    Hit, miss, eviction and invalidation counters of the book search cache.
+    """
+    cache = getattr(request.app.state, "book_search_cache", None)
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.snapshot()}
+
+
+@router.get("/metrics/database-pool", status_code=http_status.HTTP_200_OK)
+def database_pool_metrics(request: Request) -> Dict[str, Any]:
+    """
+    Checkout wait, timeouts, checked-out connections and overflow in use of
+    every database engine pool.
+    """
+    db = getattr(request.app.state, "database", None)
+    if db is None:
+        return {}
+    return db.pool_snapshot()
+
+
+@router.get("/metrics/database-replica", status_code=http_status.HTTP_200_OK)
+def database_replica_metrics(request: Request) -> Dict[str, Any]:
+    """
+    Last probed replay position, lag and health of every replica, the reads
+    each one is serving and how many went to the master because none could.
     """
+    db = getattr(request.app.state, "database", None)
+    if db is None:
+        return {}
+    return db.replica_snapshot()
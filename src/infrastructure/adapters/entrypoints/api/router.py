@@ -5,9 +5,11 @@ from src.application.usecase.author.delete_author_publish import DeleteAuthorPub
 from src.application.usecase.author.filter_author import FilterAuthor
 from src.application.usecase.author.get_by_id import GetAuthorById
 from src.application.usecase.author.update_author_produce import UpdateAuthorProduce
+from src.application.usecase.book.count_book import CountBook
 from src.application.usecase.book.delete_book_publish import DeleteBookPublish
 from src.application.usecase.book.filter_book import FilterBook
 from src.application.usecase.book.get_book_by_id import GetBookById
+from src.application.usecase.book.suggest_book import SuggestBook
 from src.application.usecase.book.upsert_book_produce import UpsertBookProduce
 from src.application.usecase.book_category.book_category_filter import (
     FilterBookCategory,
@@ -17,9 +19,18 @@ from src.application.usecase.book_category.book_category_publish import (
 )
 from src.application.usecase.branch.filter_branch import FilterBranch
 from src.application.usecase.branch.upsert_branch_produce import UpsertBranchProduce
+from src.application.usecase.physical_exemplar.get_book_availability import (
+    GetBookAvailability,
+)
+from src.application.usecase.physical_exemplar.get_books_availability import (
+    GetBooksAvailability,
+)
 from src.application.usecase.physical_exemplar.get_physical_exemplar_by_book_and_branch import (
     GetPhysicalExemplarByBookAndBranch,
 )
+from src.application.usecase.physical_exemplar.stream_physical_exemplars_by_branch import (
+    StreamPhysicalExemplarsByBranch,
+)
 from src.application.usecase.physical_exemplar.upsert_physical_exemplar_produce import (
     UpsertPhysicalExemplarProduce,
 )
@@ -54,6 +65,9 @@ from src.infrastructure.adapters.entrypoints.api.routes.author.get_by_id_view im
 from src.infrastructure.adapters.entrypoints.api.routes.author.update_author_view import (
     PublishUpdateAuthorView,
 )
+from src.infrastructure.adapters.entrypoints.api.routes.book.count_book_view import (
+    CountBookView,
+)
 from src.infrastructure.adapters.entrypoints.api.routes.book.create_book_view import (
     PublishCreateBookView,
 )
@@ -66,6 +80,12 @@ from src.infrastructure.adapters.entrypoints.api.routes.book.filter_book import
 from src.infrastructure.adapters.entrypoints.api.routes.book.get_book_view import (
     GetBookView,
 )
+from src.infrastructure.adapters.entrypoints.api.routes.book.search_book_view import (
+    SearchBookView,
+)
+from src.infrastructure.adapters.entrypoints.api.routes.book.suggest_book_view import (
+    SuggestBookView,
+)
 from src.infrastructure.adapters.entrypoints.api.routes.book.update_book_view import (
     PublishUpdateBookView,
 )
@@ -84,9 +104,18 @@ from src.infrastructure.adapters.entrypoints.api.routes.branch.filter_branch_vie
 from src.infrastructure.adapters.entrypoints.api.routes.physical_exemplar.create_physical_exemplar_publish_view import (
     PublishCreatePhysicalExemplarView,
 )
+from src.infrastructure.adapters.entrypoints.api.routes.physical_exemplar.get_book_availability_view import (
+    GetBookAvailabilityView,
+)
+from src.infrastructure.adapters.entrypoints.api.routes.physical_exemplar.get_books_availability_view import (
+    GetBooksAvailabilityView,
+)
 from src.infrastructure.adapters.entrypoints.api.routes.physical_exemplar.get_physical_exemplar_view import (
     GetPhysicalExemplarView,
 )
+from src.infrastructure.adapters.entrypoints.api.routes.physical_exemplar.stream_branch_physical_exemplars_view import (
+    StreamBranchPhysicalExemplarsView,
+)
 from src.infrastructure.adapters.entrypoints.producer import Producer
 from src.infrastructure.adapters.producer.author_producer import AuthorProducerAdapter
 from src.infrastructure.adapters.producer.book_category_producer import (
@@ -123,6 +152,19 @@ class Initializer:
         self.publish_create_book_view = PublishCreateBookView(self.upsert_book_use_case)
         self.api_router.include_router(self.publish_create_book_view.router)  # type: ignore
 
+        # Static book routes must be registered before /book/{id}
+        self.suggest_book_use_case = SuggestBook(book_repository=book_read_repository)
+        self.suggest_book_view = SuggestBookView(self.suggest_book_use_case)
+        self.api_router.include_router(self.suggest_book_view.router)  # type: ignore
+
+        self.count_book_use_case = CountBook(book_repository=book_read_repository)
+        self.count_book_view = CountBookView(self.count_book_use_case)
+        self.api_router.include_router(self.count_book_view.router)  # type: ignore
+
+        self.search_book_use_case = FilterBook(book_repository=book_read_repository)
+        self.search_book_view = SearchBookView(self.search_book_use_case)
+        self.api_router.include_router(self.search_book_view.router)  # type: ignore
+
         self.get_book_by_id_use_case = GetBookById(book_repository=book_read_repository)
         self.get_book_by_id_view = GetBookView(self.get_book_by_id_use_case)
         self.api_router.include_router(self.get_book_by_id_view.router)  # type: ignore
@@ -240,3 +282,29 @@ class Initializer:
             self.get_physical_exemplar_use_case,
         )
         self.api_router.include_router(self.get_physical_exemplar_view.router)  # type: ignore
+
+        self.get_book_availability_use_case = GetBookAvailability(
+            repository=physical_exemplar_read_repository,
+        )
+        self.get_book_availability_view = GetBookAvailabilityView(
+            self.get_book_availability_use_case,
+        )
+        self.api_router.include_router(self.get_book_availability_view.router)  # type: ignore
+
+        self.get_books_availability_use_case = GetBooksAvailability(
+            repository=physical_exemplar_read_repository,
+        )
+        self.get_books_availability_view = GetBooksAvailabilityView(
+            self.get_books_availability_use_case,
+        )
+        self.api_router.include_router(self.get_books_availability_view.router)  # type: ignore
+
+        self.stream_physical_exemplars_by_branch_use_case = (
+            StreamPhysicalExemplarsByBranch(
+                repository=physical_exemplar_read_repository,
+            )
+        )
+        self.stream_branch_physical_exemplars_view = StreamBranchPhysicalExemplarsView(
+            self.stream_physical_exemplars_by_branch_use_case,
+        )
+        self.api_router.include_router(self.stream_branch_physical_exemplars_view.router)  # type: ignore
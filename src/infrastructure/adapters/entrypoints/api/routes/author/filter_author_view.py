@@ -1,6 +1,6 @@
 from typing import Annotated, List
 
-from fastapi import HTTPException, Query, status
+from fastapi import HTTPException, Query, Response, status
 
 from src.application.dto.author import AuthorFilter, AuthorResponse
 from src.application.exceptions import NotFoundException
@@ -27,14 +27,18 @@ class FilterAuthorView(AuthorBasicRouter):
                 response_model_exclude_unset=True,
                 response_model_exclude_none=True,
                 methods=["GET"],
-                description="Get Author by filter",
+                description="Get Author by filter, paged by id (cursor=X-Next-Cursor)",
             )
 
-    def _call_use_case(
+    async def _call_use_case(
         self,
         filter: Annotated[AuthorFilter, Query()],
+        response: Response,
     ) -> List[AuthorResponse]:
-        authors = self.use_case.execute(filter)  # type: ignore
+        authors = await self.use_case.execute(filter)  # type: ignore
+        # A full page may be followed by another one
+        if len(authors) == filter.limit:
+            response.headers["X-Next-Cursor"] = str(authors[-1].id)
         try:
             return [AuthorResponse.model_validate(author) for author in authors]
         except NotFoundException as e:
@@ -32,7 +32,7 @@ class GetAuthorView(AuthorBasicRouter):
 
     async def _call_use_case(self, id: UUID) -> AuthorResponse:
         try:
-            author = self.use_case.execute(id)  # type: ignore
+            author = await self.use_case.execute(id)  # type: ignore
             return AuthorResponse.model_validate(author)  # type: ignore
         except NotFoundException as e:
             raise HTTPException(status_code=404, detail=e.message)
@@ -35,7 +35,7 @@ class PublishUpdateAuthorView(AuthorBasicRouter):
 
     async def _call_use_case(self, payload: AuthorUpsert, id: UUID) -> ProcessingAuthor:
         try:
-            existing_author = self.validate_author.execute(id)
+            existing_author = await self.validate_author.execute(id)
         except NotFoundException as e:
             raise HTTPException(status_code=404, detail=e.message)
 
@@ -1,9 +1,11 @@
 from abc import ABC
-from typing import Any
+from typing import Any, List, Optional
 
 from fastapi import APIRouter
 
+from src.application.dto.book_dto import BookProjectionResponse, BookResponse
 from src.application.ports.route.basic_router import BaseRouterView
+from src.domain.entities.book import Book
 
 
 class BookBasicRouter(BaseRouterView, ABC):
@@ -15,3 +17,16 @@ class BookBasicRouter(BaseRouterView, ABC):
         name: str = "book",
     ) -> None:
         super().__init__(name, use_case)
+
+    def _book_response(
+        self,
+        book: Book,
+        fields: Optional[List[str]] = None,
+    ) -> BookResponse | BookProjectionResponse:
+        """Full book, or only the fields selected with fields="""
+        if fields:
+            # Fields outside the projection still hold their defaults on the entity
+            return BookProjectionResponse.model_validate(
+                book.model_dump(exclude_unset=True),
+            )
+        return BookResponse.model_validate(book)
@@ -0,0 +1,35 @@
+from typing import Annotated
+
+from fastapi import Query, status
+
+from src.application.dto.book_dto import BookCountResponse, BookFilter
+from src.application.usecase.book.count_book import CountBook
+from src.infrastructure.adapters.entrypoints.api.routes.book.book_basic_router import (
+    BookBasicRouter,
+)
+
+
+class CountBookView(BookBasicRouter):
+    def __init__(self, use_case: CountBook):
+        super().__init__(use_case=use_case)
+
+    def _add_to_router(self) -> None:
+        """
+        Add to view to router
+        """
+        if self.router is not None:
+            self.router.add_api_route(
+                "/count",
+                self._call_use_case,  # type: ignore
+                status_code=status.HTTP_200_OK,
+                response_model=BookCountResponse,
+                methods=["GET"],
+                description="Count Books matching a filter without fetching them",
+            )
+
+    async def _call_use_case(
+        self,
+        filter: Annotated[BookFilter, Query()],
+    ) -> BookCountResponse:
+        count = await self.use_case.execute(filter)  # type: ignore
+        return BookCountResponse(count=count)
@@ -1,8 +1,14 @@
 from typing import Annotated, List
 
-from fastapi import Query, status
+from fastapi import HTTPException, Query, Response, status
 
-from src.application.dto.book_dto import BookFilter, BookResponse
+from src.application.dto.book_dto import (
+    AnyBookResponse,
+    BookFilter,
+    BookProjectionResponse,
+    BookResponse,
+)
+from src.application.exceptions import InvalidDataException
 from src.application.usecase.book.filter_book import FilterBook
 from src.infrastructure.adapters.entrypoints.api.routes.book.book_basic_router import (
     BookBasicRouter,
@@ -22,16 +28,25 @@ class FilterBookView(BookBasicRouter):
                 "/",
                 self._call_use_case,  # type: ignore
                 status_code=status.HTTP_200_OK,
-                response_model=List[BookResponse],
+                response_model=List[AnyBookResponse],
                 response_model_exclude_unset=True,
                 response_model_exclude_none=True,
                 methods=["GET"],
-                description="Filter Books",
+                description="Filter Books (cursor='*' starts a deep pagination walk)",
             )
 
-    def _call_use_case(
+    async def _call_use_case(
         self,
         filter: Annotated[BookFilter, Query()],
-    ) -> List[BookResponse]:
-        books = self.use_case.execute(filter)  # type: ignore
-        return [BookResponse.model_validate(book) for book in books]
+        response: Response,
+    ) -> List[BookResponse | BookProjectionResponse]:
+        try:
+            result = await self.use_case.execute(filter)  # type: ignore
+        except InvalidDataException as e:
+            raise HTTPException(status_code=400, detail=e.message)
+        if result.next_cursor:
+            response.headers["X-Next-Cursor"] = result.next_cursor
+        if result.total is not None:
+            response.headers["X-Total-Count"] = str(result.total)
+            response.headers["X-Total-Relation"] = str(result.total_relation)
+        return [self._book_response(book, filter.fields) for book in result.books]
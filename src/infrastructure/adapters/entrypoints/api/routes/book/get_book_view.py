@@ -1,8 +1,14 @@
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Query, status
 
-from src.application.dto.book_dto import BookResponse
+from src.application.dto.book_dto import (
+    AnyBookResponse,
+    BookProjection,
+    BookProjectionResponse,
+    BookResponse,
+)
 from src.application.exceptions import NotFoundException
 from src.application.usecase.book.get_book_by_id import GetBookById
 from src.infrastructure.adapters.entrypoints.api.routes.book.book_basic_router import (
@@ -23,16 +29,20 @@ class GetBookView(BookBasicRouter):
                 "/{id}",
                 self._call_use_case,  # type: ignore
                 status_code=status.HTTP_200_OK,
-                response_model=BookResponse,
+                response_model=AnyBookResponse,
                 response_model_exclude_unset=True,
                 response_model_exclude_none=True,
                 methods=["GET"],
                 description="Get Book by ID",
             )
 
-    def _call_use_case(self, id: UUID) -> BookResponse:
+    async def _call_use_case(
+        self,
+        id: UUID,
+        projection: Annotated[BookProjection, Query()],
+    ) -> BookResponse | BookProjectionResponse:
         try:
-            book = self.use_case.execute(id)  # type: ignore
-            return BookResponse.model_validate(book)
+            book = await self.use_case.execute(id, projection.fields)  # type: ignore
+            return self._book_response(book, projection.fields)
         except NotFoundException as e:
             raise HTTPException(status_code=404, detail=e.message)
@@ -0,0 +1,46 @@
+from typing import Annotated
+
+from fastapi import HTTPException, Query, status
+
+from src.application.dto.book_dto import BookSearchQuery, BookSearchResponse
+from src.application.exceptions import InvalidDataException
+from src.application.usecase.book.filter_book import FilterBook
+from src.infrastructure.adapters.entrypoints.api.routes.book.book_basic_router import (
+    BookBasicRouter,
+)
+
+
+class SearchBookView(BookBasicRouter):
+    def __init__(self, use_case: FilterBook):
+        super().__init__(use_case=use_case)
+
+    def _add_to_router(self) -> None:
+        """
+        Add to view to router
+        """
+        if self.router is not None:
+            self.router.add_api_route(
+                "/search",
+                self._call_use_case,  # type: ignore
+                status_code=status.HTTP_200_OK,
+                response_model=BookSearchResponse,
+                response_model_exclude_none=True,
+                methods=["GET"],
+                description="Search Books with cursor and optional facet counts",
+            )
+
+    async def _call_use_case(
+        self,
+        filter: Annotated[BookSearchQuery, Query()],
+    ) -> BookSearchResponse:
+        try:
+            result = await self.use_case.execute(filter)  # type: ignore
+        except InvalidDataException as e:
+            raise HTTPException(status_code=400, detail=e.message)
+        return BookSearchResponse(
+            books=[self._book_response(book, filter.fields) for book in result.books],
+            next_cursor=result.next_cursor,
+            facets=result.facets,  # type: ignore
+            total=result.total,
+            total_relation=result.total_relation,
+        )
@@ -0,0 +1,38 @@
+from typing import Annotated, List
+
+from fastapi import Query, status
+
+from src.application.dto.book_dto import BookSuggestFilter, BookSuggestionResponse
+from src.application.usecase.book.suggest_book import SuggestBook
+from src.infrastructure.adapters.entrypoints.api.routes.book.book_basic_router import (
+    BookBasicRouter,
+)
+
+
+class SuggestBookView(BookBasicRouter):
+    def __init__(self, use_case: SuggestBook):
+        super().__init__(use_case=use_case)
+
+    def _add_to_router(self) -> None:
+        """
+        Add to view to router
+        """
+        if self.router is not None:
+            self.router.add_api_route(
+                "/suggest",
+                self._call_use_case,  # type: ignore
+                status_code=status.HTTP_200_OK,
+                response_model=List[BookSuggestionResponse],
+                methods=["GET"],
+                description="Typeahead suggestions for book titles, authors and categories",
+            )
+
+    async def _call_use_case(
+        self,
+        filter: Annotated[BookSuggestFilter, Query()],
+    ) -> List[BookSuggestionResponse]:
+        suggestions = await self.use_case.execute(filter)  # type: ignore
+        return [
+            BookSuggestionResponse.model_validate(suggestion)
+            for suggestion in suggestions
+        ]
@@ -38,7 +38,7 @@ class PublishUpdateBookView(BookBasicRouter):
     async def _call_use_case(self, payload: BookDto, id: UUID) -> ProcessingBook:
         user = payload.user
         try:
-            old_book = self.validate_book.execute(id)
+            old_book = await self.validate_book.execute(id)
             user = old_book.created_by
         except NotFoundException as e:
             raise HTTPException(status_code=404, detail=e.message)
@@ -1,6 +1,6 @@
 from typing import Annotated, List
 
-from fastapi import Query, status
+from fastapi import Query, Response, status
 
 from src.application.dto.book_category import BookCategoryResponse
 from src.application.usecase.book_category.book_category_filter import (
@@ -26,14 +26,18 @@ class FilterBookCategoryView(BookCategoryBasicRouter):
                 response_model_exclude_unset=True,
                 response_model_exclude_none=True,
                 methods=["GET"],
-                description="Get Book Category by ID",
+                description="Get Book Category by filter, paged by id (cursor=X-Next-Cursor)",
             )
 
-    def _call_use_case(
+    async def _call_use_case(
         self,
         filter: Annotated[BookCategoryFilter, Query()],
+        response: Response,
     ) -> List[BookCategoryResponse]:
+        book_categories = await self.use_case.execute(filter)  # type: ignore
+        if len(book_categories) == filter.limit:
+            response.headers["X-Next-Cursor"] = str(book_categories[-1].id)
         return [
             BookCategoryResponse.model_validate(book_category)
-            for book_category in self.use_case.execute(filter)  # type: ignore
+            for book_category in book_categories
         ]
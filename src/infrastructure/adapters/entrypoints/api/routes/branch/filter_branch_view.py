@@ -1,6 +1,6 @@
 from typing import Annotated, List
 
-from fastapi import Query, status
+from fastapi import Query, Response, status
 
 from src.application.dto.branch import BranchFilter, BranchResponse
 from src.application.usecase.branch.filter_branch import FilterBranch
@@ -24,13 +24,16 @@ class FilterBranchView(BranchBasicRouter):
                 response_model_exclude_unset=True,
                 response_model_exclude_none=True,
                 methods=["GET"],
-                description="Get Branch by filter",
+                description="Get Branch by filter, paged by id (cursor=X-Next-Cursor)",
             )
 
-    def _call_use_case(
+    async def _call_use_case(
         self,
         filter: Annotated[BranchFilter, Query()],
+        response: Response,
     ) -> List[BranchResponse]:
         filter_entity = BranchFilterEntity.model_validate(filter)
-        branches = self.use_case.execute(filter_entity)  # type: ignore
+        branches = await self.use_case.execute(filter_entity)  # type: ignore
+        if len(branches) == filter.limit:
+            response.headers["X-Next-Cursor"] = str(branches[-1].id)
         return [BranchResponse.model_validate(branch) for branch in branches]
@@ -0,0 +1,34 @@
+from uuid import UUID
+
+from fastapi import status
+
+from src.application.dto.physical_exemplar import BookAvailabilityResponse
+from src.application.usecase.physical_exemplar.get_book_availability import (
+    GetBookAvailability,
+)
+from src.infrastructure.adapters.entrypoints.api.routes.physical_exemplar.physical_exemplar_basic_router import (
+    PhysicalExemplarBasicRouter,
+)
+
+
+class GetBookAvailabilityView(PhysicalExemplarBasicRouter):
+    def __init__(self, use_case: GetBookAvailability):
+        super().__init__(use_case=use_case)
+
+    def _add_to_router(self) -> None:
+        """
+        Add to view to router
+        """
+        if self.router is not None:
+            self.router.add_api_route(
+                "/book/{book_id}/availability/",
+                self._call_use_case,
+                status_code=status.HTTP_200_OK,
+                response_model=BookAvailabilityResponse,
+                methods=["GET"],
+                description="Available and total physical exemplars of a book per branch",
+            )
+
+    async def _call_use_case(self, book_id: UUID) -> BookAvailabilityResponse:
+        availability = await self.use_case.execute(book_id=book_id)  # type: ignore
+        return BookAvailabilityResponse.model_validate(availability)
@@ -0,0 +1,42 @@
+from typing import Annotated, List
+from uuid import UUID
+
+from fastapi import HTTPException, Query, status
+
+from src.application.dto.physical_exemplar import BookAvailabilityResponse
+from src.application.exceptions import InvalidDataException
+from src.application.usecase.physical_exemplar.get_books_availability import (
+    GetBooksAvailability,
+)
+from src.infrastructure.adapters.entrypoints.api.routes.physical_exemplar.physical_exemplar_basic_router import (
+    PhysicalExemplarBasicRouter,
+)
+
+
+class GetBooksAvailabilityView(PhysicalExemplarBasicRouter):
+    def __init__(self, use_case: GetBooksAvailability):
+        super().__init__(use_case=use_case)
+
+    def _add_to_router(self) -> None:
+        """
+        Add to view to router
+        """
+        if self.router is not None:
+            self.router.add_api_route(
+                "/book/availability/",
+                self._call_use_case,
+                status_code=status.HTTP_200_OK,
+                response_model=List[BookAvailabilityResponse],
+                methods=["GET"],
+                description="Availability of many books at once (?book_ids=...&book_ids=...)",
+            )
+
+    async def _call_use_case(
+        self,
+        book_ids: Annotated[List[UUID], Query()],
+    ) -> List[BookAvailabilityResponse]:
+        try:
+            availability = await self.use_case.execute(book_ids=book_ids)  # type: ignore
+        except InvalidDataException as e:
+            raise HTTPException(status_code=400, detail=e.message)
+        return [BookAvailabilityResponse.model_validate(book) for book in availability]
@@ -32,13 +32,13 @@ class GetPhysicalExemplarView(PhysicalExemplarBasicRouter):
                 description="Get Physical Exemplar by Book and Branch ID",
             )
 
-    def _call_use_case(
+    async def _call_use_case(
         self,
         book_id: UUID,
         branch_id: UUID,
     ) -> PhysicalExemplarResponse:
         try:
-            physical_exemplar = self.use_case.execute(  # type: ignore
+            physical_exemplar = await self.use_case.execute(  # type: ignore
                 book_id=book_id,
                 branch_id=branch_id,
             )
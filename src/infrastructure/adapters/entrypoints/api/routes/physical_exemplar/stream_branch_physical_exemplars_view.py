@@ -0,0 +1,84 @@
+from typing import Annotated, AsyncIterator
+from uuid import UUID
+
+from fastapi import Query, status
+from fastapi.responses import StreamingResponse
+
+from src.application.dto.physical_exemplar import (
+    PhysicalExemplarBranchFilter,
+    PhysicalExemplarLine,
+)
+from src.application.usecase.physical_exemplar.stream_physical_exemplars_by_branch import (
+    StreamPhysicalExemplarsByBranch,
+)
+from src.domain.entities.physical_exemplar import (
+    PhysicalExemplar,
+)
+from src.domain.entities.physical_exemplar import (
+    PhysicalExemplarBranchFilter as PhysicalExemplarBranchFilterEntity,
+)
+from src.infrastructure.adapters.entrypoints.api.routes.physical_exemplar.physical_exemplar_basic_router import (
+    PhysicalExemplarBasicRouter,
+)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Lines sent per chunk, a write per line would dominate large branches
+LINES_PER_CHUNK = 100
+
+
+async def ndjson_lines(
+    physical_exemplars: AsyncIterator[PhysicalExemplar],
+) -> AsyncIterator[str]:
+    lines = []
+    async for physical_exemplar in physical_exemplars:
+        lines.append(
+            PhysicalExemplarLine.model_validate(physical_exemplar).model_dump_json(),
+        )
+        if len(lines) == LINES_PER_CHUNK:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+class StreamBranchPhysicalExemplarsView(PhysicalExemplarBasicRouter):
+    def __init__(self, use_case: StreamPhysicalExemplarsByBranch):
+        super().__init__(use_case=use_case)
+
+    def _add_to_router(self) -> None:
+        """
+        Add to view to router
+        """
+        if self.router is not None:
+            self.router.add_api_route(
+                "/branch/{branch_id}/",
+                self._call_use_case,
+                status_code=status.HTTP_200_OK,
+                response_class=StreamingResponse,
+                responses={
+                    status.HTTP_200_OK: {
+                        "content": {NDJSON_MEDIA_TYPE: {}},
+                        "description": "One PhysicalExemplarLine per line",
+                    },
+                },
+                methods=["GET"],
+                description=(
+                    "Stream the Physical Exemplars of a Branch as NDJSON, ordered "
+                    "by id (cursor=id of the last line received)"
+                ),
+            )
+
+    async def _call_use_case(
+        self,
+        branch_id: UUID,
+        filter: Annotated[PhysicalExemplarBranchFilter, Query()],
+    ) -> StreamingResponse:
+        filter_entity = PhysicalExemplarBranchFilterEntity(
+            branch_id=branch_id,
+            **filter.model_dump(),
+        )
+        physical_exemplars = await self.use_case.execute(filter_entity)  # type: ignore
+        return StreamingResponse(
+            ndjson_lines(physical_exemplars),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
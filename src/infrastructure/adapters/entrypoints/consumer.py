@@ -2,6 +2,8 @@ import json
 import logging
 from contextvars import ContextVar
 from datetime import datetime, timezone
+from functools import partial
+from typing import Any, Dict
 
 from pika import BlockingConnection, ConnectionParameters
 from pika.adapters.blocking_connection import BlockingChannel
@@ -28,7 +30,13 @@ from src.domain.entities.book import Book
 from src.domain.entities.book_category import BookCategory
 from src.domain.entities.branch import Branch
 from src.domain.entities.physical_exemplar import PhysicalExemplar
+from src.infrastructure.adapters.database.cache.book_search_cache import (
+    book_search_attributes,
+)
 from src.infrastructure.adapters.database.db.session import DatabaseSettings
+from src.infrastructure.adapters.database.elasticsearch.bulk_indexer import (
+    BulkIndexer,
+)
 from src.infrastructure.adapters.database.elasticsearch.client import (
     ElasticsearchClient,
 )
@@ -44,7 +52,6 @@ from src.infrastructure.adapters.database.repository.book_category_read import (
 from src.infrastructure.adapters.database.repository.book_category_write import (
     BookCategoryWriteRepository,
 )
-from src.infrastructure.adapters.database.repository.book_read import BookReadRepository
 from src.infrastructure.adapters.database.repository.book_write import (
     BookWriteRepository,
 )
@@ -67,10 +74,13 @@ from src.infrastructure.adapters.producer.physical_exemplar_producer import (
     PhysicalExemplarProducerAdapter,
 )
 from src.infrastructure.settings.config import (
+    BookSearchCacheConfig,
     DatabaseConfig,
+    ElasticsearchBulkConfig,
     ElasticsearchConfig,
     LogstashConfig,
     ProducerConfig,
+    ReplicaRoutingConfig,
     SlaveDatabaseConfig,
     SystemConfig,
 )
@@ -85,20 +95,28 @@ db = DatabaseSettings(
     user=db_config.user,
     slave_host=slave_db_config.host,
     slave_port=slave_db_config.port,
+    replicas=slave_db_config.replicas,
+    pool=db_config,
+    slave_pool=slave_db_config,
+    routing=ReplicaRoutingConfig(),
 )
 
 # Initialize Elasticsearch client
 elasticsearch_config = ElasticsearchConfig()
 elasticsearch_client = ElasticsearchClient(elasticsearch_config)
+elasticsearch_bulk_config = ElasticsearchBulkConfig()
+book_search_cache_config = BookSearchCacheConfig()
+book_bulk_indexer = (
+    BulkIndexer(elasticsearch_client, elasticsearch_bulk_config)
+    if elasticsearch_bulk_config.enabled
+    else None
+)
 
 # Initialize read and write repositories
-book_read_repository = BookReadRepository(
-    db=db,
-    elasticsearch_client=elasticsearch_client,
-)
 book_write_repository = BookWriteRepository(
     db=db,
     elasticsearch_client=elasticsearch_client,
+    bulk_indexer=book_bulk_indexer,
 )
 author_read_repository = AuthorReadRepository(db=db)
 author_write_repository = AuthorWriteRepository(db=db)
@@ -126,6 +144,8 @@ callables = {
             book_producer,
         ),
         "entity": Book,
+        "bulk": True,
+        "invalidates_search_cache": True,
     },
     "author.upsert": {
         "usecase": UpsertAuthor(
@@ -137,6 +157,8 @@ callables = {
     "book.deletion": {
         "usecase": DeleteBook(book_write_repository, book_producer),
         "entity": DeletionEntity,
+        "bulk": True,
+        "invalidates_search_cache": True,
     },
     "author.deletion": {
         "usecase": DeleteAuthor(author_write_repository, author_producer),
@@ -204,7 +226,32 @@ class Consumer:
                     json.loads(body.message),
                 )
                 callables[method.routing_key]["usecase"].execute(entity)  # type: ignore
-                ch.basic_ack(delivery_tag=method.delivery_tag)
+                if book_bulk_indexer is not None and callables[method.routing_key].get(
+                    "bulk"
+                ):
+                    # Acknowledged once the bulk response confirms the document
+                    book_bulk_indexer.defer(
+                        str(entity.id),  # type: ignore
+                        ack=partial(
+                            cls._acknowledge,
+                            ch,
+                            method.delivery_tag,
+                            method.routing_key,
+                            entity,
+                        ),
+                        nack=partial(
+                            ch.basic_nack,
+                            delivery_tag=method.delivery_tag,
+                            requeue=True,
+                        ),
+                    )
+                else:
+                    cls._acknowledge(
+                        ch,
+                        method.delivery_tag,
+                        method.routing_key,
+                        entity,
+                    )
             except Exception as e:
                 cidvalue += f"-{str(uuid7())}"
                 cid.set(cidvalue)
@@ -221,6 +268,9 @@ class Consumer:
                 cls.channel.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
                 raise e
 
+            if book_bulk_indexer is not None and book_bulk_indexer.is_full():
+                cls._flush_bulk()
+
         # pylint: enable=unused-argument
 
         if cls._instance is None or cls.reload:
@@ -270,6 +320,8 @@ class Consumer:
                     on_message_callback=callback,
                     auto_ack=False,
                 )
+                if book_bulk_indexer is not None:
+                    cls._schedule_bulk_flush()
             cls.reload = False
             cls._instance = cls
         return cls._instance
@@ -281,6 +333,73 @@ class Consumer:
     @classmethod
     def stop_consuming(cls) -> None:
         cls.channel.stop_consuming()
+        cls._flush_bulk()
+
+    @classmethod
+    def _acknowledge(
+        cls,
+        channel: BlockingChannel,
+        delivery_tag: int,
+        routing_key: str,
+        entity: Any,
+    ) -> None:
+        """Acknowledge a processed message and tell the API replicas about it"""
+        channel.basic_ack(delivery_tag=delivery_tag)
+        if callables[routing_key].get("invalidates_search_cache"):
+            cls._broadcast_search_cache_invalidation(routing_key, entity)
+
+    @classmethod
+    def _broadcast_search_cache_invalidation(
+        cls,
+        routing_key: str,
+        entity: Any,
+    ) -> None:
+        """Publish the change so every API replica drops its stale search results"""
+        change: Dict[str, Any] = {"id": str(entity.id), "routing_key": routing_key}
+        if isinstance(entity, Book):
+            # Lets the replicas keep the searches the book cannot enter
+            change["book"] = book_search_attributes(entity)
+        try:
+            producer.publish(
+                Message(
+                    queue_name=book_search_cache_config.invalidation_routing_key,
+                    message=json.dumps(change),
+                ),
+            )
+        except Exception as e:
+            # Cached results still expire with their time to live
+            cls.logger.error(
+                {
+                    "exception": f"Error broadcasting search cache invalidation: {e}",
+                    "@timestamp": datetime.now(timezone.utc).isoformat(),
+                    "routing_key": routing_key,
+                    "exchange": "book-service-exchange",
+                },
+            )
+
+    @classmethod
+    def _schedule_bulk_flush(cls) -> None:
+        def flush() -> None:
+            cls._flush_bulk()
+            cls._schedule_bulk_flush()
+
+        cls.connection.call_later(elasticsearch_bulk_config.flush_interval, flush)
+
+    @classmethod
+    def _flush_bulk(cls) -> None:
+        """Send buffered Elasticsearch actions, requeueing their messages on failure"""
+        if book_bulk_indexer is None:
+            return
+        try:
+            book_bulk_indexer.flush()
+        except Exception as e:
+            cls.logger.error(
+                {
+                    "exception": f"Error flushing bulk actions: {e}",
+                    "@timestamp": datetime.now(timezone.utc).isoformat(),
+                    "exchange": "book-service-exchange",
+                },
+            )
 
     @classmethod
     def consume(cls, routing_key: str) -> None:
@@ -310,6 +429,8 @@ class Consumer:
                         json.loads(message_body.message),
                     )
                     callables[routing_key]["usecase"].execute(entity)  # type: ignore
+                    if book_bulk_indexer is not None:
+                        book_bulk_indexer.flush()
                 except Exception as e:
                     cls.logger.error(f"Error processing message: {e}")
                     raise e
@@ -17,24 +17,34 @@ class Producer:
     _instance = None
     connection: BlockingConnection
     channel: BlockingChannel
+    parameters: ConnectionParameters
 
     def __new__(cls, config: ProducerConfig, logstash_config: LogstashConfig):  # type: ignore
         if cls._instance is None:
             cls.logger = logging.getLogger(logstash_config.loggername)
-            cls.connection = BlockingConnection(
-                ConnectionParameters(
-                    host=config.localhost,
-                    credentials=PlainCredentials(config.user, config.password),
-                ),
-            )
-            cls.channel = cls.connection.channel()
-            cls.channel.exchange_declare(
-                exchange="book-service-exchange",
-                exchange_type=ExchangeType.topic,
+            cls.parameters = ConnectionParameters(
+                host=config.localhost,
+                credentials=PlainCredentials(config.user, config.password),
             )
+            cls._connect()
             cls._instance = cls
         return cls._instance
 
+    @classmethod
+    def _connect(cls) -> None:
+        cls.connection = BlockingConnection(cls.parameters)
+        cls.channel = cls.connection.channel()
+        cls.channel.exchange_declare(
+            exchange="book-service-exchange",
+            exchange_type=ExchangeType.topic,
+        )
+
+    @classmethod
+    def start(cls) -> None:
+        """Connect again when an application lifespan starts after a stop"""
+        if cls.connection.is_closed:
+            cls._connect()
+
     @classmethod
     def publish(cls, message: Message) -> None:
         cid = ContextVar(
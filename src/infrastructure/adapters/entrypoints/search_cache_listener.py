@@ -0,0 +1,130 @@
+import json
+import logging
+from datetime import datetime, timezone
+from threading import Event, Thread
+from typing import Optional
+
+from pika import BlockingConnection, ConnectionParameters
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.credentials import PlainCredentials
+from pika.exceptions import AMQPError
+from pika.exchange_type import ExchangeType
+
+from src.application.dto.producer import Message
+from src.infrastructure.adapters.database.cache.book_search_cache import (
+    BookSearchCache,
+)
+from src.infrastructure.settings.config import (
+    BookSearchCacheConfig,
+    LogstashConfig,
+    ProducerConfig,
+)
+
+
+class SearchCacheInvalidationListener:
+    """Drops cached search results when the consumer broadcasts a book change"""
+
+    reconnect_delay: float = 5.0
+
+    def __init__(
+        self,
+        cache: BookSearchCache,
+        cache_config: BookSearchCacheConfig,
+        config: ProducerConfig,
+        logstash_config: LogstashConfig,
+    ) -> None:
+        self.cache = cache
+        self.cache_config = cache_config
+        self.config = config
+        self.logger = logging.getLogger(logstash_config.loggername)
+        self._stopping = Event()
+        self._thread: Optional[Thread] = None
+        self._connection: Optional[BlockingConnection] = None
+        self._channel: Optional[BlockingChannel] = None
+
+    def start(self) -> None:
+        self._stopping.clear()
+        self._thread = Thread(
+            target=self._run,
+            name="search-cache-invalidation",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        connection, channel = self._connection, self._channel
+        if connection is not None and channel is not None and connection.is_open:
+            connection.add_callback_threadsafe(channel.stop_consuming)
+        if self._thread is not None:
+            self._thread.join(timeout=self.reconnect_delay)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                self._consume()
+            except AMQPError as e:
+                self.logger.error(
+                    {
+                        "exception": f"Search cache invalidation listener disconnected: {e}",
+                        "@timestamp": datetime.now(timezone.utc).isoformat(),
+                        "exchange": "book-service-exchange",
+                    },
+                )
+                # Broadcasts sent while disconnected are lost
+                self.cache.clear()
+                self._stopping.wait(self.reconnect_delay)
+
+    def _consume(self) -> None:
+        self._connection = BlockingConnection(
+            ConnectionParameters(
+                host=self.config.localhost,
+                credentials=PlainCredentials(self.config.user, self.config.password),
+            ),
+        )
+        try:
+            self._channel = self._connection.channel()
+            self._channel.exchange_declare(
+                exchange="book-service-exchange",
+                exchange_type=ExchangeType.topic,
+            )
+            # Every replica gets its own queue, so each one sees every broadcast
+            result = self._channel.queue_declare(
+                queue="",
+                exclusive=True,
+                auto_delete=True,
+            )
+            self._channel.queue_bind(
+                exchange="book-service-exchange",
+                queue=result.method.queue,
+                routing_key=self.cache_config.invalidation_routing_key,
+            )
+            self._channel.basic_consume(
+                queue=result.method.queue,
+                on_message_callback=self._on_message,
+                auto_ack=True,
+            )
+            if not self._stopping.is_set():
+                self._channel.start_consuming()
+        finally:
+            if self._connection.is_open:
+                self._connection.close()
+
+    # pylint: disable=unused-argument
+    def _on_message(self, ch, method, properties, body) -> None:  # type: ignore
+        try:
+            message = Message.model_validate(json.loads(body.decode("UTF-8")))
+            change = json.loads(message.message)
+        except ValueError:
+            self.cache.clear()
+            return
+        routing_key, book_id = change.get("routing_key"), change.get("id")
+        if routing_key == "book.deletion" and book_id:
+            self.cache.invalidate(book_id)
+        elif routing_key == "book.upsert" and book_id and change.get("book"):
+            # An upserted book may now match searches it was not cached in
+            self.cache.invalidate_upsert(book_id, change["book"])
+        else:
+            self.cache.clear()
+
+    # pylint: enable=unused-argument
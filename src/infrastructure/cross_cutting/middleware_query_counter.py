@@ -0,0 +1,54 @@
+import json
+import logging
+from datetime import datetime, timezone
+
+from fastapi import Response
+from starlette.middleware.base import (
+    BaseHTTPMiddleware,
+    DispatchFunction,
+    RequestResponseEndpoint,
+)
+from starlette.requests import Request
+from starlette.types import ASGIApp
+
+from src.infrastructure.adapters.database.db.query_counter import count_queries
+from src.infrastructure.settings.config import LogstashConfig, QueryCounterConfig
+
+
+class QueryCounterMiddleware(BaseHTTPMiddleware):
+    """Reports how many database statements each request ran"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        config: QueryCounterConfig,
+        logstash_config: LogstashConfig,
+        dispatch: DispatchFunction | None = None,
+    ) -> None:
+        super().__init__(app, dispatch)
+        self.config = config
+        self.logger = logging.getLogger(logstash_config.loggername)
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+    ) -> Response:
+        with count_queries() as counter:
+            response = await call_next(request)
+
+        response.headers["X-DB-Query-Count"] = str(counter.count)
+        if counter.count > self.config.warning_threshold:
+            self.logger.warning(
+                json.dumps(
+                    {
+                        "@timestamp": datetime.now(timezone.utc).isoformat(),
+                        "message": "Request exceeded the database query threshold",
+                        "method": request.method,
+                        "path": request.url.path,
+                        "query_count": counter.count,
+                        "threshold": self.config.warning_threshold,
+                    },
+                ),
+            )
+        return response
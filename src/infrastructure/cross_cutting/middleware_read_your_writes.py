@@ -0,0 +1,59 @@
+import re
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import (
+    BaseHTTPMiddleware,
+    DispatchFunction,
+    RequestResponseEndpoint,
+)
+from starlette.requests import Request
+from starlette.types import ASGIApp
+
+from src.infrastructure.adapters.database.db.replication import read_your_writes
+from src.infrastructure.adapters.database.db.session import DatabaseSettings
+from src.infrastructure.settings.config import ReplicaRoutingConfig
+
+CONSISTENCY_TOKEN_HEADER = "X-Consistency-Token"
+LSN_PATTERN = re.compile(r"^[0-9A-Fa-f]{1,8}/[0-9A-Fa-f]{1,8}$")
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """Keeps the replica reads of a request from going back in time.
+
+    A request carrying a consistency token reads from the replica only once it
+    has replayed that position. Requests that publish writes read the current
+    version of a row, so they wait for every commit made before them.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        db: DatabaseSettings,
+        config: ReplicaRoutingConfig,
+        dispatch: DispatchFunction | None = None,
+    ) -> None:
+        super().__init__(app, dispatch)
+        self.db = db
+        self.config = config
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+    ) -> Response:
+        token = request.headers.get(CONSISTENCY_TOKEN_HEADER)
+        if token is not None and not LSN_PATTERN.match(token):
+            return JSONResponse(
+                status_code=400,
+                content={"detail": f"Invalid {CONSISTENCY_TOKEN_HEADER} header"},
+            )
+        if request.method in self.config.consistent_methods:
+            token = await self.db.current_lsn_async()
+
+        with read_your_writes(token):
+            response = await call_next(request)
+
+        if token is not None:
+            response.headers[CONSISTENCY_TOKEN_HEADER] = token
+        return response
@@ -1,7 +1,10 @@
-from typing import Set
+import json
+import logging
+from pathlib import Path
+from typing import Annotated, Any, List, Literal, Set
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, field_validator, model_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 from src.infrastructure.settings.environments import Environments
 
@@ -92,6 +95,57 @@ class ElasticsearchConfig(BaseSettings):
     )
 
 
+class ElasticsearchCircuitBreakerConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="ELASTICSEARCH_BREAKER_")
+
+    enabled: bool = Field(
+        description="Fall back to PostgreSQL without calling Elasticsearch while it is unhealthy",
+        default=True,
+    )
+    request_timeout: float = Field(
+        description="Seconds a search waits for Elasticsearch, without retries, before falling back",
+        default=5.0,
+        gt=0,
+    )
+    window_seconds: float = Field(
+        description="Length of the rolling window the rates are computed over",
+        default=30.0,
+        gt=0,
+    )
+    minimum_calls: int = Field(
+        description="Calls needed in the window before the circuit may open",
+        default=20,
+        ge=1,
+    )
+    error_rate_threshold: float = Field(
+        description="Share of failed calls that opens the circuit",
+        default=0.5,
+        gt=0,
+        le=1,
+    )
+    slow_call_seconds: float = Field(
+        description="Duration from which a call counts as slow",
+        default=2.0,
+        gt=0,
+    )
+    slow_call_rate_threshold: float = Field(
+        description="Share of slow calls that opens the circuit",
+        default=0.5,
+        gt=0,
+        le=1,
+    )
+    open_seconds: float = Field(
+        description="Seconds the circuit stays open before probing Elasticsearch again",
+        default=15.0,
+        gt=0,
+    )
+    half_open_max_calls: int = Field(
+        description="Probe calls let through while half open, all must succeed to close",
+        default=3,
+        ge=1,
+    )
+
+
 class ElasticsearchIndexConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="ELASTICSEARCH_INDEX_")
 
@@ -101,7 +155,7 @@ class ElasticsearchIndexConfig(BaseSettings):
     )
     mappings_file_path: str = Field(
         description="Path to the JSON file containing Elasticsearch mappings",
-        default="",
+        default=str(Path(__file__).parent / "elasticsearch_mappings.json"),
     )
     number_of_shards: int = Field(
         description="Number of primary shards for the index",
@@ -119,6 +173,123 @@ class ElasticsearchIndexConfig(BaseSettings):
         description="How often to refresh the index",
         default="1s",
     )
+    point_in_time_keep_alive: str = Field(
+        description="How long a point in time is kept alive between cursor pages",
+        default="1m",
+    )
+    track_total_hits: int = Field(
+        description="Hits counted exactly per search, the total is a lower bound beyond it",
+        default=10000,
+        ge=0,
+    )
+    facet_size: int = Field(
+        description="Maximum number of buckets returned per facet",
+        default=10,
+        ge=1,
+    )
+    facet_publish_date_interval: str = Field(
+        description="Calendar interval of the publish date histogram facet",
+        default="year",
+    )
+
+
+class ElasticsearchBulkConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="ELASTICSEARCH_BULK_")
+
+    enabled: bool = Field(
+        description="Batch consumer writes through the _bulk API",
+        default=True,
+    )
+    max_actions: int = Field(
+        description="Number of buffered actions that triggers a flush",
+        default=500,
+        ge=1,
+    )
+    flush_interval: float = Field(
+        description="Seconds between time based flushes of the buffer",
+        default=1.0,
+        gt=0,
+    )
+    refresh: Literal["false", "wait_for"] = Field(
+        description=(
+            "Refresh policy applied once per bulk request, always wait_for while "
+            "the book search cache is enabled"
+        ),
+        default="false",
+    )
+    max_retries: int = Field(
+        description="Retries of the actions rejected with 429 or 5xx before requeueing",
+        default=3,
+        ge=0,
+    )
+    retry_backoff_seconds: float = Field(
+        description="Wait before the first retry, doubled on each following one",
+        default=0.5,
+        ge=0,
+    )
+
+    @model_validator(mode="after")
+    def wait_for_cached_searches(self) -> "ElasticsearchBulkConfig":
+        """Bulk requests wait for the refresh while searches are cached"""
+        # Invalidations are broadcast after the flush, so the changes they
+        # announce must already be searchable or the API caches stale hits again
+        if self.refresh != "wait_for" and BookSearchCacheConfig().enabled:
+            if "refresh" in self.model_fields_set:
+                logging.getLogger(LogstashConfig().loggername).warning(
+                    "ELASTICSEARCH_BULK_REFRESH=%s is overridden with wait_for "
+                    "while the book search cache is enabled",
+                    self.refresh,
+                )
+            self.refresh = "wait_for"
+        return self
+
+
+class ElasticsearchReindexConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="ELASTICSEARCH_REINDEX_")
+
+    chunk_size: int = Field(
+        description="Number of books read from PostgreSQL per keyset chunk",
+        default=1000,
+        ge=1,
+    )
+    workers: int = Field(
+        description="Number of processes converting books into documents",
+        default=4,
+        ge=1,
+    )
+    bulk_threads: int = Field(
+        description="Number of threads sending bulk requests",
+        default=4,
+        ge=1,
+    )
+    bulk_chunk_size: int = Field(
+        description="Number of documents per bulk request",
+        default=500,
+        ge=1,
+    )
+
+
+class BookSearchCacheConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="BOOK_SEARCH_CACHE_")
+
+    enabled: bool = Field(
+        description="Cache book search results in the API process",
+        default=True,
+    )
+    ttl_seconds: float = Field(
+        description="Seconds a cached search result stays valid",
+        default=30.0,
+        gt=0,
+    )
+    max_entries: int = Field(
+        description="Number of cached searches kept before evicting the least recently used",
+        default=1024,
+        ge=1,
+    )
+    invalidation_routing_key: str = Field(
+        description="Routing key of the invalidation broadcast on book-service-exchange",
+        default="book.search_cache.invalidation",
+    )
 
 
 class ProducerConfig(BaseSettings):
@@ -160,7 +331,39 @@ class ProducerConfig(BaseSettings):
     )
 
 
-class DatabaseConfig(BaseSettings):
+class DatabasePoolConfig(BaseSettings):
+    pool_size: int = Field(
+        description="Connections kept open in the pool",
+        default=5,
+        ge=1,
+    )
+    max_overflow: int = Field(
+        description="Connections opened above pool_size under bursts",
+        default=10,
+        ge=0,
+    )
+    pool_timeout: float = Field(
+        description="Seconds a checkout waits for a free connection before failing",
+        default=30.0,
+        gt=0,
+    )
+    pool_recycle: int = Field(
+        description="Seconds after which a pooled connection is replaced, -1 never",
+        default=1800,
+        ge=-1,
+    )
+    pool_pre_ping: bool = Field(
+        description="Test connections on checkout and replace the dead ones",
+        default=True,
+    )
+    statement_timeout_ms: int = Field(
+        description="Server side statement_timeout of the connections, 0 disables it",
+        default=0,
+        ge=0,
+    )
+
+
+class DatabaseConfig(DatabasePoolConfig):
     model_config = SettingsConfigDict(env_prefix="DATABASE_")
 
     host: str = Field(
@@ -185,7 +388,7 @@ class DatabaseConfig(BaseSettings):
     )
 
 
-class SlaveDatabaseConfig(BaseSettings):
+class SlaveDatabaseConfig(DatabasePoolConfig):
     model_config = SettingsConfigDict(env_prefix="DATABASE_SLAVE_")
 
     host: str = Field(
@@ -196,3 +399,71 @@ class SlaveDatabaseConfig(BaseSettings):
         description="Database slave port",
         default=0,
     )
+    replicas: Annotated[List[str], NoDecode] = Field(
+        description=(
+            "Comma separated replicas as host:port or host:port:weight, "
+            "host and port when empty"
+        ),
+        default=[],
+    )
+
+    @field_validator("replicas", mode="before")
+    @classmethod
+    def split_replicas(cls, value: Any) -> Any:
+        """DATABASE_SLAVE_REPLICAS=a:5432,b:5433:2 or a JSON list"""
+        if isinstance(value, str):
+            if value.lstrip().startswith("["):
+                return json.loads(value)
+            return [replica.strip() for replica in value.split(",") if replica.strip()]
+        return value
+
+
+class ReplicaRoutingConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="DATABASE_REPLICA_ROUTING_")
+
+    enabled: bool = Field(
+        description="Send replica reads to the master when the replica is behind",
+        default=True,
+    )
+    max_lag_seconds: float = Field(
+        description="Replay lag above which replica reads go to the master",
+        default=1.0,
+        ge=0,
+    )
+    status_ttl_seconds: float = Field(
+        description="Seconds a probed replica position is trusted before a new probe",
+        default=0.5,
+        gt=0,
+    )
+    balancing: Literal["least_outstanding", "weighted_round_robin"] = Field(
+        description="How reads are spread over the replicas that can serve them",
+        default="least_outstanding",
+    )
+    probe_interval_seconds: float = Field(
+        description="Seconds between background probes, below status_ttl_seconds",
+        default=0.25,
+        gt=0,
+    )
+    probe_timeout_seconds: float = Field(
+        description="Seconds a replica has to connect and answer a probe",
+        default=1.0,
+        gt=0,
+    )
+    consistent_methods: Set[str] = Field(
+        description="Request methods whose reads observe every commit made before them",
+        default={"POST", "PUT", "PATCH", "DELETE"},
+    )
+
+
+class QueryCounterConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="QUERY_COUNTER_")
+
+    enabled: bool = Field(
+        description="Count the database statements of every API request",
+        default=True,
+    )
+    warning_threshold: int = Field(
+        description="Statements per request above which a warning is logged",
+        default=10,
+        ge=0,
+    )
@@ -1,7 +1,7 @@
 """Application Settings"""
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from fastapi import (
     APIRouter,
@@ -9,9 +9,15 @@ from fastapi import (
 )
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.infrastructure.adapters.database.cache.book_search_cache import (
+    BookSearchCache,
+)
 from src.infrastructure.adapters.database.db.session import DatabaseSettings
-from src.infrastructure.adapters.database.elasticsearch.client import (
-    ElasticsearchClient,
+from src.infrastructure.adapters.database.elasticsearch.async_client import (
+    AsyncElasticsearchClient,
+)
+from src.infrastructure.adapters.database.elasticsearch.circuit_breaker import (
+    CircuitBreaker,
 )
 from src.infrastructure.adapters.database.repository.author_read import (
     AuthorReadRepository,
@@ -28,18 +34,31 @@ from src.infrastructure.adapters.database.repository.physical_exemplar_read impo
 )
 from src.infrastructure.adapters.entrypoints.api.router import Initializer
 from src.infrastructure.adapters.entrypoints.producer import Producer
+from src.infrastructure.adapters.entrypoints.search_cache_listener import (
+    SearchCacheInvalidationListener,
+)
 from src.infrastructure.cross_cutting.middleware_context import (
     RequestContextsMiddleware,
 )
 from src.infrastructure.cross_cutting.middleware_logging import (
     RequestContextLogMiddleware,
 )
+from src.infrastructure.cross_cutting.middleware_query_counter import (
+    QueryCounterMiddleware,
+)
+from src.infrastructure.cross_cutting.middleware_read_your_writes import (
+    ReadYourWritesMiddleware,
+)
 from src.infrastructure.logs.logstash import LogStash
 from src.infrastructure.settings.config import (
+    BookSearchCacheConfig,
     DatabaseConfig,
+    ElasticsearchCircuitBreakerConfig,
     ElasticsearchConfig,
     LogstashConfig,
     ProducerConfig,
+    QueryCounterConfig,
+    ReplicaRoutingConfig,
     SlaveDatabaseConfig,
     SystemConfig,
 )
@@ -56,6 +75,10 @@ class AppConfig:
         config: SystemConfig,
         db: DatabaseSettings,
         producer: Producer,
+        search_cache: Optional[BookSearchCache] = None,
+        search_cache_listener: Optional[SearchCacheInvalidationListener] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        elasticsearch_client: Optional[AsyncElasticsearchClient] = None,
     ):
         self.logstash_logger = logstash_logger
         self.api_router = router
@@ -66,7 +89,20 @@ class AppConfig:
         # pylint: disable=unused-argument
         @asynccontextmanager
         async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+            db.init_async_engine()
+            if elasticsearch_client is not None:
+                elasticsearch_client.connect()
+            producer.start()
+            db.start_replica_probes()
+            if search_cache_listener is not None:
+                search_cache_listener.start()
             yield
+            db.stop_replica_probes()
+            if search_cache_listener is not None:
+                search_cache_listener.stop()
+            if elasticsearch_client is not None:
+                await elasticsearch_client.close()
+            await db.dispose_async_engine()
             producer.stop()
 
         # pylint: enable=unused-argument
@@ -79,6 +115,9 @@ class AppConfig:
             redoc_url="/redoc",
             lifespan=lifespan,
         )
+        self.app.state.book_search_cache = search_cache
+        self.app.state.elasticsearch_circuit_breaker = circuit_breaker
+        self.app.state.database = db
 
     def init_cors(self) -> None:
         """Initialize CORS"""
@@ -99,6 +138,24 @@ class AppConfig:
             config=self.logstash,
         )
 
+    def init_query_counter(self) -> None:
+        query_counter_config = QueryCounterConfig()
+        if query_counter_config.enabled:
+            self.app.add_middleware(
+                QueryCounterMiddleware,
+                config=query_counter_config,
+                logstash_config=self.logstash,
+            )
+
+    def init_read_your_writes(self) -> None:
+        routing = self.db.routing
+        if routing is not None and routing.enabled:
+            self.app.add_middleware(
+                ReadYourWritesMiddleware,
+                db=self.db,
+                config=routing,
+            )
+
     def init_logstash(self) -> None:
         self.logstash_logger.logstash_init()
 
@@ -109,6 +166,8 @@ class AppConfig:
     def start_application(self) -> FastAPI:
         """Start Application with Environment"""
         self.init_context()
+        self.init_query_counter()
+        self.init_read_your_writes()
         self.init_cors()
         self.init_logstash()
         self.init_routes()
@@ -134,6 +193,10 @@ def init_api() -> FastAPI:
         user=db_config.user,
         slave_host=slave_db_config.host,
         slave_port=slave_db_config.port,
+        replicas=slave_db_config.replicas,
+        pool=db_config,
+        slave_pool=slave_db_config,
+        routing=ReplicaRoutingConfig(),
     )
 
     producer_config = ProducerConfig()
@@ -141,12 +204,33 @@ def init_api() -> FastAPI:
 
     # Initialize Elasticsearch client
     elasticsearch_config = ElasticsearchConfig()
-    elasticsearch_client = ElasticsearchClient(elasticsearch_config)
+    elasticsearch_client = AsyncElasticsearchClient(elasticsearch_config)
+    circuit_breaker_config = ElasticsearchCircuitBreakerConfig()
+    circuit_breaker = (
+        CircuitBreaker(circuit_breaker_config)
+        if circuit_breaker_config.enabled
+        else None
+    )
+
+    # Search results are cached per replica and dropped on consumer broadcasts
+    search_cache_config = BookSearchCacheConfig()
+    search_cache = None
+    search_cache_listener = None
+    if search_cache_config.enabled:
+        search_cache = BookSearchCache(search_cache_config)
+        search_cache_listener = SearchCacheInvalidationListener(
+            cache=search_cache,
+            cache_config=search_cache_config,
+            config=producer_config,
+            logstash_config=logstash_config,
+        )
 
     # Initialize read repositories (optimized for queries)
     book_read_repository = BookReadRepository(
         db=db,
         elasticsearch_client=elasticsearch_client,
+        search_cache=search_cache,
+        circuit_breaker=circuit_breaker,
     )
     author_read_repository = AuthorReadRepository(db=db)
     book_category_read_repository = BookCategoryReadRepository(db=db)
@@ -169,6 +253,10 @@ def init_api() -> FastAPI:
         config=config,
         db=db,
         producer=producer,
+        search_cache=search_cache,
+        search_cache_listener=search_cache_listener,
+        circuit_breaker=circuit_breaker,
+        elasticsearch_client=elasticsearch_client,
     ).start_application()
 
 
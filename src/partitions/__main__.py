@@ -0,0 +1,90 @@
+import argparse
+
+from sqlmodel import select
+
+from src.infrastructure.adapters.database.db.partitions import (
+    PhysicalExemplarPartitionManager,
+)
+from src.infrastructure.adapters.database.db.session import DatabaseSettings
+from src.infrastructure.adapters.database.models.branch import Branch as BranchModel
+from src.infrastructure.logs.logstash import LogStash
+from src.infrastructure.settings.config import (
+    DatabaseConfig,
+    LogstashConfig,
+    SlaveDatabaseConfig,
+    SystemConfig,
+)
+
+
+def partitions() -> None:
+    """Create the physical exemplar partitions ahead of the branch upserts."""
+    parser = argparse.ArgumentParser(
+        description="Manage the physical exemplar partitions",
+    )
+    parser.add_argument(
+        "command",
+        choices=["ensure", "list"],
+        nargs="?",
+        default="ensure",
+        help="ensure: create the partition of every branch that has none",
+    )
+    parser.add_argument(
+        "--default",
+        action="store_true",
+        help="Also create the DEFAULT partition for rows of unknown branches",
+    )
+    args = parser.parse_args()
+
+    logstash_config = LogstashConfig()
+    config = SystemConfig()
+    handler = LogStash(
+        logstash_config.host,
+        logstash_config.port,
+        logstash_config.loggername,
+        config.environment,
+    )
+    handler.logstash_init()
+
+    db_config = DatabaseConfig()
+    slave_db_config = SlaveDatabaseConfig()
+    db = DatabaseSettings(
+        host=db_config.host,
+        password=db_config.password,
+        port=db_config.port,
+        user=db_config.user,
+        slave_host=slave_db_config.host,
+        slave_port=slave_db_config.port,
+        replicas=slave_db_config.replicas,
+        pool=db_config,
+        slave_pool=slave_db_config,
+    )
+    manager = PhysicalExemplarPartitionManager()
+    with db.get_session() as session:
+        manager.load(session)
+        branch_ids = session.exec(select(BranchModel.id)).all()
+
+    if args.command == "list":
+        for branch_id in manager.partitions():
+            handler.logger.info(f"Partition of branch {branch_id}")  # type: ignore
+        handler.logger.info(  # type: ignore
+            f"Default partition: {manager.default_partition or 'none'}",
+        )
+        return
+
+    # One transaction per branch keeps every lock short
+    created = 0
+    for branch_id in branch_ids:
+        with db.get_session() as session:
+            if manager.ensure_partition(session, branch_id):
+                session.commit()
+                manager.register(branch_id)
+                created += 1
+    # The DEFAULT partition goes last, so no branch partition scans it
+    if args.default:
+        with db.get_session() as session:
+            manager.ensure_default_partition(session)
+    handler.logger.info(f"Created {created} physical exemplar partitions")  # type: ignore
+
+
+if __name__ == "__main__":
+    partitions()
@@ -0,0 +1,75 @@
+import argparse
+
+from src.infrastructure.adapters.database.db.session import DatabaseSettings
+from src.infrastructure.adapters.database.elasticsearch.client import (
+    ElasticsearchClient,
+)
+from src.infrastructure.adapters.database.elasticsearch.reindexer import (
+    BookReindexer,
+)
+from src.infrastructure.logs.logstash import LogStash
+from src.infrastructure.settings.config import (
+    DatabaseConfig,
+    ElasticsearchConfig,
+    ElasticsearchIndexConfig,
+    ElasticsearchReindexConfig,
+    LogstashConfig,
+    SlaveDatabaseConfig,
+    SystemConfig,
+)
+
+
+def reindex() -> None:
+    """Rebuild the books index from PostgreSQL without downtime."""
+    parser = argparse.ArgumentParser(description="Rebuild the books index")
+    parser.add_argument("--chunk-size", type=int, help="Books read per keyset chunk")
+    parser.add_argument("--workers", type=int, help="Conversion worker processes")
+    parser.add_argument(
+        "--delete-previous",
+        action="store_true",
+        help="Delete the indices the alias pointed at before the swap",
+    )
+    args = parser.parse_args()
+
+    logstash_config = LogstashConfig()
+    config = SystemConfig()
+    handler = LogStash(
+        logstash_config.host,
+        logstash_config.port,
+        logstash_config.loggername,
+        config.environment,
+    )
+    handler.logstash_init()
+
+    db_config = DatabaseConfig()
+    slave_db_config = SlaveDatabaseConfig()
+    db = DatabaseSettings(
+        host=db_config.host,
+        password=db_config.password,
+        port=db_config.port,
+        user=db_config.user,
+        slave_host=slave_db_config.host,
+        slave_port=slave_db_config.port,
+        replicas=slave_db_config.replicas,
+        pool=db_config,
+        slave_pool=slave_db_config,
+    )
+    reindex_config = ElasticsearchReindexConfig()
+    if args.chunk_size:
+        reindex_config.chunk_size = args.chunk_size
+    if args.workers:
+        reindex_config.workers = args.workers
+
+    reindexer = BookReindexer(
+        db=db,
+        elasticsearch_client=ElasticsearchClient(ElasticsearchConfig()),
+        index_config=ElasticsearchIndexConfig(),
+        reindex_config=reindex_config,
+    )
+    handler.logger.info("Starting books reindex")  # type: ignore
+    index = reindexer.reindex(delete_previous=args.delete_previous)
+    handler.logger.info(f"Books reindexed into {index}")  # type: ignore
+
+
+if __name__ == "__main__":
+    reindex()
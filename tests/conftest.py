@@ -1,7 +1,6 @@
-import json
 from typing import List
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from polyfactory.factories.pydantic_factory import ModelFactory
 from sqlmodel import text
@@ -18,9 +17,15 @@ from src.domain.entities.book_data import BookData
 from src.domain.entities.branch import Branch
 from src.domain.entities.physical_exemplar import PhysicalExemplar
 from src.infrastructure.adapters.database.db.session import DatabaseSettings
+from src.infrastructure.adapters.database.elasticsearch.async_client import (
+    AsyncElasticsearchClient,
+)
 from src.infrastructure.adapters.database.elasticsearch.client import (
     ElasticsearchClient,
 )
+from src.infrastructure.adapters.database.elasticsearch.index_manager import (
+    BookIndexManager,
+)
 from src.infrastructure.adapters.database.repository.author_read import (
     AuthorReadRepository,
 )
@@ -230,6 +235,15 @@ class BasePostgresRepositoryConfTest(BaseConfTest):
         # cls.db.init_db()
         cls.db._pg_trgm_install()
 
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        # Every test runs on its own event loop, like an application lifespan
+        self.db.init_async_engine()
+
+    async def asyncTearDown(self):
+        await self.db.dispose_async_engine()
+        await super().asyncTearDown()
+
     def tearDown(self):
         super().tearDown()
         with self.db.get_session() as session:
@@ -261,34 +275,28 @@ class BaseElasticsearchConfTest(BaseConfTest):
 
         # Create real Elasticsearch client for tests
         cls.elasticsearch_client = ElasticsearchClient(cls.elasticsearch_config)
+        cls.async_elasticsearch_client = AsyncElasticsearchClient(
+            cls.elasticsearch_config,
+        )
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.async_elasticsearch_client.connect()
+
+    async def asyncTearDown(self):
+        await self.async_elasticsearch_client.close()
+        await super().asyncTearDown()
 
     def setUp(self):
         super().setUp()
         # Set up test index if using real Elasticsearch
         test_index = self.elasticsearch_index_config.books_index
         if not self.elasticsearch_client.client.indices.exists(index=test_index):
-            # Load mappings from file and create index with proper mappings
-            with open(self.elasticsearch_index_config.mappings_file_path) as f:
-                mappings_data = json.load(f)
-
-            # Extract the books index configuration
-            books_config = mappings_data.get("books", {})
-
-            # Create test index with proper mappings
-            self.elasticsearch_client.client.indices.create(
-                index=test_index,
-                body={
-                    "settings": books_config.get(
-                        "settings",
-                        {
-                            "number_of_shards": self.elasticsearch_index_config.number_of_shards,
-                            "number_of_replicas": self.elasticsearch_index_config.number_of_replicas,
-                            "refresh_interval": self.elasticsearch_index_config.refresh_interval,
-                        },
-                    ),
-                    "mappings": books_config.get("mappings", {}),
-                },
-            )
+            # Create test index with the managed settings and mappings
+            BookIndexManager(
+                self.elasticsearch_client,
+                self.elasticsearch_index_config,
+            ).create_index(test_index)
 
     def tearDown(self):
         super().tearDown()
@@ -305,7 +313,10 @@ class BaseRepositoryConfTest(BasePostgresRepositoryConfTest, BaseElasticsearchCo
         super().setUpClass()
 
         # Initialize read repositories with both PostgreSQL and Elasticsearch
-        cls.book_read_repository = BookReadRepository(db=cls.db, elasticsearch_client=cls.elasticsearch_client)  # type: ignore
+        cls.book_read_repository = BookReadRepository(
+            db=cls.db,
+            elasticsearch_client=cls.async_elasticsearch_client,
+        )
         cls.book_write_repository = BookWriteRepository(db=cls.db, elasticsearch_client=cls.elasticsearch_client)  # type: ignore
         # Override the Elasticsearch index name for tests
         cls.book_read_repository.es_index = cls.elasticsearch_index_config.books_index
@@ -346,6 +357,22 @@ class BaseUseCaseConfTest(BaseConfTest):
         cls.mock_branch_repository = Mock()
         cls.mock_physical_exemplar_repository = Mock()
 
+        # The API read paths are async
+        cls.mock_book_repository.get_book_by_id_async = AsyncMock()
+        cls.mock_book_repository.get_book_by_filter = AsyncMock()
+        cls.mock_book_repository.suggest_books = AsyncMock()
+        cls.mock_book_repository.count_books = AsyncMock()
+        cls.mock_author_read_repository.get_author_by_id_async = AsyncMock()
+        cls.mock_author_repository.get_author_by_filter_async = AsyncMock()
+        cls.mock_book_category_repository.get_book_category_by_filter_async = (
+            AsyncMock()
+        )
+        cls.mock_branch_repository.get_branch_by_filter_async = AsyncMock()
+        cls.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch_async = (
+            AsyncMock()
+        )
+        cls.mock_physical_exemplar_repository.get_books_availability_async = AsyncMock()
+
         # Mock the producer dependencies
         cls.mock_book_producer = Mock()
         cls.mock_author_producer = Mock()
@@ -160,3 +160,64 @@ class TestFilterBook(BookViewConfTest):
 
         response_book = [Book.model_validate(book) for book in response_data]
         self.validate_book(response_book, expected_books)
+
+    def test_filter_book_with_cursor(self):
+
+        # Scenario: Walk all books with a cursor
+
+        # Given books are stored in the database
+
+        # When a request starts a cursor walk with one book per page
+        first_response = self.client.get(
+            "api/book",
+            params={"size": 1, "cursor": "*"},
+        )
+
+        # Then the response is a 200 status code with a cursor for the next page
+        self.assertEqual(first_response.status_code, 200)
+        next_cursor = first_response.headers["X-Next-Cursor"]
+
+        # When the next page is requested with that cursor
+        second_response = self.client.get(
+            "api/book",
+            params={"size": 1, "cursor": next_cursor},
+        )
+
+        # Then both pages together list all books
+        self.assertEqual(second_response.status_code, 200)
+        response_book = [
+            Book.model_validate(book)
+            for book in first_response.json() + second_response.json()
+        ]
+        self.validate_book(response_book, [self.stored_book1, self.stored_book2])
+
+    def test_filter_book_with_invalid_cursor(self):
+
+        # Scenario: Filter books with a cursor that was never issued
+
+        # When a request is made with an invalid cursor
+        response = self.client.get("api/book", params={"cursor": "invalid"})
+
+        # Then the response is a 400 status code
+        self.assertEqual(response.status_code, 400)
+
+    def test_filter_book_past_the_result_window(self):
+
+        # Scenario: Page past the result window without a cursor
+
+        # When a request asks for a page past the result window
+        response = self.client.get("api/book", params={"page": 1000, "size": 100})
+
+        # Then the response is a 422 status code pointing at the cursor
+        self.assertEqual(response.status_code, 422)
+        self.assertIn("cursor=*", response.text)
+
+    def test_filter_book_with_a_page_size_too_large(self):
+
+        # Scenario: Ask for more books than a page may hold
+
+        # When a request is made with a page size above the maximum
+        response = self.client.get("api/book", params={"size": 101})
+
+        # Then the response is a 422 status code
+        self.assertEqual(response.status_code, 422)
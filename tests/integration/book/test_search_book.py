@@ -0,0 +1,107 @@
+from datetime import date
+
+from tests.integration.book.conftest import BookViewConfTest
+
+from src.domain.entities.book import Book
+from src.domain.enums.book_type import BookType
+
+
+class TestSearchBook(BookViewConfTest):
+
+    def setUp(self):
+        super().setUp()
+        author = self.author_model_factory.build(
+            created_by="test_user",
+            updated_by="test_user",
+        )
+        category = self.book_category_model_factory.build(
+            created_by="test_user",
+            updated_by="test_user",
+        )
+        self.stored_author = self.author_write_repository.upsert_author(author)
+        self.stored_category = self.book_category_write_repository.upsert_book_category(
+            category,
+        )
+        self.stored_books = [
+            self.book_write_repository.upsert_book(
+                self.book_model_factory.build(
+                    type=book_type,
+                    publish_date=publish_date,
+                    authors=[self.stored_author],
+                    book_categories=[self.stored_category],
+                    book_data=[
+                        self.book_data_model_factory.build(
+                            language=language,
+                            created_by="test_user",
+                            updated_by="test_user",
+                        ),
+                    ],
+                    created_by="test_user",
+                    updated_by="test_user",
+                ),
+            )
+            for book_type, publish_date, language in [
+                (BookType.PHYSICAL, date(2021, 3, 1), "en"),
+                (BookType.PHYSICAL, date(2022, 5, 1), "es"),
+                (BookType.EBOOK, date(2022, 7, 1), "en"),
+            ]
+        ]
+
+    def test_search_book_with_facets(self):
+
+        # Scenario: Search books with facet counts
+
+        # Given three books with different types, languages and dates
+
+        # When a request is made to search physical books with facets
+        response = self.client.get(
+            "api/book/search",
+            params={"type": "physical", "facets": True},
+        )
+
+        # Then the response is a 200 status code
+        self.assertEqual(response.status_code, 200)
+        response_data = response.json()
+
+        # And the books match the filter
+        self.validate_book(
+            [Book.model_validate(book) for book in response_data["books"]],
+            self.stored_books[:2],
+        )
+
+        # And the facets only count the matching books
+        facets = response_data["facets"]
+        self.assertEqual(facets["type"], [{"key": "physical", "count": 2}])
+        self.assertCountEqual(
+            facets["language"],
+            [{"key": "en", "count": 1}, {"key": "es", "count": 1}],
+        )
+        self.assertEqual(
+            facets["author"],
+            [
+                {
+                    "key": str(self.stored_author.id),
+                    "label": self.stored_author.name,
+                    "count": 2,
+                },
+            ],
+        )
+        self.assertEqual(
+            facets["publish_date"],
+            [
+                {"key": "2021-01-01", "count": 1},
+                {"key": "2022-01-01", "count": 1},
+            ],
+        )
+
+    def test_search_book_without_facets(self):
+
+        # Scenario: Search books without facets
+
+        # When a request is made without asking for facets
+        response = self.client.get("api/book/search")
+
+        # Then the response is a 200 status code without facets
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["books"]), 3)
+        self.assertNotIn("facets", response.json())
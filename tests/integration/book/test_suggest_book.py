@@ -0,0 +1,80 @@
+from tests.integration.book.conftest import BookViewConfTest
+
+
+class TestSuggestBook(BookViewConfTest):
+
+    def setUp(self):
+        super().setUp()
+        author = self.author_model_factory.build(
+            name="Ursula Le Guin",
+            created_by="test_user",
+            updated_by="test_user",
+        )
+        category = self.book_category_model_factory.build(
+            title="Utopian Fiction",
+            created_by="test_user",
+            updated_by="test_user",
+        )
+        self.stored_author = self.author_write_repository.upsert_author(author)
+        self.stored_category = self.book_category_write_repository.upsert_book_category(
+            category,
+        )
+        self.stored_book = self.book_write_repository.upsert_book(
+            self.book_model_factory.build(
+                authors=[self.stored_author],
+                book_categories=[self.stored_category],
+                book_data=[
+                    self.book_data_model_factory.build(
+                        title="Unfinished Tales",
+                        created_by="test_user",
+                        updated_by="test_user",
+                    ),
+                ],
+                created_by="test_user",
+                updated_by="test_user",
+            ),
+        )
+
+    def test_suggest_book(self):
+
+        # Scenario: Typeahead on a prefix
+
+        # Given a book, its author and its category are stored
+
+        # When a request is made with a prefix shared by all of them
+        response = self.client.get("api/book/suggest", params={"prefix": "u"})
+
+        # Then the response is a 200 status code
+        self.assertEqual(response.status_code, 200)
+
+        # And each suggestion carries only the id, text and kind
+        self.assertCountEqual(
+            response.json(),
+            [
+                {
+                    "id": str(self.stored_book.id),
+                    "text": "Unfinished Tales",
+                    "kind": "title",
+                },
+                {
+                    "id": str(self.stored_author.id),
+                    "text": "Ursula Le Guin",
+                    "kind": "author",
+                },
+                {
+                    "id": str(self.stored_category.id),
+                    "text": "Utopian Fiction",
+                    "kind": "category",
+                },
+            ],
+        )
+
+    def test_suggest_book_without_prefix(self):
+
+        # Scenario: Typeahead without a prefix
+
+        # When a request is made without a prefix
+        response = self.client.get("api/book/suggest")
+
+        # Then the response is a 422 status code
+        self.assertEqual(response.status_code, 422)
@@ -3,6 +3,9 @@ from sqlalchemy import text
 from tests.conftest import BaseConfTest
 
 from src.infrastructure.adapters.database.db.session import DatabaseSettings
+from src.infrastructure.adapters.database.elasticsearch.async_client import (
+    AsyncElasticsearchClient,
+)
 from src.infrastructure.adapters.database.elasticsearch.client import (
     ElasticsearchClient,
 )
@@ -72,7 +75,13 @@ class BaseViewConfTest(BaseConfTest):
         cls.elasticsearch_client = ElasticsearchClient(cls.elasticsearch_config)
         cls.author_read_repository = AuthorReadRepository(db=cls.db)  # type: ignore
         cls.author_write_repository = AuthorWriteRepository(db=cls.db)  # type: ignore
-        cls.book_read_repository = BookReadRepository(db=cls.db, elasticsearch_client=cls.elasticsearch_client)  # type: ignore
+        cls.async_elasticsearch_client = AsyncElasticsearchClient(
+            cls.elasticsearch_config,
+        )
+        cls.book_read_repository = BookReadRepository(
+            db=cls.db,
+            elasticsearch_client=cls.async_elasticsearch_client,
+        )
         cls.book_write_repository = BookWriteRepository(db=cls.db, elasticsearch_client=cls.elasticsearch_client)  # type: ignore
         cls.branch_read_repository = BranchReadRepository(db=cls.db)  # type: ignore
         cls.branch_write_repository = BranchWriteRepository(db=cls.db)  # type: ignore
@@ -96,6 +105,9 @@ class BaseViewConfTest(BaseConfTest):
     def tearDownClass(cls):
         super().tearDownClass()
         cls.consumer.stop_consuming()
+        if cls.test_client is not None:
+            cls.test_client.__exit__(None, None, None)
+            cls.test_client = None
 
     def setUp(self):
         super().setUp()
@@ -136,10 +148,11 @@ class BaseViewConfTest(BaseConfTest):
         """
 
         if self.test_client is None:
-            self.test_client = TestClient(
+            # Entered once, so one lifespan and event loop serve the whole class
+            type(self).test_client = TestClient(
                 app=self.fastapi_app,
                 base_url="http://localhost:9857",
-            )
+            ).__enter__()
 
             self.test_client.headers.update(
                 {
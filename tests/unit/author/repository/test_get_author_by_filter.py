@@ -59,6 +59,22 @@ class TestGetAuthorByFilter(AuthorRepositoryConftest):
         # Assert - Should return all authors
         self.assertGreaterEqual(len(results), 3)
 
+    async def test_no_filter_returns_all_async(self):
+        # Arrange - Create and save multiple authors
+        author1 = self.author_model_factory.build()
+        author2 = self.author_model_factory.build()
+
+        self.author_write_repository.upsert_author(author=author1)
+        self.author_write_repository.upsert_author(author=author2)
+
+        # Act - Call through the asyncpg engine
+        results = await self.author_read_repository.get_author_by_filter_async(
+            filter=None,
+        )
+
+        # Assert - Should return all authors
+        self.assertGreaterEqual(len(results), 2)
+
     def test_empty_filter_returns_all(self):
         # Arrange - Create and save multiple authors
         author1 = self.author_model_factory.build()
@@ -76,3 +92,43 @@ class TestGetAuthorByFilter(AuthorRepositoryConftest):
             results.sort(key=lambda x: x.name),
             [author1, author2].sort(key=lambda x: x.name),
         )
+
+    def test_no_filter_is_capped_to_one_page(self):
+        # Arrange
+        for _ in range(3):
+            self.author_write_repository.upsert_author(
+                author=self.author_model_factory.build(),
+            )
+
+        # Act
+        results = self.author_read_repository.get_author_by_filter(
+            filter=AuthorFilter(limit=2),
+        )
+
+        # Assert - Only the first page, in id order
+        self.assertEqual(len(results), 2)
+        self.assertEqual(
+            [author.id for author in results],
+            sorted(author.id for author in results),
+        )
+
+    def test_filter_by_name_ranks_by_similarity(self):
+        # Arrange
+        close = self.author_model_factory.build(name="John Smith")
+        exact = self.author_model_factory.build(name="John")
+        far = self.author_model_factory.build(name="Johnny Appleseed")
+        for author in (far, close, exact):
+            self.author_write_repository.upsert_author(author=author)
+
+        # Act - Walk the ranking one author at a time
+        first_page = self.author_read_repository.get_author_by_filter(
+            filter=AuthorFilter(name="John", limit=1),
+        )
+        rest = self.author_read_repository.get_author_by_filter(
+            filter=AuthorFilter(name="John", cursor=first_page[0].id),
+        )
+
+        # Assert - Most similar first, and the cursor resumes inside the ranking
+        self.assertEqual(first_page, [exact])
+        self.assertEqual(rest[0], close)
+        self.assertNotIn(exact, rest)
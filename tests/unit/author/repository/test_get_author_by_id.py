@@ -17,6 +17,17 @@ class TestGetAuthorById(AuthorRepositoryConftest):
         # Assert - Verify the author is returned correctly
         self.assertEqual(result, author)
 
+    async def test_get_existing_author_async(self):
+        # Arrange - Create and save an author first
+        author = self.author_model_factory.build()
+        self.author_write_repository.upsert_author(author=author)
+
+        # Act - Retrieve the author through the asyncpg engine
+        result = await self.author_read_repository.get_author_by_id_async(id=author.id)
+
+        # Assert - Verify the author is returned correctly
+        self.assertEqual(result, author)
+
     def test_get_non_existent_author(self):
         # Arrange - Generate a random UUID that doesn't exist
         non_existent_id = uuid7()
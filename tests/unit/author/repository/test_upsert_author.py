@@ -1,6 +1,7 @@
 from tests.unit.author.repository.conftest import AuthorRepositoryConftest
 
 from src.application.exceptions import OptimisticLockException
+from src.infrastructure.adapters.database.db.query_counter import count_queries
 
 
 class TestUpsertAuthor(AuthorRepositoryConftest):
@@ -29,3 +30,16 @@ class TestUpsertAuthor(AuthorRepositoryConftest):
         author.version = author.version - 1
         with self.assertRaises(OptimisticLockException):
             self.author_write_repository.upsert_author(author=author)
+
+    def test_upsert_is_a_single_statement(self):
+        # Arrange
+        author = self.author_model_factory.build(version=1)
+        self.author_write_repository.upsert_author(author=author)
+        author.version = 2
+
+        # Act
+        with count_queries() as counter:
+            self.author_write_repository.upsert_author(author=author)
+
+        # Assert
+        self.assertEqual(counter.count, 1)
@@ -10,25 +10,25 @@ class TestGetAuthorById(AuthorUseCaseConftest):
         self.get_author_by_id = GetAuthorById(
             author_repository=self.mock_author_read_repository,
         )
-        self.mock_author_read_repository.get_author_by_id.return_value = None
-        self.mock_author_read_repository.get_author_by_id.side_effect = None
+        self.mock_author_read_repository.get_author_by_id_async.return_value = None
+        self.mock_author_read_repository.get_author_by_id_async.side_effect = None
 
     def tearDown(self):
         super().tearDown()
-        self.mock_author_read_repository.get_author_by_id.reset_mock()
+        self.mock_author_read_repository.get_author_by_id_async.reset_mock()
 
-    def test_execute_existing_author(self):
+    async def test_execute_existing_author(self):
         # Arrange
         author = self.author_model_factory.build()
 
         # Mock repository response
-        self.mock_author_read_repository.get_author_by_id.return_value = author
+        self.mock_author_read_repository.get_author_by_id_async.return_value = author
 
         # Act
-        result = self.get_author_by_id.execute(author.id)
+        result = await self.get_author_by_id.execute(author.id)
 
         # Assert
-        self.mock_author_read_repository.get_author_by_id.assert_called_once_with(
+        self.mock_author_read_repository.get_author_by_id_async.assert_called_once_with(
             author.id,
         )
         # The result should be a validated Author entity
@@ -0,0 +1,66 @@
+from tests.unit.book.repository.conftest import BookRepositoryConftest
+
+from src.infrastructure.adapters.database.elasticsearch.index_manager import (
+    BookIndexManager,
+)
+
+
+class TestBookIndexManager(BookRepositoryConftest):
+    def setUp(self):
+        super().setUp()
+        self.alias = self.elasticsearch_index_config.books_index
+        self.index_manager = BookIndexManager(
+            self.elasticsearch_client,
+            self.elasticsearch_index_config,
+        )
+
+    def tearDown(self):
+        indices = self.elasticsearch_client.client.indices
+        if indices.exists_alias(name=self.alias):
+            for index in indices.get_alias(name=self.alias):
+                indices.delete(index=index)
+        super().tearDown()
+
+    def test_validate_managed_index(self):
+        # Act
+        problems = self.index_manager.validate()
+
+        # Assert
+        self.assertEqual(problems, [])
+
+    def test_validate_reports_mapping_drift(self):
+        # Arrange
+        indices = self.elasticsearch_client.client.indices
+        indices.delete(index=self.alias)
+        self.elasticsearch_client.client.options(
+            ignore_status=404,
+        ).indices.delete_index_template(name=self.alias)
+        indices.create(
+            index=self.alias,
+            mappings={"properties": {"editor": {"type": "keyword"}}},
+        )
+
+        # Act
+        problems = self.index_manager.validate()
+
+        # Assert
+        self.assertIn(f"{self.alias}: dynamic is True", problems)
+        self.assertIn(
+            f"{self.alias}.editor: type is keyword, expected text",
+            problems,
+        )
+        self.assertIn(f"{self.alias}.authors: missing", problems)
+
+    def test_ensure_index_creates_aliased_index(self):
+        # Arrange
+        self.elasticsearch_client.client.indices.delete(index=self.alias)
+
+        # Act
+        problems = self.index_manager.ensure_index()
+
+        # Assert
+        self.assertEqual(problems, [])
+        aliases = self.elasticsearch_client.client.indices.get_alias(name=self.alias)
+        self.assertEqual(len(aliases), 1)
+        self.assertTrue(next(iter(aliases)).startswith(f"{self.alias}-"))
+        self.assertEqual(self.index_manager.validate(), [])
@@ -0,0 +1,126 @@
+from unittest.mock import patch
+
+from tests.unit.book.repository.conftest import BookRepositoryConftest
+from uuid6 import uuid7
+
+from src.domain.entities.book import BookSearchFilter
+from src.infrastructure.adapters.database.cache.book_search_cache import (
+    BookSearchCache,
+    book_search_attributes,
+)
+from src.infrastructure.adapters.database.repository.book_read import BookReadRepository
+from src.infrastructure.settings.config import BookSearchCacheConfig
+
+
+class TestBookSearchCache(BookRepositoryConftest):
+    def setUp(self):
+        super().setUp()
+        self.search_cache = BookSearchCache(
+            BookSearchCacheConfig(ttl_seconds=60, max_entries=2),
+        )
+        self.cached_book_read_repository = BookReadRepository(
+            db=self.db,
+            elasticsearch_client=self.async_elasticsearch_client,
+            search_cache=self.search_cache,
+        )
+        self.cached_book_read_repository.es_index = (
+            self.elasticsearch_index_config.books_index
+        )
+        author = self.author_model_factory.build()
+        book_category = self.book_category_model_factory.build()
+        self.author_write_repository.upsert_author(author=author)
+        self.book_category_write_repository.upsert_book_category(
+            book_category=book_category,
+        )
+        self.book = self.book_write_repository.upsert_book(
+            book=self.book_model_factory.build(
+                authors=[author],
+                book_categories=[book_category],
+                book_data=[self.book_data_model_factory.build()],
+            ),
+        )
+
+    async def test_equivalent_filters_share_an_entry(self):
+        # Arrange
+        first_filter = BookSearchFilter(languages=["pt", "en"], editor=" Editor ")
+        second_filter = BookSearchFilter(languages=["en", "pt"], editor="Editor")
+
+        # Act
+        with patch.object(
+            self.cached_book_read_repository,
+            "_search_books",
+            wraps=self.cached_book_read_repository._search_books,
+        ) as search_books:
+            await self.cached_book_read_repository.get_book_by_filter(
+                filter=first_filter
+            )
+            await self.cached_book_read_repository.get_book_by_filter(
+                filter=second_filter
+            )
+
+        # Assert
+        self.assertEqual(search_books.call_count, 1)
+        self.assertEqual(self.search_cache.stats.hits, 1)
+        self.assertEqual(self.search_cache.stats.misses, 1)
+
+    async def test_cursor_pages_are_not_cached(self):
+        # Act
+        await self.cached_book_read_repository.get_book_by_filter(
+            filter=BookSearchFilter(cursor="*"),
+        )
+
+        # Assert
+        self.assertEqual(self.search_cache.snapshot()["entries"], 0)
+
+    async def test_least_recently_used_entry_is_evicted(self):
+        # Act
+        for edition in range(3):
+            await self.cached_book_read_repository.get_book_by_filter(
+                filter=BookSearchFilter(edition=edition),
+            )
+
+        # Assert
+        self.assertEqual(self.search_cache.snapshot()["entries"], 2)
+        self.assertEqual(self.search_cache.stats.evictions, 1)
+        self.assertIsNone(
+            self.search_cache.get(
+                self.search_cache.key(BookSearchFilter(edition=0)),  # type: ignore
+            ),
+        )
+
+    async def test_invalidate_drops_results_containing_the_book(self):
+        # Arrange
+        await self.cached_book_read_repository.get_book_by_filter(
+            filter=BookSearchFilter(),
+        )
+        await self.cached_book_read_repository.get_book_by_filter(
+            filter=BookSearchFilter(isbn_code="978-0-000000-00-0"),
+        )
+
+        # Act
+        self.search_cache.invalidate(str(self.book.id))
+
+        # Assert
+        self.assertEqual(self.search_cache.snapshot()["entries"], 1)
+        self.assertEqual(self.search_cache.stats.invalidations, 1)
+
+    async def test_upsert_invalidation_keeps_searches_the_book_cannot_enter(self):
+        # Arrange
+        other_edition = BookSearchFilter(edition=self.book.edition + 1)
+        same_edition = BookSearchFilter(edition=self.book.edition)
+        for filter in (other_edition, same_edition):
+            await self.cached_book_read_repository.get_book_by_filter(filter=filter)
+
+        # Act
+        self.search_cache.invalidate_upsert(
+            str(uuid7()),
+            book_search_attributes(self.book),
+        )
+
+        # Assert - Only the search the upserted book could enter is dropped
+        self.assertIsNotNone(
+            self.search_cache.get(self.search_cache.key(other_edition)),  # type: ignore
+        )
+        self.assertIsNone(
+            self.search_cache.get(self.search_cache.key(same_edition)),  # type: ignore
+        )
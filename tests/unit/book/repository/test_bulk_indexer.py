@@ -0,0 +1,221 @@
+import os
+from unittest.mock import Mock, patch
+
+from tests.unit.book.repository.conftest import BookRepositoryConftest
+
+from src.infrastructure.adapters.database.elasticsearch.bulk_indexer import (
+    BulkIndexer,
+)
+from src.infrastructure.adapters.database.repository.book_write import (
+    BookWriteRepository,
+)
+from src.infrastructure.settings.config import ElasticsearchBulkConfig, LogstashConfig
+
+
+class TestBulkIndexer(BookRepositoryConftest):
+    def setUp(self):
+        super().setUp()
+        self.bulk_indexer = BulkIndexer(
+            self.elasticsearch_client,
+            ElasticsearchBulkConfig(max_actions=2, refresh="wait_for"),
+        )
+        self.bulk_book_write_repository = BookWriteRepository(
+            db=self.db,
+            elasticsearch_client=self.elasticsearch_client,
+            bulk_indexer=self.bulk_indexer,
+        )
+        self.bulk_book_write_repository.es_index = (
+            self.elasticsearch_index_config.books_index
+        )
+
+    def _build_book(self):
+        author = self.author_model_factory.build()
+        book_category = self.book_category_model_factory.build()
+        self.author_write_repository.upsert_author(author=author)
+        self.book_category_write_repository.upsert_book_category(
+            book_category=book_category,
+        )
+        return self.book_model_factory.build(
+            authors=[author],
+            book_categories=[book_category],
+            book_data=[self.book_data_model_factory.build()],
+        )
+
+    def test_flush_indexes_buffered_books_and_acks(self):
+        # Arrange
+        books = [self._build_book() for _ in range(2)]
+        ack, nack = Mock(), Mock()
+
+        # Act
+        for book in books:
+            self.bulk_book_write_repository.upsert_book(book=book)
+            self.bulk_indexer.defer(str(book.id), ack=ack, nack=nack)
+        full = self.bulk_indexer.is_full()
+        self.bulk_indexer.flush()
+
+        # Assert
+        self.assertTrue(full)
+        self.assertEqual(ack.call_count, 2)
+        nack.assert_not_called()
+        for book in books:
+            self.assertTrue(
+                self.elasticsearch_client.client.exists(
+                    index=self.elasticsearch_index_config.books_index,
+                    id=str(book.id),
+                ),
+            )
+
+    def test_flush_deletes_buffered_books(self):
+        # Arrange
+        book = self._build_book()
+        self.bulk_book_write_repository.upsert_book(book=book)
+        self.bulk_indexer.flush()
+        ack, nack = Mock(), Mock()
+
+        # Act
+        self.bulk_book_write_repository.delete_book(id=str(book.id))
+        self.bulk_indexer.defer(str(book.id), ack=ack, nack=nack)
+        self.bulk_indexer.flush()
+
+        # Assert
+        ack.assert_called_once()
+        nack.assert_not_called()
+        self.assertFalse(
+            self.elasticsearch_client.client.exists(
+                index=self.elasticsearch_index_config.books_index,
+                id=str(book.id),
+            ),
+        )
+
+    def test_flush_nacks_rejected_documents(self):
+        # Arrange
+        es_client = Mock()
+        rejected = {"index": {"_id": "rejected", "status": 429}}
+        es_client.client.bulk.side_effect = [
+            {
+                "errors": True,
+                "items": [
+                    {"index": {"_id": "accepted", "status": 201}},
+                    rejected,
+                    {"delete": {"_id": "missing", "status": 404}},
+                ],
+            },
+            {"errors": True, "items": [rejected]},
+        ]
+        bulk_indexer = BulkIndexer(
+            es_client,
+            ElasticsearchBulkConfig(max_retries=1, retry_backoff_seconds=0),
+        )
+        accepted_ack, rejected_ack, missing_ack = Mock(), Mock(), Mock()
+        rejected_nack = Mock()
+        bulk_indexer.index("books", "accepted", {"id": "accepted"}, 1)
+        bulk_indexer.index("books", "rejected", {"id": "rejected"}, 1)
+        bulk_indexer.delete("books", "missing")
+        bulk_indexer.defer("accepted", ack=accepted_ack, nack=Mock())
+        bulk_indexer.defer("rejected", ack=rejected_ack, nack=rejected_nack)
+        bulk_indexer.defer("missing", ack=missing_ack, nack=Mock())
+
+        # Act
+        bulk_indexer.flush()
+
+        # Assert
+        accepted_ack.assert_called_once()
+        missing_ack.assert_called_once()
+        rejected_ack.assert_not_called()
+        rejected_nack.assert_called_once()
+        self.assertEqual(
+            es_client.client.bulk.call_args.kwargs["operations"],
+            [
+                {
+                    "index": {
+                        "_index": "books",
+                        "_id": "rejected",
+                        "version": 1,
+                        "version_type": "external_gte",
+                    },
+                },
+                {"id": "rejected"},
+            ],
+        )
+
+    def test_flush_keeps_the_newer_version_of_a_document(self):
+        # Arrange
+        book = self._build_book()
+        book.version = 2
+        self.bulk_book_write_repository.upsert_book(book=book)
+        self.bulk_indexer.flush()
+        ack, nack = Mock(), Mock()
+
+        # Act - A document read before the newer write arrives late
+        stale_document = {"id": str(book.id), "version": 1}
+        self.bulk_indexer.index(
+            self.elasticsearch_index_config.books_index,
+            str(book.id),
+            stale_document,
+            1,
+        )
+        self.bulk_indexer.defer(str(book.id), ack=ack, nack=nack)
+        self.bulk_indexer.flush()
+
+        # Assert
+        ack.assert_called_once()
+        nack.assert_not_called()
+        document = self.elasticsearch_client.client.get(
+            index=self.elasticsearch_index_config.books_index,
+            id=str(book.id),
+        )
+        self.assertEqual(document["_version"], 2)
+
+    def test_flush_retries_throttled_documents(self):
+        # Arrange
+        es_client = Mock()
+        es_client.client.bulk.side_effect = [
+            {"errors": True, "items": [{"index": {"_id": "id", "status": 503}}]},
+            {"errors": False, "items": [{"index": {"_id": "id", "status": 200}}]},
+        ]
+        bulk_indexer = BulkIndexer(es_client, ElasticsearchBulkConfig())
+        ack, nack = Mock(), Mock()
+        bulk_indexer.index("books", "id", {"id": "id"}, 1)
+        bulk_indexer.defer("id", ack=ack, nack=nack)
+
+        # Act
+        with patch(
+            "src.infrastructure.adapters.database.elasticsearch.bulk_indexer.time.sleep",
+        ) as sleep:
+            bulk_indexer.flush()
+
+        # Assert
+        ack.assert_called_once()
+        nack.assert_not_called()
+        sleep.assert_called_once_with(0.5)
+
+    def test_flush_nacks_everything_when_request_fails(self):
+        # Arrange
+        es_client = Mock()
+        es_client.client.bulk.side_effect = ConnectionError("unavailable")
+        bulk_indexer = BulkIndexer(
+            es_client,
+            ElasticsearchBulkConfig(max_retries=2, retry_backoff_seconds=0),
+        )
+        ack, nack = Mock(), Mock()
+        bulk_indexer.index("books", "id", {"id": "id"}, 1)
+        bulk_indexer.defer("id", ack=ack, nack=nack)
+
+        # Act / Assert
+        with self.assertRaises(ConnectionError):
+            bulk_indexer.flush()
+        self.assertEqual(es_client.client.bulk.call_count, 3)
+        ack.assert_not_called()
+        nack.assert_called_once()
+        self.assertFalse(bulk_indexer.is_full())
+
+    def test_cached_searches_make_bulk_requests_wait_for_the_refresh(self):
+        # Act
+        with self.assertLogs(LogstashConfig().loggername, level="WARNING") as logs:
+            config = ElasticsearchBulkConfig(refresh="false")
+
+        # Assert
+        self.assertEqual(config.refresh, "wait_for")
+        self.assertIn("ELASTICSEARCH_BULK_REFRESH=false", logs.output[0])
+        with patch.dict(os.environ, {"BOOK_SEARCH_CACHE_ENABLED": "false"}):
+            self.assertEqual(ElasticsearchBulkConfig().refresh, "false")
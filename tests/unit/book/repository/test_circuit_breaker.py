@@ -0,0 +1,172 @@
+import asyncio
+from unittest.mock import patch
+
+from elastic_transport import ApiResponseMeta, HttpHeaders, NodeConfig
+from elasticsearch import BadRequestError
+from tests.unit.book.repository.conftest import BookRepositoryConftest
+
+from src.domain.entities.book import BookSearchFilter
+from src.infrastructure.adapters.database.elasticsearch.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from src.infrastructure.adapters.database.repository.book_read import BookReadRepository
+from src.infrastructure.settings.config import ElasticsearchCircuitBreakerConfig
+
+
+class TestCircuitBreaker(BookRepositoryConftest):
+    def setUp(self):
+        super().setUp()
+        self.circuit_breaker = CircuitBreaker(
+            ElasticsearchCircuitBreakerConfig(
+                minimum_calls=2,
+                error_rate_threshold=0.5,
+                slow_call_seconds=1.0,
+                open_seconds=10.0,
+                half_open_max_calls=1,
+            ),
+        )
+        self.guarded_book_read_repository = BookReadRepository(
+            db=self.db,
+            elasticsearch_client=self.async_elasticsearch_client,
+            circuit_breaker=self.circuit_breaker,
+        )
+        self.guarded_book_read_repository.es_index = (
+            self.elasticsearch_index_config.books_index
+        )
+        author = self.author_model_factory.build()
+        book_category = self.book_category_model_factory.build()
+        self.author_write_repository.upsert_author(author=author)
+        self.book_category_write_repository.upsert_book_category(
+            book_category=book_category,
+        )
+        self.book = self.book_write_repository.upsert_book(
+            book=self.book_model_factory.build(
+                authors=[author],
+                book_categories=[book_category],
+                book_data=[self.book_data_model_factory.build()],
+            ),
+        )
+
+    async def test_failures_open_the_circuit_and_fall_back(self):
+        # Arrange
+        with patch.object(
+            self.guarded_book_read_repository,
+            "_search_books_elasticsearch",
+            side_effect=ConnectionError("down"),
+        ):
+            for _ in range(2):
+                await self.guarded_book_read_repository.get_book_by_filter(
+                    filter=BookSearchFilter(),
+                )
+
+        # Act
+        with patch.object(
+            self.guarded_book_read_repository,
+            "_search_books_elasticsearch",
+        ) as search_books_elasticsearch:
+            result = await self.guarded_book_read_repository.get_book_by_filter(
+                filter=BookSearchFilter(),
+            )
+
+        # Assert
+        self.assertEqual(self.circuit_breaker.state, CircuitState.OPEN)
+        search_books_elasticsearch.assert_not_called()
+        self.assertEqual([book.id for book in result.books], [self.book.id])
+
+    async def test_rejected_requests_do_not_open_the_circuit(self):
+        # Arrange
+        bad_request = BadRequestError(
+            message="Result window is too large",
+            meta=ApiResponseMeta(
+                status=400,
+                http_version="1.1",
+                headers=HttpHeaders(),
+                duration=0.0,
+                node=NodeConfig(scheme="http", host="localhost", port=9200),
+            ),
+            body={},
+        )
+
+        # Act
+        with patch.object(
+            self.guarded_book_read_repository,
+            "_search_books_elasticsearch",
+            side_effect=bad_request,
+        ):
+            for _ in range(3):
+                await self.guarded_book_read_repository.get_book_by_filter(
+                    filter=BookSearchFilter(),
+                )
+
+        # Assert
+        self.assertEqual(self.circuit_breaker.state, CircuitState.CLOSED)
+
+    async def test_half_open_probe_closes_the_circuit(self):
+        # Arrange
+        with patch(
+            "src.infrastructure.adapters.database.elasticsearch.circuit_breaker.time.monotonic",
+            return_value=100.0,
+        ):
+            self.circuit_breaker.record(0.1, failed=True)
+            self.circuit_breaker.record(0.1, failed=True)
+
+        # Act
+        with patch(
+            "src.infrastructure.adapters.database.elasticsearch.circuit_breaker.time.monotonic",
+            return_value=111.0,
+        ):
+            result = await self.guarded_book_read_repository.get_book_by_filter(
+                filter=BookSearchFilter(),
+            )
+
+        # Assert
+        self.assertEqual(self.circuit_breaker.state, CircuitState.CLOSED)
+        self.assertEqual([book.id for book in result.books], [self.book.id])
+
+    async def test_cancelled_half_open_probe_gives_back_its_slot(self):
+        # Arrange
+        probing = asyncio.Event()
+
+        async def hanging_search(filter):
+            probing.set()
+            await asyncio.Event().wait()
+
+        with patch(
+            "src.infrastructure.adapters.database.elasticsearch.circuit_breaker.time.monotonic",
+            return_value=100.0,
+        ):
+            self.circuit_breaker.record(0.1, failed=True)
+            self.circuit_breaker.record(0.1, failed=True)
+
+        # Act - The client goes away while the probe waits on Elasticsearch
+        with patch(
+            "src.infrastructure.adapters.database.elasticsearch.circuit_breaker.time.monotonic",
+            return_value=111.0,
+        ), patch.object(
+            self.guarded_book_read_repository,
+            "_search_books_elasticsearch",
+            side_effect=hanging_search,
+        ):
+            search = asyncio.create_task(
+                self.guarded_book_read_repository.get_book_by_filter(
+                    filter=BookSearchFilter(),
+                ),
+            )
+            await probing.wait()
+            search.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await search
+
+            # Assert - The next search may probe Elasticsearch again
+            self.assertEqual(self.circuit_breaker.state, CircuitState.HALF_OPEN)
+            self.assertTrue(self.circuit_breaker.allow_request())
+
+    def test_slow_calls_open_the_circuit(self):
+        # Act
+        self.circuit_breaker.record(1.5, failed=False)
+        self.circuit_breaker.record(1.5, failed=False)
+
+        # Assert
+        self.assertEqual(self.circuit_breaker.state, CircuitState.OPEN)
+        self.assertFalse(self.circuit_breaker.allow_request())
@@ -0,0 +1,33 @@
+from tests.unit.book.repository.conftest import BookRepositoryConftest
+from uuid6 import uuid7
+
+from src.application.exceptions import NotFoundException
+from src.infrastructure.adapters.database.db.pool_metrics import get_pool_metrics
+
+
+class TestDatabasePool(BookRepositoryConftest):
+
+    def test_checkouts_are_counted_per_engine(self):
+        # Arrange
+        slave_checkouts = get_pool_metrics("slave").checkouts
+
+        # Act
+        with self.assertRaises(NotFoundException):
+            self.book_read_repository.get_book_by_id(id=uuid7())
+        snapshot = self.db.pool_snapshot()
+
+        # Assert - The read went to the slave and gave its connection back
+        self.assertEqual(snapshot["slave"]["checkouts"], slave_checkouts + 1)
+        self.assertEqual(snapshot["slave"]["checked_out"], 0)
+        self.assertEqual(snapshot["slave"]["timeouts"], 0)
+        self.assertIn("master", snapshot)
+
+    async def test_async_engine_pool_is_published(self):
+        # Act
+        with self.assertRaises(NotFoundException):
+            await self.book_read_repository.get_book_by_id_async(id=uuid7())
+        snapshot = self.db.pool_snapshot()
+
+        # Assert
+        self.assertGreaterEqual(snapshot["slave_async"]["checkouts"], 1)
+        self.assertEqual(snapshot["slave_async"]["checked_out"], 0)
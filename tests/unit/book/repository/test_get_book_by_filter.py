@@ -1,6 +1,12 @@
+from typing import Any, Dict, Set
+from unittest.mock import patch
+
+from sqlmodel import select, text
 from tests.unit.book.repository.conftest import BookRepositoryConftest
 
+from src.application.exceptions import InvalidDataException
 from src.domain.entities.book import BookSearchFilter
+from src.infrastructure.adapters.database.models.book import Book as BookModel
 
 
 class TestGetBookByFilter(BookRepositoryConftest):
@@ -84,35 +90,237 @@ class TestGetBookByFilter(BookRepositoryConftest):
         self.book_write_repository.upsert_book(book=self.book2)
         self.book_write_repository.upsert_book(book=self.book3)
 
-    def test_comprehensive_search_filter(self):
+    async def test_comprehensive_search_filter(self):
         """Test BookSearchFilter with multiple filter criteria using both PostgreSQL and Elasticsearch"""
 
         # Arrange - Create a comprehensive search filter
         search_filter = BookSearchFilter(
             isbn_code=self.book1.isbn_code,
             editor=self.book1.editor,
-            text_query="programming",  # Elasticsearch-specific
+            text_query=self.book_data1.title,  # Elasticsearch-specific
             author_name=self.author1.name,
             page=1,
             size=10,
             sort_by="created_at",
             sort_order="desc",
         )
-        results = self.book_read_repository.get_book_by_filter(filter=search_filter)
-        self.validate_book([self.book1], results)
+        results = await self.book_read_repository.get_book_by_filter(
+            filter=search_filter
+        )
+        self.validate_book([self.book1], results.books)
 
-    def test_filter_not_found(self):
+    async def test_filter_not_found(self):
         # Act - Filter by non-existent ISBN
         filter_criteria = BookSearchFilter(isbn_code="978-0-000000-00-0")
-        results = self.book_read_repository.get_book_by_filter(filter=filter_criteria)
+        results = await self.book_read_repository.get_book_by_filter(
+            filter=filter_criteria
+        )
 
         # Assert - Should return empty list
-        self.assertEqual(results, [])
+        self.assertEqual(results.books, [])
 
-    def test_empty_filter_returns_all(self):
+    async def test_empty_filter_returns_all(self):
         # Act - Call with empty filter
         empty_filter = BookSearchFilter()
-        results = self.book_read_repository.get_book_by_filter(filter=empty_filter)
+        results = await self.book_read_repository.get_book_by_filter(
+            filter=empty_filter
+        )
 
         # Assert - Should return all books
-        self.validate_book([self.book1, self.book2, self.book3], results)
+        self.validate_book([self.book1, self.book2, self.book3], results.books)
+
+    async def test_cursor_walks_all_books(self):
+        # Act - Walk the index two books at a time
+        first_page = await self.book_read_repository.get_book_by_filter(
+            filter=BookSearchFilter(size=2, cursor="*"),
+        )
+        second_page = await self.book_read_repository.get_book_by_filter(
+            filter=BookSearchFilter(size=2, cursor=first_page.next_cursor),
+        )
+
+        # Assert - Pages do not overlap and the walk ends on the last page
+        self.assertEqual(len(first_page.books), 2)
+        self.assertIsNotNone(first_page.next_cursor)
+        self.assertEqual(len(second_page.books), 1)
+        self.assertIsNone(second_page.next_cursor)
+        self.validate_book(
+            [self.book1, self.book2, self.book3],
+            first_page.books + second_page.books,
+        )
+
+    async def test_facets_count_matching_books(self):
+        # Act - Request facets for the books written by author1
+        results = await self.book_read_repository.get_book_by_filter(
+            filter=BookSearchFilter(author_name=self.author1.name, facets=True),
+        )
+
+        # Assert - Counts only cover the matching book
+        facets = results.facets
+        self.assertEqual(
+            [(bucket.key, bucket.count) for bucket in facets.type],
+            [(self.book1.type, 1)],
+        )
+        self.assertCountEqual(
+            [(bucket.key, bucket.label, bucket.count) for bucket in facets.author],
+            [
+                (str(self.author1.id), self.author1.name, 1),
+                (str(self.author2.id), self.author2.name, 1),
+            ],
+        )
+        self.assertCountEqual(
+            [(bucket.key, bucket.count) for bucket in facets.category],
+            [(str(self.book_category1.id), 1), (str(self.book_category2.id), 1)],
+        )
+        self.assertEqual(
+            sum(bucket.count for bucket in facets.publish_date),
+            1,
+        )
+        self.assertTrue(
+            all(bucket.count == 1 for bucket in facets.language),
+        )
+
+    async def test_invalid_cursor(self):
+        # Act & Assert - A cursor that was not issued by the service is rejected
+        with self.assertRaises(InvalidDataException):
+            await self.book_read_repository.get_book_by_filter(
+                filter=BookSearchFilter(cursor="not-a-cursor"),
+            )
+
+    async def test_fields_projection(self):
+        # Act - Select the isbn code and the titles only
+        results = await self.book_read_repository.get_book_by_filter(
+            filter=BookSearchFilter(
+                isbn_code=self.book1.isbn_code,
+                fields=["isbn_code", "book_data.title"],
+            ),
+        )
+
+        # Assert - Only the selected fields are set on the book
+        book = results.books[0]
+        self.assertEqual(book.model_fields_set, {"id", "isbn_code", "book_data"})
+        self.assertEqual(book.isbn_code, self.book1.isbn_code)
+        self.assertCountEqual(
+            [data.model_dump(exclude_unset=True) for data in book.book_data],
+            [
+                {"id": data.id, "title": data.title}
+                for data in [self.book_data1, self.book_data2]
+            ],
+        )
+
+    async def test_total_counts_every_matching_book(self):
+        # Act - Ask for a page smaller than the result
+        results = await self.book_read_repository.get_book_by_filter(
+            filter=BookSearchFilter(size=1),
+        )
+
+        # Assert - The total covers every book, not only the page
+        self.assertEqual(len(results.books), 1)
+        self.assertEqual(results.total, 3)
+        self.assertEqual(results.total_relation, "eq")
+
+    async def test_count_books(self):
+        # Act
+        count = await self.book_read_repository.count_books(
+            filter=BookSearchFilter(author_name=self.author1.name),
+        )
+
+        # Assert
+        self.assertEqual(count, 1)
+
+    async def test_postgresql_fallback_applies_text_filters(self):
+        # Act - Query PostgreSQL directly, as when Elasticsearch is down
+        by_title = await self.book_read_repository._search_books_postgresql(
+            BookSearchFilter(title_query=self.book_data3.title),
+        )
+        by_text = await self.book_read_repository._search_books_postgresql(
+            BookSearchFilter(text_query=self.author5.name),
+        )
+        by_language = await self.book_read_repository._search_books_postgresql(
+            BookSearchFilter(languages=["not-a-language"]),
+        )
+
+        # Assert
+        self.assertEqual([book.id for book in by_title.books], [self.book2.id])
+        self.assertEqual([book.id for book in by_text.books], [self.book3.id])
+        self.assertEqual(by_language.books, [])
+
+    async def test_postgresql_fallback_keyset_walk(self):
+        # Act - Walk PostgreSQL two books at a time
+        first_page = await self.book_read_repository._search_books_postgresql(
+            BookSearchFilter(size=2, cursor="*"),
+        )
+        second_page = await self.book_read_repository._search_books_postgresql(
+            BookSearchFilter(size=2, cursor=first_page.next_cursor),
+        )
+
+        # Assert - Pages do not overlap and the walk ends on the last page
+        books = first_page.books + second_page.books
+        self.assertIsNotNone(first_page.next_cursor)
+        self.assertIsNone(second_page.next_cursor)
+        self.assertCountEqual(
+            [book.id for book in books],
+            [self.book1.id, self.book2.id, self.book3.id],
+        )
+        self.assertEqual(
+            [book.created_at for book in books],
+            sorted((book.created_at for book in books), reverse=True),
+        )
+
+    async def test_postgresql_fallback_counts_the_first_page_only(self):
+        # Act - Count exactly up to two books
+        with patch.object(self.book_read_repository.es_config, "track_total_hits", 2):
+            first_page = await self.book_read_repository._search_books_postgresql(
+                BookSearchFilter(size=2, cursor="*"),
+            )
+            second_page = await self.book_read_repository._search_books_postgresql(
+                BookSearchFilter(size=2, cursor=first_page.next_cursor),
+            )
+            by_category = await self.book_read_repository._search_books_postgresql(
+                BookSearchFilter(category_title=self.book_category1.title),
+            )
+
+        # Assert - The total is capped like track_total_hits
+        self.assertEqual((first_page.total, first_page.total_relation), (2, "gte"))
+        self.assertEqual((second_page.total, second_page.total_relation), (None, None))
+        self.assertEqual(by_category.total_relation, "eq")
+
+    def test_postgresql_category_filter_plan_is_a_semi_join(self):
+        # Arrange
+        statement = self.book_read_repository._filter_books_postgresql(
+            select(BookModel),
+            BookSearchFilter(category_title=self.book_category1.title),
+        )
+
+        # Act
+        with self.db.get_session(slave=True) as session:
+            sql = statement.compile(
+                dialect=session.get_bind().dialect,
+                compile_kwargs={"literal_binds": True},
+            )
+            plan = session.exec(text(f"EXPLAIN (FORMAT JSON) {sql}")).one()[0]  # type: ignore
+
+        # Assert - Categories are only probed per book, never joined to every book
+        self.assertEqual(
+            self._relations_outside_semi_join(plan[0]["Plan"])
+            & {"book_category", "book_book_category_link"},
+            set(),
+        )
+
+    def _relations_outside_semi_join(
+        self,
+        node: Dict[str, Any],
+        inside: bool = False,
+    ) -> Set[str]:
+        """Relations scanned outside a semi-join, EXISTS subplan or its unique-ified form"""
+        inside = (
+            inside
+            or "Semi" in node.get("Join Type", "")
+            or node.get("Parent Relationship") == "SubPlan"
+            or node["Node Type"] in ("Unique", "Aggregate")
+        )
+        relations = set()
+        if not inside and "Relation Name" in node:
+            relations.add(node["Relation Name"])
+        for child in node.get("Plans", []):
+            relations |= self._relations_outside_semi_join(child, inside)
+        return relations
@@ -2,6 +2,7 @@ from tests.unit.book.repository.conftest import BookRepositoryConftest
 from uuid6 import uuid7
 
 from src.application.exceptions import NotFoundException
+from src.infrastructure.adapters.database.db.query_counter import count_queries
 
 
 class TestGetBookById(BookRepositoryConftest):
@@ -66,6 +67,57 @@ class TestGetBookById(BookRepositoryConftest):
             ),
         )
 
+    def test_get_book_fields_projection(self):
+        # Arrange
+        author = self.author_model_factory.build()
+        self.author_write_repository.upsert_author(author=author)
+        book = self.book_model_factory.build(
+            authors=[author],
+            book_categories=[],
+            book_data=[self.book_data_model_factory.build()],
+        )
+        self.book_write_repository.upsert_book(book=book)
+
+        # Act
+        result = self.book_read_repository.get_book_by_id(
+            id=book.id,
+            fields=["editor", "authors", "book_data.language"],
+        )
+
+        # Assert
+        self.assertEqual(
+            result.model_fields_set,
+            {"id", "editor", "authors", "book_data"},
+        )
+        self.assertEqual(result.editor, book.editor)
+        self.assertEqual(result.authors, [author])
+        self.assertEqual(
+            [data.model_dump(exclude_unset=True) for data in result.book_data],  # type: ignore
+            [
+                {"id": data.id, "language": data.language}
+                for data in book.book_data  # type: ignore
+            ],
+        )
+
+    def test_get_book_loads_relationships_eagerly(self):
+        # Arrange
+        authors = [self.author_model_factory.build() for _ in range(3)]
+        for author in authors:
+            self.author_write_repository.upsert_author(author=author)
+        book = self.book_model_factory.build(
+            authors=authors,
+            book_categories=[],
+            book_data=[self.book_data_model_factory.build() for _ in range(3)],
+        )
+        self.book_write_repository.upsert_book(book=book)
+
+        # Act
+        with count_queries() as counter:
+            self.book_read_repository.get_book_by_id(id=book.id)
+
+        # Assert - One query for the book and one per relationship
+        self.assertEqual(counter.count, 4)
+
     def test_get_non_existent_book(self):
         # Arrange - Generate a random UUID that doesn't exist
         non_existent_id = uuid7()
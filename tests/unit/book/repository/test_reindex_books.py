@@ -0,0 +1,143 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from tests.unit.book.repository.conftest import BookRepositoryConftest
+
+from src.infrastructure.adapters.database.elasticsearch.reindexer import (
+    BookReindexer,
+)
+from src.infrastructure.settings.config import ElasticsearchReindexConfig
+
+
+class TestReindexBooks(BookRepositoryConftest):
+    def setUp(self):
+        super().setUp()
+        self.alias = self.elasticsearch_index_config.books_index
+        self.reindexer = BookReindexer(
+            db=self.db,
+            elasticsearch_client=self.elasticsearch_client,
+            index_config=self.elasticsearch_index_config,
+            reindex_config=ElasticsearchReindexConfig(chunk_size=2, workers=2),
+        )
+        author = self.author_model_factory.build()
+        book_category = self.book_category_model_factory.build()
+        self.author_write_repository.upsert_author(author=author)
+        self.book_category_write_repository.upsert_book_category(
+            book_category=book_category,
+        )
+        self.books = [
+            self.book_write_repository.upsert_book(
+                book=self.book_model_factory.build(
+                    authors=[author],
+                    book_categories=[book_category],
+                    book_data=[self.book_data_model_factory.build()],
+                ),
+            )
+            for _ in range(3)
+        ]
+
+    def tearDown(self):
+        indices = self.elasticsearch_client.client.indices
+        if indices.exists_alias(name=self.alias):
+            for index in indices.get_alias(name=self.alias):
+                indices.delete(index=index)
+        super().tearDown()
+
+    def test_reindex_replaces_concrete_index_with_alias(self):
+        # Act
+        index = self.reindexer.reindex()
+
+        # Assert
+        aliases = self.elasticsearch_client.client.indices.get_alias(name=self.alias)
+        self.assertEqual(list(aliases.keys()), [index])
+        self.assertEqual(
+            self.elasticsearch_client.client.count(index=self.alias)["count"],
+            len(self.books),
+        )
+        settings = self.elasticsearch_client.client.indices.get_settings(index=index)
+        self.assertEqual(
+            settings[index]["settings"]["index"]["number_of_replicas"],
+            str(self.elasticsearch_index_config.number_of_replicas),
+        )
+        document = self.elasticsearch_client.client.get(
+            index=self.alias,
+            id=str(self.books[0].id),
+        )["_source"]
+        self.assertEqual(
+            document["author_ids"],
+            [str(author.id) for author in self.books[0].authors],
+        )
+
+    def test_reindex_deletes_previous_index(self):
+        # Arrange
+        first_index = self.reindexer.reindex()
+
+        # Act
+        second_index = self.reindexer.reindex(delete_previous=True)
+
+        # Assert
+        aliases = self.elasticsearch_client.client.indices.get_alias(name=self.alias)
+        self.assertEqual(list(aliases.keys()), [second_index])
+        self.assertFalse(
+            self.elasticsearch_client.client.indices.exists(index=first_index),
+        )
+
+    def test_reindex_drops_books_deleted_during_the_load(self):
+        # Arrange
+        load = self.reindexer._load
+        deleted_book = self.books[0]
+
+        def load_then_delete(index, chunks):
+            indexed = load(index, chunks)
+            # The delete reaches PostgreSQL and the index behind the alias only
+            self.book_write_repository.delete_book(id=str(deleted_book.id))
+            return indexed
+
+        # Act
+        with patch.object(self.reindexer, "_load", side_effect=load_then_delete):
+            self.reindexer.reindex()
+
+        # Assert
+        self.elasticsearch_client.client.indices.refresh(index=self.alias)
+        self.assertEqual(
+            self.elasticsearch_client.client.count(index=self.alias)["count"],
+            len(self.books) - 1,
+        )
+        self.assertFalse(
+            self.elasticsearch_client.client.exists(
+                index=self.alias,
+                id=str(deleted_book.id),
+            ),
+        )
+
+    def test_reindex_catches_up_writes_committed_during_the_load(self):
+        # Arrange
+        load = self.reindexer._load
+        updated_book = self.books[0].model_copy(
+            update={
+                "version": self.books[0].version + 1,
+                "editor": "Updated editor",
+                # The message was produced before the reindex started
+                "updated_at": self.books[0].updated_at - timedelta(days=1),
+            },
+        )
+        loads = []
+
+        def load_then_update(index, chunks):
+            indexed = load(index, chunks)
+            if not loads:
+                self.book_write_repository.upsert_book(book=updated_book)
+            loads.append(indexed)
+            return indexed
+
+        # Act
+        with patch.object(self.reindexer, "_load", side_effect=load_then_update):
+            self.reindexer.reindex()
+
+        # Assert
+        document = self.elasticsearch_client.client.get(
+            index=self.alias,
+            id=str(updated_book.id),
+        )
+        self.assertEqual(document["_version"], updated_book.version)
+        self.assertEqual(document["_source"]["editor"], "Updated editor")
@@ -0,0 +1,99 @@
+from unittest.mock import patch
+
+from tests.unit.book.repository.conftest import BookRepositoryConftest
+
+from src.infrastructure.adapters.database.db.replication import (
+    ReplicaStatus,
+    consistency_token,
+    lsn_to_int,
+    read_your_writes,
+)
+from src.infrastructure.adapters.database.db.session import DatabaseSettings
+
+
+class TestReplicaRouting(BookRepositoryConftest):
+
+    def test_write_advances_the_consistency_token(self):
+        # Arrange
+        author = self.author_model_factory.build()
+
+        # Act
+        with read_your_writes(None):
+            self.author_write_repository.upsert_author(author=author)
+            token = consistency_token()
+
+        # Assert - The token covers the commit, and the read sees it
+        self.assertIsNotNone(token)
+        self.assertLessEqual(
+            lsn_to_int(token),  # type: ignore
+            lsn_to_int(self.db.current_lsn()),
+        )
+        with read_your_writes(token):
+            self.assertEqual(
+                self.author_read_repository.get_author_by_id(id=author.id).id,
+                author.id,
+            )
+
+    def test_write_outside_a_request_does_not_fetch_the_wal_position(self):
+        # Arrange
+        author = self.author_model_factory.build()
+
+        # Act
+        with patch.object(
+            DatabaseSettings,
+            "current_lsn",
+            wraps=self.db.current_lsn,
+        ) as current_lsn:
+            self.author_write_repository.upsert_author(author=author)
+
+        # Assert
+        current_lsn.assert_not_called()
+        self.assertIsNone(consistency_token())
+
+    def test_replica_behind_the_token_falls_back_to_master(self):
+        # Arrange
+        status = ReplicaStatus(max_lag_seconds=1.0, status_ttl_seconds=10.0)
+        status.observe("0/16B3748", 0.0)
+
+        # Act & Assert
+        self.assertTrue(status.can_serve("0/16B3748"))
+        self.assertFalse(status.can_serve("0/16B3750"))
+        self.assertTrue(status.can_serve(None))
+        self.assertEqual(status.snapshot()["token_fallbacks"], 1)
+
+    def test_lagging_or_unreachable_replica_falls_back_to_master(self):
+        # Arrange
+        status = ReplicaStatus(max_lag_seconds=1.0, status_ttl_seconds=10.0)
+
+        # Act & Assert
+        status.observe("0/16B3748", 2.5)
+        self.assertFalse(status.can_serve(None))
+        status.observe_failure()
+        self.assertFalse(status.can_serve(None))
+        self.assertEqual(status.snapshot()["lagging_fallbacks"], 2)
+
+    def test_replica_position_is_probed_once_per_ttl(self):
+        # Arrange
+        status = ReplicaStatus(max_lag_seconds=1.0, status_ttl_seconds=10.0)
+
+        # Act & Assert
+        with patch(
+            "src.infrastructure.adapters.database.db.replication.time.monotonic",
+            return_value=100.0,
+        ):
+            self.assertTrue(status.needs_probe())
+            status.observe(None, 0.0)
+            self.assertFalse(status.needs_probe())
+        with patch(
+            "src.infrastructure.adapters.database.db.replication.time.monotonic",
+            return_value=111.0,
+        ):
+            self.assertTrue(status.needs_probe())
+
+    def test_primary_behind_the_slave_address_serves_every_token(self):
+        # Arrange
+        status = ReplicaStatus(max_lag_seconds=1.0, status_ttl_seconds=10.0)
+        status.observe(None, 0.0)
+
+        # Act & Assert
+        self.assertTrue(status.can_serve("FF/FFFFFFFF"))
@@ -0,0 +1,110 @@
+import os
+from collections import Counter
+from unittest.mock import patch
+
+from tests.unit.book.repository.conftest import BookRepositoryConftest
+
+from src.infrastructure.adapters.database.db.replicas import (
+    Replica,
+    ReplicaSet,
+    parse_replica_addresses,
+)
+from src.infrastructure.adapters.database.db.replication import ReplicaStatus
+from src.infrastructure.settings.config import (
+    ReplicaRoutingConfig,
+    SlaveDatabaseConfig,
+)
+
+
+class TestReplicaSet(BookRepositoryConftest):
+    def _replica_set(self, balancing: str, weights: list) -> ReplicaSet:
+        replicas = []
+        for index, weight in enumerate(weights):
+            status = ReplicaStatus(max_lag_seconds=1.0, status_ttl_seconds=10.0)
+            status.observe("0/16B3748", 0.0)
+            replicas.append(
+                Replica(
+                    name=f"slave_{index}",
+                    host="localhost",
+                    port=5433 + index,
+                    weight=weight,
+                    status=status,
+                ),
+            )
+        return ReplicaSet(replicas, ReplicaRoutingConfig(balancing=balancing))
+
+    def test_weighted_round_robin_follows_the_weights(self):
+        # Arrange
+        replica_set = self._replica_set("weighted_round_robin", [3, 1])
+
+        # Act
+        chosen = []
+        for _ in range(8):
+            replica = replica_set.acquire(None)
+            chosen.append(replica.name)  # type: ignore
+            replica_set.release(replica)  # type: ignore
+
+        # Assert
+        self.assertEqual(Counter(chosen), {"slave_0": 6, "slave_1": 2})
+
+    def test_least_outstanding_picks_the_idlest_replica(self):
+        # Arrange
+        replica_set = self._replica_set("least_outstanding", [1, 1, 1])
+        busy = [replica_set.acquire(None), replica_set.acquire(None)]
+
+        # Act
+        replica = replica_set.acquire(None)
+
+        # Assert - Every replica serves one read before any serves two
+        self.assertNotIn(replica, busy)
+        self.assertEqual(
+            [replica.outstanding for replica in replica_set.replicas],
+            [1, 1, 1],
+        )
+
+    def test_unhealthy_and_lagging_replicas_are_ejected(self):
+        # Arrange
+        replica_set = self._replica_set("least_outstanding", [1, 1])
+        replica_set.replicas[0].status.observe_failure()
+
+        # Act & Assert
+        for _ in range(3):
+            self.assertEqual(replica_set.acquire(None).name, "slave_1")  # type: ignore
+        replica_set.replicas[1].status.observe("0/16B3748", 5.0)
+        self.assertIsNone(replica_set.acquire(None))
+        self.assertEqual(replica_set.snapshot()["master_fallbacks"], 1)
+
+    def test_replicas_behind_the_token_are_skipped(self):
+        # Arrange
+        replica_set = self._replica_set("least_outstanding", [1, 1])
+        replica_set.replicas[1].status.observe("0/16B3750", 0.0)
+
+        # Act
+        replica = replica_set.acquire("0/16B3750")
+
+        # Assert
+        self.assertEqual(replica.name, "slave_1")  # type: ignore
+
+    def test_replica_addresses(self):
+        # Act & Assert
+        self.assertEqual(
+            parse_replica_addresses(["replica-1:5432:3", "replica-2:5433"], "", 0),
+            [("replica-1", 5432, 3), ("replica-2", 5433, 1)],
+        )
+        self.assertEqual(
+            parse_replica_addresses([], "postgres-slave", 5432),
+            [("postgres-slave", 5432, 1)],
+        )
+        with self.assertRaises(ValueError):
+            parse_replica_addresses(["replica-1:5432:0"], "", 0)
+
+    def test_replicas_read_from_a_comma_separated_environment_variable(self):
+        # Act
+        with patch.dict(
+            os.environ,
+            {"DATABASE_SLAVE_REPLICAS": "replica-1:5432:3, replica-2:5433"},
+        ):
+            config = SlaveDatabaseConfig()
+
+        # Assert
+        self.assertEqual(config.replicas, ["replica-1:5432:3", "replica-2:5433"])
@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+from tests.unit.book.repository.conftest import BookRepositoryConftest
+
+from src.domain.enums.suggestion_kind import SuggestionKind
+
+
+class TestSuggestBooks(BookRepositoryConftest):
+    def setUp(self):
+        super().setUp()
+        self.author = self.author_model_factory.build(name="Harriet Vane")
+        self.book_category = self.book_category_model_factory.build(title="Horror")
+        self.author_write_repository.upsert_author(author=self.author)
+        self.book_category_write_repository.upsert_book_category(
+            book_category=self.book_category,
+        )
+        self.book = self.book_write_repository.upsert_book(
+            book=self.book_model_factory.build(
+                authors=[self.author],
+                book_categories=[self.book_category],
+                book_data=[self.book_data_model_factory.build(title="Hard Times")],
+            ),
+        )
+
+    def _as_tuples(self, suggestions):
+        return {(s.kind, str(s.id), s.text) for s in suggestions}
+
+    async def test_suggest_titles_and_authors_by_prefix(self):
+        # Act
+        result = await self.book_read_repository.suggest_books("har", 5)
+
+        # Assert
+        self.assertEqual(
+            self._as_tuples(result),
+            {
+                (SuggestionKind.TITLE, str(self.book.id), "Hard Times"),
+                (SuggestionKind.AUTHOR, str(self.author.id), "Harriet Vane"),
+            },
+        )
+
+    async def test_suggest_categories_by_prefix(self):
+        # Act
+        result = await self.book_read_repository.suggest_books("hor", 5)
+
+        # Assert
+        self.assertEqual(
+            self._as_tuples(result),
+            {(SuggestionKind.CATEGORY, str(self.book_category.id), "Horror")},
+        )
+
+    async def test_suggest_falls_back_to_postgresql(self):
+        # Arrange
+        with patch.object(
+            self.book_read_repository,
+            "_suggest_books_elasticsearch",
+            side_effect=Exception("Elasticsearch unavailable"),
+        ):
+            # Act
+            result = await self.book_read_repository.suggest_books("har", 5)
+
+        # Assert
+        self.assertIn(
+            (SuggestionKind.TITLE, str(self.book.id), "Hard Times"),
+            self._as_tuples(result),
+        )
+        self.assertIn(
+            (SuggestionKind.AUTHOR, str(self.author.id), "Harriet Vane"),
+            self._as_tuples(result),
+        )
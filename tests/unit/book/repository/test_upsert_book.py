@@ -1,6 +1,11 @@
+from sqlmodel import select
 from tests.unit.book.repository.conftest import BookRepositoryConftest
 
 from src.application.exceptions import OptimisticLockException
+from src.domain.entities.book_data import BookData
+from src.infrastructure.adapters.database.models.author_book_link import (
+    AuthorBookLink as AuthorBookLinkModel,
+)
 
 
 class TestUpsertBook(BookRepositoryConftest):
@@ -79,6 +84,78 @@ class TestUpsertBook(BookRepositoryConftest):
         result = self.book_write_repository.upsert_book(book=book)
         self.validate_book([result], [book])
 
+    def test_update_book_keeps_unchanged_links(self):
+        # Arrange
+        book = self.book_model_factory.build(
+            authors=[self.author1, self.author2],
+            book_categories=[self.book_category1],
+            book_data=[self.book_data1],
+        )
+        self.book_write_repository.upsert_book(book=book)
+        with self.db.get_session() as session:
+            kept_link = session.exec(
+                select(AuthorBookLinkModel).where(
+                    AuthorBookLinkModel.book_id == book.id,
+                    AuthorBookLinkModel.author_id == self.author1.id,
+                ),
+            ).one()
+
+        # Act - Only the editor and one author change
+        book.editor = "Updated Editor"
+        book.authors = [self.author1, self.author3]
+        book.version = book.version + 1
+        result = self.book_write_repository.upsert_book(book=book)
+
+        # Assert - The link to the kept author was not rewritten
+        self.validate_book([result], [book])
+        with self.db.get_session() as session:
+            links = session.exec(
+                select(AuthorBookLinkModel).where(
+                    AuthorBookLinkModel.book_id == book.id,
+                ),
+            ).all()
+        self.assertEqual(
+            {link.author_id for link in links},
+            {self.author1.id, self.author3.id},
+        )
+        self.assertIn(kept_link.id, [link.id for link in links])
+
+    def test_update_book_keeps_unchanged_book_data(self):
+        # Arrange
+        book = self.book_model_factory.build(
+            authors=[self.author1],
+            book_categories=[self.book_category1],
+            book_data=[self.book_data1, self.book_data2],
+        )
+        self.book_write_repository.upsert_book(book=book)
+
+        # Act - Rebuilt like the update view does, every book data has a new id
+        book.book_data = [
+            BookData(
+                summary=book_data.summary,
+                title=book_data.title if book_data is self.book_data1 else "New title",
+                language=book_data.language,
+                created_by=book.updated_by,
+                updated_by=book.updated_by,
+            )
+            for book_data in [self.book_data1, self.book_data2]
+        ]
+        book.editor = "Updated Editor"
+        book.version = book.version + 1
+        result = self.book_write_repository.upsert_book(book=book)
+
+        # Assert - Rows are matched on language, so no row is replaced
+        self.assertEqual(
+            {
+                book_data.language: (book_data.id, book_data.title)
+                for book_data in result.book_data  # type: ignore
+            },
+            {
+                self.book_data1.language: (self.book_data1.id, self.book_data1.title),
+                self.book_data2.language: (self.book_data2.id, "New title"),
+            },
+        )
+
     def test_optimistic_lock_exception(self):
         # Arrange
         authors = [self.author1, self.author2]
@@ -106,3 +183,29 @@ class TestUpsertBook(BookRepositoryConftest):
         # Assert - Should raise OptimisticLockException
         with self.assertRaises(OptimisticLockException):
             self.book_write_repository.upsert_book(book=book)
+
+    def test_redelivered_upsert_indexes_the_committed_book_again(self):
+        # Arrange - The book was committed but its document never got indexed
+        book = self.book_model_factory.build(
+            authors=[self.author1],
+            book_categories=[self.book_category1],
+            book_data=[self.book_data1],
+        )
+        self.book_write_repository.upsert_book(book=book)
+        self.elasticsearch_client.client.delete(
+            index=self.book_write_repository.es_index,
+            id=str(book.id),
+            refresh="wait_for",
+        )
+
+        # Act
+        result = self.book_write_repository.upsert_book(book=book)
+
+        # Assert
+        self.validate_book([result], [book])
+        self.assertTrue(
+            self.elasticsearch_client.client.exists(
+                index=self.book_write_repository.es_index,
+                id=str(book.id),
+            ),
+        )
@@ -0,0 +1,29 @@
+from tests.unit.book.usecase.conftest import BookUseCaseConftest
+
+from src.application.dto.book_dto import BookFilter
+from src.application.usecase.book.count_book import CountBook
+from src.domain.entities.book import BookSearchFilter
+
+
+class TestCountBook(BookUseCaseConftest):
+
+    def setUp(self):
+        super().setUp()
+        self.count_book = CountBook(book_repository=self.mock_book_repository)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.mock_book_repository.count_books.reset_mock()
+
+    async def test_execute_returns_repository_count(self):
+        # Arrange
+        self.mock_book_repository.count_books.return_value = 42
+
+        # Act
+        result = await self.count_book.execute(BookFilter(editor="Editor"))
+
+        # Assert
+        self.mock_book_repository.count_books.assert_called_once_with(
+            BookSearchFilter(editor="Editor"),
+        )
+        self.assertEqual(result, 42)
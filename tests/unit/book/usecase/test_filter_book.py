@@ -1,7 +1,8 @@
 from tests.unit.book.usecase.conftest import BookUseCaseConftest
 
+from src.application.dto.book_dto import BookFilter, BookSearchQuery
 from src.application.usecase.book.filter_book import FilterBook
-from src.domain.entities.book import BookSearchFilter
+from src.domain.entities.book import BookSearchFilter, BookSearchResult
 
 
 class TestFilterBook(BookUseCaseConftest):
@@ -18,7 +19,7 @@ class TestFilterBook(BookUseCaseConftest):
         super().tearDown()
         self.mock_book_repository.get_book_by_filter.reset_mock()
 
-    def test_execute_with_filter(self):
+    async def test_execute_with_filter(self):
         # Arrange
         book1 = self.book_model_factory.build(isbn_code="123456789")
         book2 = self.book_model_factory.build(isbn_code="987654321")
@@ -27,18 +28,20 @@ class TestFilterBook(BookUseCaseConftest):
         filter_criteria = self.book_filter_model_factory.build()
 
         # Mock repository response
-        self.mock_book_repository.get_book_by_filter.return_value = expected_books
+        self.mock_book_repository.get_book_by_filter.return_value = BookSearchResult(
+            books=expected_books,
+        )
 
         # Act
-        result = self.filter_book.execute(filter_criteria)
+        result = await self.filter_book.execute(filter_criteria)
 
         # Assert
         self.mock_book_repository.get_book_by_filter.assert_called_once_with(
             filter_criteria,
         )
-        self.assertEqual(result, expected_books)
+        self.assertEqual(result.books, expected_books)
 
-    def test_execute_with_empty_filter(self):
+    async def test_execute_with_empty_filter(self):
         # Arrange
         book1 = self.book_model_factory.build()
         book2 = self.book_model_factory.build()
@@ -48,27 +51,31 @@ class TestFilterBook(BookUseCaseConftest):
         empty_filter = BookSearchFilter()
 
         # Mock repository response
-        self.mock_book_repository.get_book_by_filter.return_value = all_books
+        self.mock_book_repository.get_book_by_filter.return_value = BookSearchResult(
+            books=all_books,
+        )
 
         # Act
-        result = self.filter_book.execute(empty_filter)
+        result = await self.filter_book.execute(empty_filter)
 
         # Assert
         self.mock_book_repository.get_book_by_filter.assert_called_once_with(
             empty_filter,
         )
-        self.assertEqual(result, all_books)
+        self.assertEqual(result.books, all_books)
 
-    def test_execute_with_none_filter(self):
+    async def test_execute_with_none_filter(self):
         # Arrange
         book1 = self.book_model_factory.build()
         all_books = [book1]
 
         # Mock repository response
-        self.mock_book_repository.get_book_by_filter.return_value = all_books
+        self.mock_book_repository.get_book_by_filter.return_value = BookSearchResult(
+            books=all_books,
+        )
 
         # Act
-        result = self.filter_book.execute(None)
+        result = await self.filter_book.execute(None)
 
         # Assert
         self.mock_book_repository.get_book_by_filter.assert_called_once_with(
@@ -79,20 +86,32 @@ class TestFilterBook(BookUseCaseConftest):
                 sort_order="desc",
             ),
         )
-        self.assertEqual(result, all_books)
+        self.assertEqual(result.books, all_books)
 
-    def test_execute_no_results(self):
+    async def test_execute_no_results(self):
         # Arrange
         filter_criteria = BookSearchFilter(isbn_code="nonexistent")
 
         # Mock repository response - no books found
-        self.mock_book_repository.get_book_by_filter.return_value = []
+        self.mock_book_repository.get_book_by_filter.return_value = BookSearchResult()
 
         # Act
-        result = self.filter_book.execute(filter_criteria)
+        result = await self.filter_book.execute(filter_criteria)
 
         # Assert
         self.mock_book_repository.get_book_by_filter.assert_called_once_with(
             filter_criteria,
         )
-        self.assertEqual(result, [])
+        self.assertEqual(result.books, [])
+
+    async def test_execute_computes_facets_for_search_queries_only(self):
+        # Arrange
+        self.mock_book_repository.get_book_by_filter.return_value = BookSearchResult()
+
+        # Act
+        await self.filter_book.execute(BookFilter.model_validate({"facets": True}))
+        await self.filter_book.execute(BookSearchQuery(facets=True))
+
+        # Assert
+        calls = self.mock_book_repository.get_book_by_filter.call_args_list
+        self.assertEqual([call.args[0].facets for call in calls], [False, True])
@@ -12,40 +12,58 @@ class TestGetBookById(BookUseCaseConftest):
         self.get_book_by_id = GetBookById(
             book_repository=self.mock_book_repository,
         )
-        self.mock_book_repository.get_book_by_id.return_value = None
-        self.mock_book_repository.get_book_by_id.side_effect = None
+        self.mock_book_repository.get_book_by_id_async.return_value = None
+        self.mock_book_repository.get_book_by_id_async.side_effect = None
 
     def tearDown(self) -> None:
         super().tearDown()
-        self.mock_book_repository.get_book_by_id.reset_mock()
+        self.mock_book_repository.get_book_by_id_async.reset_mock()
 
-    def test_execute_existing_book(self):
+    async def test_execute_existing_book(self):
         # Arrange
         book = self.book_model_factory.build()
 
         # Mock repository response
-        self.mock_book_repository.get_book_by_id.return_value = book
+        self.mock_book_repository.get_book_by_id_async.return_value = book
 
         # Act
-        result = self.get_book_by_id.execute(book.id)
+        result = await self.get_book_by_id.execute(book.id)
 
         # Assert
-        self.mock_book_repository.get_book_by_id.assert_called_once_with(book.id)
+        self.mock_book_repository.get_book_by_id_async.assert_called_once_with(
+            book.id,
+            None,
+        )
         self.assertEqual(result, book)
 
-    def test_execute_non_existent_book(self):
+    async def test_execute_non_existent_book(self):
         # Arrange
         non_existent_id = uuid7()
 
         # Mock repository response - book not found
-        self.mock_book_repository.get_book_by_id.side_effect = NotFoundException(
+        self.mock_book_repository.get_book_by_id_async.side_effect = NotFoundException(
             "Book not found",
         )
 
         # Act & Assert
         with self.assertRaises(NotFoundException):
-            self.get_book_by_id.execute(non_existent_id)
+            await self.get_book_by_id.execute(non_existent_id)
 
-        self.mock_book_repository.get_book_by_id.assert_called_once_with(
+        self.mock_book_repository.get_book_by_id_async.assert_called_once_with(
             non_existent_id,
+            None,
+        )
+
+    async def test_execute_forwards_projected_fields(self):
+        # Arrange
+        book = self.book_model_factory.build()
+        self.mock_book_repository.get_book_by_id_async.return_value = book
+
+        # Act
+        await self.get_book_by_id.execute(book.id, ["id", "book_data.title"])
+
+        # Assert
+        self.mock_book_repository.get_book_by_id_async.assert_called_once_with(
+            book.id,
+            ["id", "book_data.title"],
         )
@@ -0,0 +1,33 @@
+from tests.unit.book.usecase.conftest import BookUseCaseConftest
+from uuid6 import uuid7
+
+from src.application.dto.book_dto import BookSuggestFilter
+from src.application.usecase.book.suggest_book import SuggestBook
+from src.domain.entities.book import BookSuggestion
+from src.domain.enums.suggestion_kind import SuggestionKind
+
+
+class TestSuggestBook(BookUseCaseConftest):
+
+    def setUp(self):
+        super().setUp()
+        self.suggest_book = SuggestBook(book_repository=self.mock_book_repository)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.mock_book_repository.suggest_books.reset_mock()
+
+    async def test_execute_returns_repository_suggestions(self):
+        # Arrange
+        suggestions = [
+            BookSuggestion(id=uuid7(), text="Dune", kind=SuggestionKind.TITLE),
+            BookSuggestion(id=uuid7(), text="Dan Brown", kind=SuggestionKind.AUTHOR),
+        ]
+        self.mock_book_repository.suggest_books.return_value = suggestions
+
+        # Act
+        result = await self.suggest_book.execute(BookSuggestFilter(prefix="d", size=3))
+
+        # Assert
+        self.mock_book_repository.suggest_books.assert_called_once_with("d", 3)
+        self.assertEqual(result, suggestions)
@@ -45,6 +45,20 @@ class TestGetBookCategoryByFilter(BookCategoryRepositoryConftest):
         # Assert - Should return only category1 that matches both criteria
         self.assertEqual(results, [self.category1])
 
+    async def test_filter_by_title_and_description_async(self):
+        # Act - Filter through the asyncpg engine
+        results = (
+            await self.book_category_read_repository.get_book_category_by_filter_async(
+                filter=BookCategoryFilter(
+                    title=self.category1.title,
+                    description=self.category1.description,
+                ),
+            )
+        )
+
+        # Assert - Same rows as the sync session
+        self.assertEqual(results, [self.category1])
+
     def test_no_filter_returns_all(self):
         # Arrange - Create and save multiple book categories
 
@@ -13,18 +13,18 @@ class TestFilterBookCategory(BookCategoryUseCaseConftest):
         self.filter_book_category = FilterBookCategory(
             repository=self.mock_book_category_repository,
         )
-        self.mock_book_category_repository.get_book_category_by_filter.return_value = (
+        self.mock_book_category_repository.get_book_category_by_filter_async.return_value = (
             None
         )
-        self.mock_book_category_repository.get_book_category_by_filter.side_effect = (
+        self.mock_book_category_repository.get_book_category_by_filter_async.side_effect = (
             None
         )
 
     def tearDown(self):
         super().tearDown()
-        self.mock_book_category_repository.get_book_category_by_filter.reset_mock()
+        self.mock_book_category_repository.get_book_category_by_filter_async.reset_mock()
 
-    def test_execute_with_filter(self):
+    async def test_execute_with_filter(self):
         # Arrange
         book_category1 = self.book_category_model_factory.build(title="Fiction")
         book_category2 = self.book_category_model_factory.build(title="Fantasy")
@@ -33,31 +33,33 @@ class TestFilterBookCategory(BookCategoryUseCaseConftest):
         filter_obj = BookCategoryFilter(title="Fiction")
 
         # Mock repository response
-        self.mock_book_category_repository.get_book_category_by_filter.return_value = (
+        self.mock_book_category_repository.get_book_category_by_filter_async.return_value = (
             book_categories
         )
 
         # Act
-        result = self.filter_book_category.execute(filter_obj)
+        result = await self.filter_book_category.execute(filter_obj)
 
         # Assert
-        self.mock_book_category_repository.get_book_category_by_filter.assert_called_once_with(
+        self.mock_book_category_repository.get_book_category_by_filter_async.assert_called_once_with(
             filter_obj,
         )
         self.assertEqual(result, book_categories)
 
-    def test_execute_empty_result(self):
+    async def test_execute_empty_result(self):
         # Arrange
         filter_obj = BookCategoryFilter(title="Non-existent Category")
 
         # Mock repository response - no categories found
-        self.mock_book_category_repository.get_book_category_by_filter.return_value = []
+        self.mock_book_category_repository.get_book_category_by_filter_async.return_value = (
+            []
+        )
 
         # Act
-        result = self.filter_book_category.execute(filter_obj)
+        result = await self.filter_book_category.execute(filter_obj)
 
         # Assert
-        self.mock_book_category_repository.get_book_category_by_filter.assert_called_once_with(
+        self.mock_book_category_repository.get_book_category_by_filter_async.assert_called_once_with(
             filter_obj,
         )
         self.assertEqual(result, [])
@@ -27,6 +27,22 @@ class TestGetBranchByFilter(BranchRepositoryConftest):
             [branch1, branch3].sort(key=lambda x: x.name),
         )
 
+    async def test_filter_by_name_found_async(self):
+        # Arrange
+        branch1 = self.branch_model_factory.build(name="Main Branch")
+        branch2 = self.branch_model_factory.build(name="Secondary Branch")
+
+        self.branch_write_repository.upsert_branch(branch=branch1)
+        self.branch_write_repository.upsert_branch(branch=branch2)
+
+        # Act - Filter through the asyncpg engine
+        results = await self.branch_read_repository.get_branch_by_filter_async(
+            filter=BranchFilter(name="Main"),
+        )
+
+        # Assert
+        self.assertEqual(results, [branch1])
+
     def test_filter_by_name_not_found(self):
         # Arrange - Create and save branches with different names
         branch1 = self.branch_model_factory.build(name="Main Branch")
@@ -61,3 +77,39 @@ class TestGetBranchByFilter(BranchRepositoryConftest):
             results.sort(key=lambda x: x.name),
             [branch1, branch2].sort(key=lambda x: x.name),
         )
+
+    def test_keyset_walk_returns_every_branch_once(self):
+        # Arrange
+        branches = [self.branch_model_factory.build() for _ in range(3)]
+        for branch in branches:
+            self.branch_write_repository.upsert_branch(branch=branch)
+
+        # Act - Walk two branches at a time, resuming after the last id
+        first_page = self.branch_read_repository.get_branch_by_filter(
+            filter=BranchFilter(limit=2),
+        )
+        second_page = self.branch_read_repository.get_branch_by_filter(
+            filter=BranchFilter(limit=2, cursor=first_page[-1].id),
+        )
+
+        # Assert - Pages follow the id order and do not overlap
+        self.assertEqual(len(first_page), 2)
+        self.assertEqual(
+            [branch.id for branch in first_page + second_page],
+            sorted(branch.id for branch in branches),
+        )
+
+    def test_filter_by_name_ranks_by_similarity(self):
+        # Arrange
+        branch1 = self.branch_model_factory.build(name="Main Street Annex Library")
+        branch2 = self.branch_model_factory.build(name="Main")
+        self.branch_write_repository.upsert_branch(branch=branch1)
+        self.branch_write_repository.upsert_branch(branch=branch2)
+
+        # Act
+        results = self.branch_read_repository.get_branch_by_filter(
+            filter=BranchFilter(name="Main"),
+        )
+
+        # Assert - Every substring match, the closest one first
+        self.assertEqual(results, [branch2, branch1])
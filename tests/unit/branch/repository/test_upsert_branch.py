@@ -1,6 +1,7 @@
 from tests.unit.branch.repository.conftest import BranchRepositoryConftest
 
 from src.application.exceptions import OptimisticLockException
+from src.infrastructure.adapters.database.db.query_counter import count_queries
 
 
 class TestUpsertBranch(BranchRepositoryConftest):
@@ -40,3 +41,32 @@ class TestUpsertBranch(BranchRepositoryConftest):
         # Assert - Should raise OptimisticLockException
         with self.assertRaises(OptimisticLockException):
             self.branch_write_repository.upsert_branch(branch=branch)
+
+    def test_new_branch_gets_a_partition(self):
+        # Arrange
+        branch = self.branch_model_factory.build()
+
+        # Act
+        self.branch_write_repository.upsert_branch(branch=branch)
+
+        # Assert
+        self.assertTrue(
+            self.branch_write_repository.partitions.has_partition(branch.id)
+        )
+        with self.db.get_session() as session:
+            self.branch_write_repository.partitions.load(session)
+        self.assertIn(branch.id, self.branch_write_repository.partitions.partitions())
+
+    def test_rename_runs_no_partition_ddl(self):
+        # Arrange
+        branch = self.branch_model_factory.build()
+        self.branch_write_repository.upsert_branch(branch=branch)
+        branch.name = "Renamed Branch"
+        branch.version = branch.version + 1
+
+        # Act
+        with count_queries() as counter:
+            self.branch_write_repository.upsert_branch(branch=branch)
+
+        # Assert - Only the upsert itself
+        self.assertEqual(counter.count, 1)
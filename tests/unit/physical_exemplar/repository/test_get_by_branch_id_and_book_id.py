@@ -4,6 +4,7 @@ from tests.unit.physical_exemplar.repository.conftest import (
 from uuid6 import uuid7
 
 from src.application.exceptions import NotFoundException
+from src.infrastructure.adapters.database.db.query_counter import count_queries
 
 
 class TestGetByBranchIdAndBookId(PhysicalExemplarRepositoryConftest):
@@ -70,6 +71,32 @@ class TestGetByBranchIdAndBookId(PhysicalExemplarRepositoryConftest):
         # Assert
         self.assertEqual(physical_exemplar.id, self.physical_exemplar1_branch1.id)
 
+    async def test_get_by_branch_id_and_book_id_async(self):
+        # Act
+        with count_queries() as counter:
+            physical_exemplar = await self.physical_exemplar_read_repository.get_physical_exemplar_by_book_and_branch_async(
+                branch_id=self.branch1.id,
+                book_id=self.book1.id,
+            )
+
+        # Assert - The asyncpg engine loads the same relationships eagerly
+        self.assertEqual(counter.count, 4)
+        self.assertEqual(physical_exemplar.id, self.physical_exemplar1_branch1.id)
+        self.assertEqual(physical_exemplar.book.authors, [self.author1])  # type: ignore
+
+    def test_get_by_branch_id_and_book_id_loads_relationships_eagerly(self):
+        # Act
+        with count_queries() as counter:
+            physical_exemplar = self.physical_exemplar_read_repository.get_physical_exemplar_by_book_and_branch(
+                branch_id=self.branch1.id,
+                book_id=self.book1.id,
+            )
+
+        # Assert - One joined row, then one query per book collection
+        self.assertEqual(counter.count, 4)
+        self.assertEqual(physical_exemplar.branch.id, self.branch1.id)  # type: ignore
+        self.assertEqual(physical_exemplar.book.authors, [self.author1])  # type: ignore
+
     def test_get_by_branch_id_and_book_id_not_found(self):
         # Arrange
         with self.assertRaises(NotFoundException):
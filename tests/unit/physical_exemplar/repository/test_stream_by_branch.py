@@ -0,0 +1,119 @@
+from tests.unit.physical_exemplar.repository.conftest import (
+    PhysicalExemplarRepositoryConftest,
+)
+
+from src.domain.entities.physical_exemplar import PhysicalExemplarBranchFilter
+from src.infrastructure.adapters.database.db.query_counter import count_queries
+
+
+class TestStreamByBranch(PhysicalExemplarRepositoryConftest):
+
+    def setUp(self):
+        super().setUp()
+
+        self.branch1 = self.branch_model_factory.build()
+        self.branch2 = self.branch_model_factory.build()
+        self.branch_write_repository.upsert_branch(branch=self.branch1)
+        self.branch_write_repository.upsert_branch(branch=self.branch2)
+
+        self.author1 = self.author_model_factory.build()
+        self.book_category1 = self.book_category_model_factory.build()
+        self.author_write_repository.upsert_author(author=self.author1)
+        self.book_category_write_repository.upsert_book_category(
+            book_category=self.book_category1,
+        )
+
+        # A branch holds one exemplar of a book
+        self.books = [
+            self.book_model_factory.build(
+                authors=[self.author1],
+                book_categories=[self.book_category1],
+                book_data=[self.book_data_model_factory.build()],
+            )
+            for _ in range(3)
+        ]
+        for book in self.books:
+            self.book_write_repository.upsert_book(book=book)
+
+        # Three exemplars in branch1, one of them lent, and one in branch2
+        self.branch1_exemplars = [
+            self.physical_exemplar_model_factory.build(
+                book_id=book.id,
+                branch_id=self.branch1.id,
+                available=available,
+                room=1,
+                floor=floor,
+                bookshelf=1,
+            )
+            for book, (available, floor) in zip(
+                self.books,
+                ((True, 1), (False, 1), (True, 2)),
+            )
+        ]
+        self.branch2_exemplar = self.physical_exemplar_model_factory.build(
+            book_id=self.books[0].id,
+            branch_id=self.branch2.id,
+            available=True,
+            room=1,
+            floor=1,
+            bookshelf=1,
+        )
+        for physical_exemplar in [*self.branch1_exemplars, self.branch2_exemplar]:
+            self.physical_exemplar_write_repository.upsert_physical_exemplar(
+                physical_exemplar=physical_exemplar,
+            )
+
+    async def _stream(self, **filter):
+        return [
+            physical_exemplar
+            async for physical_exemplar in self.physical_exemplar_read_repository.stream_physical_exemplars_by_branch_async(
+                filter=PhysicalExemplarBranchFilter(**filter),
+            )
+        ]
+
+    async def test_stream_lists_the_branch_in_id_order(self):
+        # Act
+        with count_queries() as counter:
+            physical_exemplars = await self._stream(branch_id=self.branch1.id)
+
+        # Assert - One cursor, no relationship loads
+        self.assertEqual(counter.count, 1)
+        self.assertEqual(
+            [physical_exemplar.id for physical_exemplar in physical_exemplars],
+            sorted(
+                physical_exemplar.id for physical_exemplar in self.branch1_exemplars
+            ),
+        )
+        self.assertIsNone(physical_exemplars[0].book)
+
+    async def test_stream_filters(self):
+        # Act
+        physical_exemplars = await self._stream(
+            branch_id=self.branch1.id,
+            available=True,
+            floor=1,
+        )
+
+        # Assert
+        self.assertEqual(
+            [physical_exemplar.id for physical_exemplar in physical_exemplars],
+            [self.branch1_exemplars[0].id],
+        )
+
+    async def test_stream_resumes_after_the_cursor(self):
+        # Arrange
+        ids = sorted(
+            physical_exemplar.id for physical_exemplar in self.branch1_exemplars
+        )
+
+        # Act
+        first_page = await self._stream(branch_id=self.branch1.id, limit=2)
+        second_page = await self._stream(
+            branch_id=self.branch1.id,
+            limit=2,
+            cursor=first_page[-1].id,
+        )
+
+        # Assert
+        self.assertEqual([row.id for row in first_page], ids[:2])
+        self.assertEqual([row.id for row in second_page], ids[2:])
@@ -154,3 +154,77 @@ class TestUpsertPhysicalExemplar(PhysicalExemplarRepositoryConftest):
             self.physical_exemplar_write_repository.upsert_physical_exemplar(
                 physical_exemplar=updated_physical_exemplar,
             )
+
+    def test_second_physical_exemplar_of_a_book_in_a_branch(self):
+        # Arrange
+        physical_exemplar = self.physical_exemplar_model_factory.build(
+            book_id=self.book1.id,
+            branch_id=self.branch1.id,
+            version=1,
+        )
+        other_physical_exemplar = self.physical_exemplar_model_factory.build(
+            book_id=self.book1.id,
+            branch_id=self.branch1.id,
+            version=1,
+        )
+        self.physical_exemplar_write_repository.upsert_physical_exemplar(
+            physical_exemplar=physical_exemplar,
+        )
+
+        # Act & Assert - The branch keeps its single exemplar of the book
+        with self.assertRaises(OptimisticLockException):
+            self.physical_exemplar_write_repository.upsert_physical_exemplar(
+                physical_exemplar=other_physical_exemplar,
+            )
+        self.assertEqual(
+            self.physical_exemplar_read_repository.get_physical_exemplar_by_book_and_branch(
+                book_id=self.book1.id,
+                branch_id=self.branch1.id,
+            ).id,
+            physical_exemplar.id,
+        )
+
+    async def test_upsert_keeps_the_availability_summary(self):
+        # Arrange
+        lent = self.physical_exemplar_model_factory.build(
+            book_id=self.book1.id,
+            branch_id=self.branch1.id,
+            available=True,
+        )
+        shelved = self.physical_exemplar_model_factory.build(
+            book_id=self.book1.id,
+            branch_id=self.branch2.id,
+            available=True,
+        )
+        self.physical_exemplar_write_repository.upsert_physical_exemplar(
+            physical_exemplar=lent,
+        )
+        self.physical_exemplar_write_repository.upsert_physical_exemplar(
+            physical_exemplar=shelved,
+        )
+        lent = lent.model_copy(
+            update={"available": False, "version": lent.version + 1},
+        )
+
+        # Act
+        self.physical_exemplar_write_repository.upsert_physical_exemplar(
+            physical_exemplar=lent,
+        )
+        book1, book2 = (
+            await self.physical_exemplar_read_repository.get_books_availability_async(
+                book_ids=[self.book1.id, self.book2.id],
+            )
+        )
+
+        # Assert
+        self.assertEqual((book1.available, book1.total), (1, 2))
+        self.assertEqual(
+            {
+                branch.branch_id: (branch.available, branch.total)
+                for branch in book1.branches
+            },
+            {self.branch1.id: (0, 1), self.branch2.id: (1, 1)},
+        )
+        self.assertEqual(
+            (book2.book_id, book2.total, book2.branches), (self.book2.id, 0, [])
+        )
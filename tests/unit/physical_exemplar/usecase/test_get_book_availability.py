@@ -0,0 +1,70 @@
+from uuid import UUID
+
+from tests.unit.physical_exemplar.usecase.conftest import (
+    PhysicalExemplarUseCaseConftest,
+)
+from uuid6 import uuid7
+
+from src.application.usecase.physical_exemplar.get_book_availability import (
+    GetBookAvailability,
+)
+from src.domain.entities.book_availability import (
+    BookAvailability,
+    BranchAvailability,
+)
+
+
+class TestGetBookAvailability(PhysicalExemplarUseCaseConftest):
+
+    def setUp(self):
+        super().setUp()
+        self.get_book_availability = GetBookAvailability(
+            repository=self.mock_physical_exemplar_repository,
+        )
+        self.mock_physical_exemplar_repository.get_books_availability_async.return_value = (
+            None
+        )
+        self.mock_physical_exemplar_repository.get_books_availability_async.side_effect = (
+            None
+        )
+
+    def tearDown(self):
+        super().tearDown()
+        self.mock_physical_exemplar_repository.get_books_availability_async.reset_mock()
+
+    async def test_execute_successful_get(self):
+        # Arrange
+        book_id: UUID = uuid7()
+        branch_id: UUID = uuid7()
+        availability = BookAvailability(
+            book_id=book_id,
+            available=1,
+            total=2,
+            branches=[BranchAvailability(branch_id=branch_id, available=1, total=2)],
+        )
+        self.mock_physical_exemplar_repository.get_books_availability_async.return_value = [
+            availability,
+        ]
+
+        # Act
+        result = await self.get_book_availability.execute(book_id=book_id)
+
+        # Assert
+        self.mock_physical_exemplar_repository.get_books_availability_async.assert_called_once_with(
+            book_ids=[book_id],
+        )
+        self.assertEqual(result, availability)
+
+    async def test_execute_book_without_exemplars(self):
+        # Arrange
+        book_id: UUID = uuid7()
+        self.mock_physical_exemplar_repository.get_books_availability_async.return_value = [
+            BookAvailability(book_id=book_id),
+        ]
+
+        # Act
+        result = await self.get_book_availability.execute(book_id=book_id)
+
+        # Assert
+        self.assertEqual(result.total, 0)
+        self.assertEqual(result.branches, [])
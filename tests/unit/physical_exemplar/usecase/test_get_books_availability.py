@@ -0,0 +1,72 @@
+from tests.unit.physical_exemplar.usecase.conftest import (
+    PhysicalExemplarUseCaseConftest,
+)
+from uuid6 import uuid7
+
+from src.application.exceptions import InvalidDataException
+from src.application.usecase.physical_exemplar.get_books_availability import (
+    GetBooksAvailability,
+)
+from src.domain.entities.book_availability import (
+    MAX_AVAILABILITY_BOOKS,
+    BookAvailability,
+)
+
+
+class TestGetBooksAvailability(PhysicalExemplarUseCaseConftest):
+
+    def setUp(self):
+        super().setUp()
+        self.get_books_availability = GetBooksAvailability(
+            repository=self.mock_physical_exemplar_repository,
+        )
+        self.mock_physical_exemplar_repository.get_books_availability_async.return_value = (
+            None
+        )
+        self.mock_physical_exemplar_repository.get_books_availability_async.side_effect = (
+            None
+        )
+
+    def tearDown(self):
+        super().tearDown()
+        self.mock_physical_exemplar_repository.get_books_availability_async.reset_mock()
+
+    async def test_execute_asks_once_per_book(self):
+        # Arrange
+        first_id = uuid7()
+        second_id = uuid7()
+        availability = [
+            BookAvailability(book_id=first_id),
+            BookAvailability(book_id=second_id),
+        ]
+        self.mock_physical_exemplar_repository.get_books_availability_async.return_value = (
+            availability
+        )
+
+        # Act
+        result = await self.get_books_availability.execute(
+            book_ids=[first_id, second_id, first_id],
+        )
+
+        # Assert
+        self.mock_physical_exemplar_repository.get_books_availability_async.assert_called_once_with(
+            book_ids=[first_id, second_id],
+        )
+        self.assertEqual(result, availability)
+
+    async def test_execute_empty_request(self):
+        # Act
+        result = await self.get_books_availability.execute(book_ids=[])
+
+        # Assert
+        self.assertEqual(result, [])
+        self.mock_physical_exemplar_repository.get_books_availability_async.assert_not_called()
+
+    async def test_execute_too_many_books(self):
+        # Arrange
+        book_ids = [uuid7() for _ in range(MAX_AVAILABILITY_BOOKS + 1)]
+
+        # Act & Assert
+        with self.assertRaises(InvalidDataException):
+            await self.get_books_availability.execute(book_ids=book_ids)
+        self.mock_physical_exemplar_repository.get_books_availability_async.assert_not_called()
@@ -20,18 +20,18 @@ class TestGetPhysicalExemplarByBookAndBranch(PhysicalExemplarUseCaseConftest):
                 repository=self.mock_physical_exemplar_repository,
             )
         )
-        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch.return_value = (
+        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch_async.return_value = (
             None
         )
-        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch.side_effect = (
+        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch_async.side_effect = (
             None
         )
 
     def tearDown(self):
         super().tearDown()
-        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch.reset_mock()
+        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch_async.reset_mock()
 
-    def test_execute_successful_get(self):
+    async def test_execute_successful_get(self):
         # Arrange
         book_id: UUID = uuid7()
         branch_id: UUID = uuid7()
@@ -41,42 +41,42 @@ class TestGetPhysicalExemplarByBookAndBranch(PhysicalExemplarUseCaseConftest):
         )
 
         # Mock repository response
-        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch.return_value = (
+        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch_async.return_value = (
             physical_exemplar
         )
 
         # Act
-        result = self.get_physical_exemplar_by_book_and_branch.execute(
+        result = await self.get_physical_exemplar_by_book_and_branch.execute(
             book_id=book_id,
             branch_id=branch_id,
         )
 
         # Assert
-        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch.assert_called_once_with(
+        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch_async.assert_called_once_with(
             book_id=book_id,
             branch_id=branch_id,
         )
         self.assertEqual(result, physical_exemplar)
 
-    def test_execute_physical_exemplar_not_found(self):
+    async def test_execute_physical_exemplar_not_found(self):
         # Arrange
         book_id: UUID = uuid7()
         branch_id: UUID = uuid7()
 
         # Mock repository response - physical exemplar not found
-        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch.side_effect = NotFoundException(
+        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch_async.side_effect = NotFoundException(
             "Physical exemplar not found",
         )
 
         # Act & Assert
         with self.assertRaises(NotFoundException) as context:
-            self.get_physical_exemplar_by_book_and_branch.execute(
+            await self.get_physical_exemplar_by_book_and_branch.execute(
                 book_id=book_id,
                 branch_id=branch_id,
             )
 
         self.assertEqual(str(context.exception), "Physical exemplar not found")
-        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch.assert_called_once_with(
+        self.mock_physical_exemplar_repository.get_physical_exemplar_by_book_and_branch_async.assert_called_once_with(
             book_id=book_id,
             branch_id=branch_id,
         )
@@ -0,0 +1,51 @@
+from tests.unit.physical_exemplar.usecase.conftest import (
+    PhysicalExemplarUseCaseConftest,
+)
+from uuid6 import uuid7
+
+from src.application.usecase.physical_exemplar.stream_physical_exemplars_by_branch import (
+    StreamPhysicalExemplarsByBranch,
+)
+from src.domain.entities.physical_exemplar import PhysicalExemplarBranchFilter
+
+
+class TestStreamPhysicalExemplarsByBranch(PhysicalExemplarUseCaseConftest):
+
+    def setUp(self):
+        super().setUp()
+        self.stream_physical_exemplars_by_branch = StreamPhysicalExemplarsByBranch(
+            repository=self.mock_physical_exemplar_repository,
+        )
+        self.mock_physical_exemplar_repository.stream_physical_exemplars_by_branch_async.return_value = (
+            None
+        )
+
+    def tearDown(self):
+        super().tearDown()
+        self.mock_physical_exemplar_repository.stream_physical_exemplars_by_branch_async.reset_mock()
+
+    async def test_execute_streams_the_repository_rows(self):
+        # Arrange
+        branch_id = uuid7()
+        physical_exemplars = [
+            self.physical_exemplar_model_factory.build(branch_id=branch_id)
+            for _ in range(3)
+        ]
+
+        async def stream():
+            for physical_exemplar in physical_exemplars:
+                yield physical_exemplar
+
+        self.mock_physical_exemplar_repository.stream_physical_exemplars_by_branch_async.return_value = (
+            stream()
+        )
+        filter = PhysicalExemplarBranchFilter(branch_id=branch_id, available=True)
+
+        # Act
+        result = await self.stream_physical_exemplars_by_branch.execute(filter)
+
+        # Assert
+        self.assertEqual([row async for row in result], physical_exemplars)
+        self.mock_physical_exemplar_repository.stream_physical_exemplars_by_branch_async.assert_called_once_with(
+            filter=filter,
+        )